@@ -0,0 +1,185 @@
+# SPDX-FileCopyrightText: © 2025 National Oceanography Centre and University of Plymouth
+
+# SPDX-License-Identifier: MIT
+
+import os
+import asyncio
+import atexit
+import threading
+import aiohttp
+import metrics
+
+API_POOL_LIMIT = 20
+API_POOL_LIMIT_PER_HOST = 10
+API_KEEPALIVE_TIMEOUT = 30
+API_TOTAL_TIMEOUT = 60
+API_CONNECT_TIMEOUT = 10
+API_DNS_CACHE_TTL = 300
+
+client_state = {"pid": None, "loop": None, "thread": None, "session": None}
+client_lock = threading.Lock()
+
+
+def get_client_setting(setting_name, default_value):
+    """Get HTTP client setting from environment variables
+
+    Args:
+        setting_name (string): Environment variable's name e.g. API_POOL_LIMIT
+        default_value (number): Value used when environment variable is not set
+
+    Returns:
+        number: Setting's value
+    """
+
+    return type(default_value)(os.environ.get(setting_name, default_value))
+
+
+async def on_request_start(session, trace_config_ctx, params):
+    metrics.increment("http_requests")
+
+
+async def on_connection_create_end(session, trace_config_ctx, params):
+    metrics.increment("http_connections_created")
+
+
+async def on_connection_reuseconn(session, trace_config_ctx, params):
+    metrics.increment("http_connections_reused")
+
+
+def create_trace_config():
+    """Create trace config to collect connection pool statistics
+
+    Returns:
+        TraceConfig: Trace config counting requests, new connections and reused connections
+    """
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+    return trace_config
+
+
+def create_session():
+    """Create HTTP session with a bounded keep-alive connection pool
+
+    Returns:
+        ClientSession: HTTP session
+    """
+
+    connector = aiohttp.TCPConnector(
+        limit=get_client_setting("API_POOL_LIMIT", API_POOL_LIMIT),
+        limit_per_host=get_client_setting(
+            "API_POOL_LIMIT_PER_HOST", API_POOL_LIMIT_PER_HOST
+        ),
+        keepalive_timeout=get_client_setting(
+            "API_KEEPALIVE_TIMEOUT", API_KEEPALIVE_TIMEOUT
+        ),
+        ttl_dns_cache=get_client_setting("API_DNS_CACHE_TTL", API_DNS_CACHE_TTL),
+    )
+    timeout = aiohttp.ClientTimeout(
+        total=get_client_setting("API_TOTAL_TIMEOUT", API_TOTAL_TIMEOUT),
+        connect=get_client_setting("API_CONNECT_TIMEOUT", API_CONNECT_TIMEOUT),
+    )
+    return aiohttp.ClientSession(
+        connector=connector, timeout=timeout, trace_configs=[create_trace_config()]
+    )
+
+
+def get_event_loop():
+    """Get event loop of HTTP client. The loop runs on a daemon thread and it is created once per process.
+
+    Returns:
+        AbstractEventLoop: HTTP client's event loop
+    """
+
+    with client_lock:
+        if client_state["pid"] != os.getpid():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="splash-api-client", daemon=True
+            )
+            thread.start()
+            client_state.update(
+                pid=os.getpid(), loop=loop, thread=thread, session=None
+            )
+        return client_state["loop"]
+
+
+async def get_session():
+    """Get HTTP session of current process. It must be awaited on HTTP client's event loop.
+
+    Returns:
+        ClientSession: HTTP session
+    """
+
+    if client_state["session"] is None or client_state["session"].closed:
+        client_state["session"] = create_session()
+    return client_state["session"]
+
+
+def run(coroutine):
+    """Run coroutine on HTTP client's event loop and wait for its result
+
+    Args:
+        coroutine (coroutine): Coroutine to run e.g. fetch_data(api_url)
+
+    Returns:
+        object: Coroutine's result
+    """
+
+    return asyncio.run_coroutine_threadsafe(coroutine, get_event_loop()).result()
+
+
+def submit(coroutine):
+    """Schedule coroutine on HTTP client's event loop without waiting for its result
+
+    Args:
+        coroutine (coroutine): Coroutine to run
+
+    Returns:
+        Future: Coroutine's future, which can be cancelled
+    """
+
+    return asyncio.run_coroutine_threadsafe(coroutine, get_event_loop())
+
+
+def get_pool_stats():
+    """Get connection pool statistics of all processes
+
+    Returns:
+        dict: Number of requests, created connections, reused connections and reuse rate
+    """
+
+    all_metrics = metrics.get_metrics()
+    requests = all_metrics.get("http_requests", 0)
+    connections_reused = all_metrics.get("http_connections_reused", 0)
+    return {
+        "http_requests": requests,
+        "http_connections_created": all_metrics.get("http_connections_created", 0),
+        "http_connections_reused": connections_reused,
+        "http_connection_reuse_rate": (
+            connections_reused / requests if requests else 0.0
+        ),
+    }
+
+
+async def close_session():
+    if client_state["session"] is not None and not client_state["session"].closed:
+        await client_state["session"].close()
+
+
+@atexit.register
+def close():
+    """Close HTTP session and stop event loop of current process"""
+
+    if client_state["pid"] != os.getpid():
+        return
+
+    loop = client_state["loop"]
+    try:
+        asyncio.run_coroutine_threadsafe(close_session(), loop).result(timeout=5)
+    except Exception:
+        pass
+    loop.call_soon_threadsafe(loop.stop)
+    client_state.update(pid=None, loop=None, thread=None, session=None)
@@ -0,0 +1,141 @@
+// SPDX-FileCopyrightText: © 2025 National Oceanography Centre and University of Plymouth
+
+// SPDX-License-Identifier: MIT
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    splash: {
+        /**
+         * Get id of browser session, creating it on first page load
+         *
+         * @param {number} modifiedTimestamp Session id store's last modification time
+         * @param {string} sessionId Stored session id
+         * @returns {string} Session id, or no_update when it already exists
+         */
+        get_session_id: function (modifiedTimestamp, sessionId) {
+            if (sessionId) {
+                return dash_clientside.no_update;
+            }
+            // crypto.randomUUID is only available on HTTPS pages and localhost
+            return window.crypto && crypto.randomUUID
+                ? crypto.randomUUID()
+                : Date.now().toString(36) + Math.random().toString(36).slice(2);
+        },
+        /**
+         * Update a variable slider when its increase, decrease or reset buttons are clicked or location changes
+         *
+         * @param {number} sliderValue Slider's value
+         * @param {number} nClicksInc Number of clicks of slider's increase button
+         * @param {number} nClicksDec Number of clicks of slider's decrease button
+         * @param {number} nClicksReset Number of clicks of reset button of all sliders
+         * @param {number} nClicksWadReset Number of clicks of reset button of wave variables sliders
+         * @param {number} nClicksMwdReset Number of clicks of reset button of mean wave direction slider
+         * @param {number} nClicksAadReset Number of clicks of reset button of wind speed slider
+         * @param {number} nClicksWdReset Number of clicks of reset button of wind direction slider
+         * @param {string} siteLocation Dropdown box's value
+         * @param {number} step Slider's step
+         * @param {Object} sliderId Slider's pattern-matching id
+         * @param {Object} sliderSettings Default value and reset button of each slider
+         * @returns {number} Adjusted slider's value
+         */
+        update_slider: function (
+            sliderValue,
+            nClicksInc,
+            nClicksDec,
+            nClicksReset,
+            nClicksWadReset,
+            nClicksMwdReset,
+            nClicksAadReset,
+            nClicksWdReset,
+            siteLocation,
+            step,
+            sliderId,
+            sliderSettings
+        ) {
+            const settings = sliderSettings[sliderId.index];
+            const nClicksGroupReset = {
+                "wad-reset-button": nClicksWadReset,
+                "mwd-reset-button": nClicksMwdReset,
+                "aad-reset-button": nClicksAadReset,
+                "wd-reset-button": nClicksWdReset,
+            }[settings.reset_button];
+
+            if (
+                nClicksInc === 0 ||
+                nClicksDec === 0 ||
+                nClicksReset === 0 ||
+                nClicksGroupReset === 0
+            ) {
+                return settings.default_value;
+            }
+
+            const triggeredId = dash_clientside.callback_context.triggered_id;
+            const triggeredType = triggeredId && triggeredId.type;
+
+            if (triggeredType === "slider-increase-btn") {
+                return sliderValue + step;
+            } else if (triggeredType === "slider-decrease-btn") {
+                return sliderValue - step;
+            } else if (
+                triggeredId === "reset-button" ||
+                triggeredId === settings.reset_button ||
+                triggeredId === "dd_site_location"
+            ) {
+                return settings.default_value;
+            }
+            return sliderValue;
+        },
+        /**
+         * Update range slider bounds of a sweep variable. Directions are swept in degrees, other variables in percentages.
+         *
+         * @param {string} variable Slider id of swept variable
+         * @param {Array} value Current range
+         * @returns {Array} Range slider's min, max and value
+         */
+        update_sweep_range: function (variable, value) {
+            const limit = variable && variable.endsWith("direction") ? 180 : 100;
+            const range = value || [-50, 50];
+            return [
+                -limit,
+                limit,
+                [Math.max(range[0], -limit), Math.min(range[1], limit)],
+            ];
+        },
+        /**
+         * Measure time from picking a location or submitting variables until first chart and all charts are rendered
+         *
+         * @returns {Object} Seconds until first chart and all charts were rendered, or no_update while charts are loading
+         */
+        measure_render_timings: function () {
+            const triggeredIds = dash_clientside.callback_context.triggered.map(
+                (triggered) => triggered.prop_id.split(".")[0]
+            );
+            const state = (window.splashRenderTimings = window.splashRenderTimings || {});
+
+            if (
+                state.startedAt === undefined ||
+                triggeredIds.includes("submit-button") ||
+                triggeredIds.includes("dd_site_location")
+            ) {
+                state.startedAt = performance.now();
+                state.firstChartAt = undefined;
+                state.renderedCharts = new Set();
+                return dash_clientside.no_update;
+            }
+
+            triggeredIds.forEach((triggeredId) => state.renderedCharts.add(triggeredId));
+            if (state.firstChartAt === undefined) {
+                state.firstChartAt = performance.now();
+            }
+            if (state.renderedCharts.size < 5) {
+                return dash_clientside.no_update;
+            }
+
+            const timings = {
+                time_to_first_chart: (state.firstChartAt - state.startedAt) / 1000,
+                time_to_complete: (performance.now() - state.startedAt) / 1000,
+            };
+            state.renderedCharts = new Set();
+            return timings;
+        },
+    },
+});
@@ -0,0 +1,132 @@
+# SPDX-FileCopyrightText: © 2025 National Oceanography Centre and University of Plymouth
+
+# SPDX-License-Identifier: MIT
+
+# Compare decoding of backend API responses into time series with the previous dataframe path:
+# python benchmarks/decode_benchmark.py
+
+import os
+import sys
+import json
+import pickle
+import random
+import time
+from datetime import datetime, timedelta
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils
+
+PAYLOAD_SIZES = [("5-day", 5 * 24 * 6), ("4-week", 28 * 24 * 6)]
+REPEATS = 20
+
+
+def get_overtopping_body(records_count):
+    """Build a wave overtopping response of Dawlish with one record every 10 minutes
+
+    Args:
+        records_count (integer): Number of records of each location
+
+    Returns:
+        bytes: JSON body
+    """
+
+    rnd = random.Random(records_count)
+    start_time = datetime(2024, 11, 21)
+
+    def get_records():
+        return [
+            {
+                "time": (start_time + timedelta(minutes=10 * i)).strftime(
+                    utils.BACKEND_TIME_FORMAT
+                ),
+                "overtopping_count": rnd.choice([0, 0, 3, 10, 40, 70]),
+                "confidence": round(rnd.random(), 2),
+            }
+            for i in range(records_count)
+        ]
+
+    return json.dumps(
+        {
+            "seawall_crest_overtopping": get_records(),
+            "railway_line_overtopping": get_records(),
+        }
+    ).encode()
+
+
+def convert_records_to_dataframes(json_data):
+    """Previous cache hit: one dataframe per list of records, with times parsed again"""
+
+    dataframes = []
+    for records in json_data.values():
+        dataframe = pd.DataFrame(records)
+        dataframe["time"] = utils.parse_time_column(dataframe["time"])
+        dataframes.append(dataframe)
+    return dataframes
+
+
+def convert_columns_to_series(json_data):
+    """Current cache hit: one time series per list, built from arrays"""
+
+    return [
+        utils.convert_overtopping_data_to_series(utils.get_json_columns(json_data, key))
+        for key in json_data
+    ]
+
+
+def decode_to_dataframes(body):
+    """Previous path: stdlib decoder into lists of dicts, then dataframes"""
+
+    json_data = json.loads(body)
+    return json_data, convert_records_to_dataframes(json_data)
+
+
+def decode_to_series(body):
+    """Current path: orjson when installed, columns with parsed times, then time series"""
+
+    json_data = utils.convert_json_to_columns(utils.decode_json(body))
+    return json_data, convert_columns_to_series(json_data)
+
+
+def get_best_time(function, argument):
+    """Get best duration of REPEATS calls in milliseconds"""
+
+    best_time = float("inf")
+    for _ in range(REPEATS):
+        started_at = time.perf_counter()
+        function(argument)
+        best_time = min(best_time, time.perf_counter() - started_at)
+    return best_time * 1000
+
+
+if __name__ == "__main__":
+    print("JSON decoder:", "orjson" if utils.orjson is not None else "json")
+    for label, records_count in PAYLOAD_SIZES:
+        body = get_overtopping_body(records_count)
+        previous_entry, _ = decode_to_dataframes(body)
+        current_entry, _ = decode_to_series(body)
+        previous_cached = pickle.dumps(previous_entry)
+        current_cached = pickle.dumps(current_entry)
+
+        print(f"{label} ({records_count} records x 2, body {len(body) / 1024:.0f} KiB)")
+        print(
+            f"  response: previous {get_best_time(decode_to_dataframes, body):.2f} ms, "
+            f"current {get_best_time(decode_to_series, body):.2f} ms"
+        )
+        print(
+            f"  cached entry: previous {len(previous_cached) / 1024:.0f} KiB, "
+            f"current {len(current_cached) / 1024:.0f} KiB"
+        )
+        previous_hit_time = get_best_time(
+            lambda cached: convert_records_to_dataframes(pickle.loads(cached)),
+            previous_cached,
+        )
+        current_hit_time = get_best_time(
+            lambda cached: convert_columns_to_series(pickle.loads(cached)),
+            current_cached,
+        )
+        print(
+            f"  cache hit: previous {previous_hit_time:.2f} ms, "
+            f"current {current_hit_time:.2f} ms"
+        )
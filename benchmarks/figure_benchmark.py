@@ -0,0 +1,192 @@
+# SPDX-FileCopyrightText: © 2025 National Oceanography Centre and University of Plymouth
+
+# SPDX-License-Identifier: MIT
+
+# Measure building and serialising overtopping and feature figures, with and without plotly validation, and building
+# overtopping figures with the previous plotly express path:
+# python benchmarks/figure_benchmark.py
+
+import os
+import sys
+import time
+import numpy as np
+import plotly.express as px
+from plotly.io.json import to_json_plotly
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIRECTORY)
+os.chdir(ROOT_DIRECTORY)
+
+import overtopping_graphs_components as ogc
+import feature_components as fc
+import time_series
+import utils
+
+POINTS_COUNTS = [("5-day", 5 * 24 * 6), ("4-week", 28 * 24 * 6)]
+FIRST_TIME = 1732147200
+REPEATS = 20
+
+
+def get_overtopping_series(points_count, rng):
+    """Build overtopping events time series with one point every 10 minutes
+
+    Args:
+        points_count (integer): Number of points
+        rng (Generator): Random numbers generator
+
+    Returns:
+        TimeSeries: Overtopping events time series
+    """
+
+    return time_series.TimeSeries(
+        np.arange(points_count) * 600 + FIRST_TIME,
+        {
+            "overtopping_count": rng.integers(0, 60, points_count),
+            "confidence": rng.random(points_count),
+        },
+    )
+
+
+def get_feature_series(points_count, rng):
+    """Build tidal level time series with one point every 10 minutes and its overtopping events times
+
+    Args:
+        points_count (integer): Number of points
+        rng (Generator): Random numbers generator
+
+    Returns:
+        TimeSeries, TimeSeries: Tidal level and overtopping events times series
+    """
+
+    feature_data = time_series.TimeSeries(
+        np.arange(points_count) * 600 + FIRST_TIME,
+        {"tidal_level": rng.random(points_count) * 6},
+    )
+    return feature_data, feature_data.take(rng.random(points_count) < 0.1)
+
+
+def render_overtopping_figure(overtopping_data):
+    return ogc.render_overtopping_plot(
+        "Dawlish Seawall Crest",
+        "dawlish_seawall_crest.png",
+        overtopping_data,
+        overtopping_data,
+    )
+
+
+def render_previous_overtopping_figure(overtopping_data):
+    """Build overtopping figure like dashboard did before base layouts: a plotly express figure, validated by plotly,
+    updated with title, logo, grid, markers and IQR lines
+    """
+
+    plot_title = "Dawlish Seawall Crest"
+    figure = px.scatter(
+        {
+            "time": overtopping_data["time"],
+            "overtopping_count": overtopping_data["overtopping_count"],
+        },
+        x="time",
+        y="overtopping_count",
+        render_mode="svg",
+        color_continuous_scale=["aqua", "skyblue", "blue"],
+        height=513,
+        labels={
+            "time": "Time",
+            "overtopping_count": "No. of Overtopping Occurrences (Per 10 Mins)",
+        },
+    )
+    is_sheltered = utils.find_words_with_suffix(plot_title, "sheltered")
+    figure.add_layout_image(
+        dict(
+            source="./assets/imgs/dawlish_seawall_crest.png",
+            xref="paper",
+            yref="paper",
+            x=0.24 if not is_sheltered else 0.10,
+            y=1.03,
+            sizex=0.06,
+            sizey=0.06,
+            xanchor="left",
+            yanchor="bottom",
+        )
+    )
+    figure.update_layout(
+        title=dict(
+            text=plot_title,
+            font=dict(family="Helvetica Neue", size=22, color="#3279B7", weight=500),
+            xref="container",
+            yref="container",
+            x=0.35 if not is_sheltered else 0.25,
+            y=0.91,
+            xanchor="left",
+            yanchor="bottom",
+        ),
+        plot_bgcolor="white",
+        xaxis=dict(showgrid=True, gridcolor="#8A8D90", linecolor="#8A8D90"),
+        yaxis=dict(showgrid=True, gridcolor="#8A8D90", linecolor="#8A8D90"),
+        showlegend=False,
+    )
+    figure.update_traces(
+        selector=0, marker=ogc.get_overtopping_marker(overtopping_data)
+    )
+    figure.add_trace(ogc.get_overtopping_trace(overtopping_data))
+    figure.add_hline(
+        y=6, line_dash="dash", line_color="#8A8D90", annotation_text="25% IQR (6)"
+    )
+    figure.add_hline(
+        y=54, line_dash="dash", line_color="#8A8D90", annotation_text="75% IQR (54)"
+    )
+    return figure
+
+
+def render_feature_figure(feature_data):
+    feature_series, overtopping_times = feature_data
+    return fc.render_feature_plot(
+        "Dawlish - Tidal Level",
+        feature_series,
+        feature_series,
+        "tidal_level",
+        ("Tidal level (m, CD)", "Adjusted tidal level (m, CD)"),
+        ("Overtopping event", "Adjusted overtopping event"),
+        0,
+        6,
+        overtopping_times,
+        overtopping_times,
+        False,
+    )
+
+
+def get_mean_time(function, argument):
+    """Get mean duration of REPEATS calls in milliseconds, after a first call building cached layouts"""
+
+    function(argument)
+    started_at = time.perf_counter()
+    for _ in range(REPEATS):
+        function(argument)
+    return (time.perf_counter() - started_at) / REPEATS * 1000
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    for label, points_count in POINTS_COUNTS:
+        print(f"{label} ({points_count} points)")
+        overtopping_data = get_overtopping_series(points_count, rng)
+        print(
+            "  overtopping: previous plotly express build "
+            f"{get_mean_time(render_previous_overtopping_figure, overtopping_data):.1f} ms"
+        )
+        figures = [
+            ("overtopping", render_overtopping_figure, overtopping_data),
+            ("feature", render_feature_figure, get_feature_series(points_count, rng)),
+        ]
+        for figure_name, render_figure, figure_data in figures:
+            build_times = []
+            for figure_validation in ("True", "False"):
+                os.environ["FIGURE_VALIDATION"] = figure_validation
+                build_times.append(get_mean_time(render_figure, figure_data))
+            serialise_time = get_mean_time(
+                lambda figure: to_json_plotly(figure), render_figure(figure_data)
+            )
+            print(
+                f"  {figure_name}: build {build_times[0]:.1f} ms validated, "
+                f"{build_times[1]:.1f} ms not validated (default), serialise {serialise_time:.1f} ms"
+            )
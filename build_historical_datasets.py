@@ -0,0 +1,46 @@
+# SPDX-FileCopyrightText: © 2025 National Oceanography Centre and University of Plymouth
+
+# SPDX-License-Identifier: MIT
+
+# Build bundled historical datasets from backend API: python build_historical_datasets.py
+
+from datetime import datetime, timezone
+import historical_datasets
+
+# Render views from backend API instead of returning views of an older bundle
+historical_datasets.datasets_state["views"] = {}
+
+import dashboard
+
+
+def build_historical_views():
+    """Fetch, convert and render default views of historical options
+
+    Returns:
+        dict: Rendered views by option and view name
+    """
+
+    views = {}
+    for site_location_val in historical_datasets.HISTORICAL_OPTIONS:
+        overtopping_view = dashboard.get_default_overtopping_view(site_location_val)
+        if overtopping_view["dataframes"][1].empty:
+            raise ValueError(f"No wave overtopping data for '{site_location_val}'")
+
+        views[site_location_val] = {"overtopping": overtopping_view}
+        for feature_plot in dashboard.FEATURE_PLOTS:
+            feature_view = dashboard.get_default_feature_view(
+                feature_plot, site_location_val
+            )
+            if feature_view["dataframes"][1].empty:
+                raise ValueError(
+                    f"No {feature_plot['feature_name']} data for '{site_location_val}'"
+                )
+            views[site_location_val][feature_plot["feature_name"]] = feature_view
+    return views
+
+
+if __name__ == "__main__":
+    historical_datasets.save_historical_views(
+        build_historical_views(), datetime.now(timezone.utc).isoformat()
+    )
+    print("Historical datasets saved to", historical_datasets.get_historical_datasets_path())
@@ -2,10 +2,26 @@
 
 # SPDX-License-Identifier: MIT
 
-from dash import Dash, dcc, html, Input, Output, State, ctx, DiskcacheManager
+from dash import (
+    Dash,
+    dcc,
+    html,
+    Input,
+    Output,
+    State,
+    ctx,
+    DiskcacheManager,
+    ClientsideFunction,
+    MATCH,
+)
 import dash_bootstrap_components as dbc
 import os
-import pandas as pd
+import time
+import numpy as np
+import plotly.graph_objects as go
+import threading
+import queue
+import concurrent.futures
 import utils
 import overtopping_graphs_components as ogc
 import feature_components as fc
@@ -15,6 +31,15 @@ import diskcache
 import multiprocessing
 import aiohttp
 import asyncio
+import flask
+import api_client
+import forecast_cache
+import session_store
+import metrics
+import historical_datasets
+import prefetcher
+import request_coalescing
+import time_series
 
 utils.loadConfigFile()
 
@@ -25,6 +50,12 @@ dawlish_lon_seawall = os.environ.get("DAWLISH_LON_SEAWALL")
 penzance_lat_seawall = os.environ.get("PENZANCE_LAT_SEAWALL")
 penzance_lon_seawall = os.environ.get("PENZANCE_LON_SEAWALL")
 DEBUG = eval(os.environ.get("DEBUG").capitalize()) #DEBUG must by True or False with first letter in caps and rest in lower case
+INCREMENTAL_RENDERING = (
+    os.environ.get("INCREMENTAL_RENDERING", "True").capitalize() == "True"
+)
+SPECULATIVE_PREFETCH = (
+    os.environ.get("SPECULATIVE_PREFETCH", "False").capitalize() == "True"
+)
 
 PERCENTAGE_MIN_VAL_SLIDER = -100
 PERCENTAGE_MAX_VAL_SLIDER = 100
@@ -51,10 +82,152 @@ DASHBOARD_FULL_DESC_P3_2 = " trained "
 DASHBOARD_FULL_DESC_P3_3 = ". The model is updated once a day and uses Met Office wave and wind data as input, as well as predicted water level. This tool provides overtopping forecast 5 days ahead for Dawlish and Penzance, and allows the user to modify wind and wave input variables to test the sensitivity of wave overtopping."
 
 
+API_REQUEST_DEADLINE = 30
+CACHE_WARMER_INTERVAL = 60 * 60
+FORECAST_REFRESH_INTERVAL = 1.0
+FORECAST_REFRESHER_LOCK_TTL = 60
+SWEEP_CONCURRENCY = 4
+SWEEP_MAX_SCENARIOS = 441
+SWEEP_PROGRESS_INTERVAL = 0.5
+
+SWH_FEATURES_DESCRIPTION = tuple(
+    ["Significant wave height (Hm)", "Adjusted significant wave height (Hm)"]
+)
+TL_FEATURES_DESCRIPTION = tuple(["Tidal level (m, CD)", "Adjusted tidal level (m, CD)"])
+WS_FEATURES_DESCRIPTION = tuple(["Wind speed (m/s)", "Adjusted wind speed (m/s)"])
+OVERTOPPING_EVENTS_DESCRIPTION = tuple(
+    ["Overtopping event", "Adjusted overtopping event"]
+)
+BACKGROUND_CALLBACK_INTERVAL = 250
+BACKGROUND_JOB_TTL = 24 * 60 * 60
+
+FEATURE_PLOTS = [
+    {
+        "graph_id": "line-plot-swh",
+        "store_id": "swh",
+        "resource_name": "significant-wave-height",
+        "feature_list_name": "significant_wave_heights",
+        "feature_name": "significant_wave_height",
+        "title": " - Significant wave height",
+        "features_description": SWH_FEATURES_DESCRIPTION,
+        "y_min_value": 0,
+        "y_max_value": 5,
+    },
+    {
+        "graph_id": "line-plot-tidal-level",
+        "store_id": "tidal-level",
+        "resource_name": "tidal-level",
+        "feature_list_name": "tidal_levels",
+        "feature_name": "tidal_level",
+        "title": " - Tidal Level ",
+        "features_description": TL_FEATURES_DESCRIPTION,
+        "y_min_value": 0,
+        "y_max_value": 6,
+    },
+    {
+        "graph_id": "line-plot-wind-speed",
+        "store_id": "wind-speed",
+        "resource_name": "wind-speed",
+        "feature_list_name": "wind_speeds",
+        "feature_name": "wind_speed",
+        "title": " - Wind Speed ",
+        "features_description": WS_FEATURES_DESCRIPTION,
+        "y_min_value": 0,
+        "y_max_value": 25,
+    },
+]
+
+SLIDER_STEP = 1
+
+# Settings of each slider and wave and atmospheric variables that it can change. A variable is requested again on
+# submit only when one of its sliders changed; overtopping events are always recomputed.
+SLIDER_DEPENDENCIES = {
+    "sig-wave-height": {
+        "query_param": "sig_wave_height",
+        "default_value": PERCENTAGE_DEFAULT_VALUE,
+        "min_value": PERCENTAGE_MIN_VAL_SLIDER,
+        "max_value": PERCENTAGE_MAX_VAL_SLIDER,
+        "step": SLIDER_STEP,
+        "reset_button": "wad-reset-button",
+        "features": ["significant_wave_height"],
+    },
+    "freeboard": {
+        "query_param": "freeboard",
+        "default_value": PERCENTAGE_DEFAULT_VALUE,
+        "min_value": PERCENTAGE_MIN_VAL_SLIDER,
+        "max_value": PERCENTAGE_MAX_VAL_SLIDER,
+        "step": SLIDER_STEP,
+        "reset_button": "wad-reset-button",
+        "features": ["tidal_level"],
+    },
+    "mean-wave-period": {
+        "query_param": "mean_wave_period",
+        "default_value": PERCENTAGE_DEFAULT_VALUE,
+        "min_value": PERCENTAGE_MIN_VAL_SLIDER,
+        "max_value": PERCENTAGE_MAX_VAL_SLIDER,
+        "step": SLIDER_STEP,
+        "reset_button": "wad-reset-button",
+        "features": [],
+    },
+    "mean-wave-direction": {
+        "query_param": "mean_wave_dir",
+        "default_value": DEGREE_DEFAULT_VALUE,
+        "min_value": DEGREE_MIN_VAL_SLIDER,
+        "max_value": DEGREE_MAX_VAL_SLIDER,
+        "step": SLIDER_STEP,
+        "reset_button": "mwd-reset-button",
+        "features": [],
+    },
+    "wind-speed": {
+        "query_param": "wind_speed",
+        "default_value": PERCENTAGE_DEFAULT_VALUE,
+        "min_value": PERCENTAGE_MIN_VAL_SLIDER,
+        "max_value": PERCENTAGE_MAX_VAL_SLIDER,
+        "step": SLIDER_STEP,
+        "reset_button": "aad-reset-button",
+        "features": ["wind_speed"],
+    },
+    "wind-direction": {
+        "query_param": "wind_direction",
+        "default_value": DEGREE_DEFAULT_VALUE,
+        "min_value": DEGREE_MIN_VAL_SLIDER,
+        "max_value": DEGREE_MAX_VAL_SLIDER,
+        "step": SLIDER_STEP,
+        "reset_button": "wd-reset-button",
+        "features": [],
+    },
+}
+
 multiprocessing.set_start_method("forkserver")
 
+
+class JobCountingDiskcacheManager(DiskcacheManager):
+    """Background callback manager counting jobs terminated before they complete. Dash also terminates the job of
+    every completed callback once its result is read, so only jobs terminated without a result are counted.
+    """
+
+    def call_job_fn(self, key, job_fn, args, context):
+        job = super().call_job_fn(key, job_fn, args, context)
+        self.handle.set(f"job result key {job}", key, expire=BACKGROUND_JOB_TTL)
+        return job
+
+    def get_result(self, key, job):
+        if job and self.result_ready(key):
+            self.handle.delete(f"job result key {job}")
+        return super().get_result(key, job)
+
+    def terminate_job(self, job):
+        if job is None:
+            return
+
+        result_key = self.handle.pop(f"job result key {job}")
+        if result_key is not None and not self.result_ready(result_key):
+            metrics.increment("background_jobs_cancelled")
+        super().terminate_job(job)
+
+
 cache = diskcache.Cache("./cache")
-background_callback_manager = DiskcacheManager(cache)
+background_callback_manager = JobCountingDiskcacheManager(cache)
 
 
 external_stylesheets = [
@@ -68,44 +241,131 @@ app = Dash(
     background_callback_manager=background_callback_manager,
     url_base_pathname='/ccoresources/SPLASHDT/'
 )
+server = app.server
 
 
 async def fetch_data(api_url):
+    data, _ = await fetch_timestamped_data(api_url)
+    return data
+
+
+async def fetch_timestamped_data(api_url):
+    """Get backend API response from forecast cache, or from backend API when it is not cached. Stale cached
+    responses are returned immediately and queued to be refreshed by the forecast refresher.
+
+    Args:
+        api_url (string): Query url to send a request to backend API
+
+    Returns:
+        dict, float: JSON data, or error message when request failed, and time it was fetched (None when request failed)
+    """
+
+    cached_data, fetched_at = forecast_cache.get_cached_data(api_url)
+    if cached_data is not None:
+        if forecast_cache.is_stale(fetched_at):
+            forecast_cache.request_refresh(api_url)
+        return cached_data, fetched_at
+
+    deadline = api_client.get_client_setting(
+        "API_REQUEST_DEADLINE", API_REQUEST_DEADLINE
+    )
+    data = await request_coalescing.fetch_once(api_url, request_data, deadline)
+    return data, time.time() if isinstance(data, dict) else None
+
+
+async def refresh_data(api_url):
+    """Fetch again a stale backend API response and replace it in forecast cache
+
+    Args:
+        api_url (string): Query url to send a request to backend API
+    """
+
+    deadline = api_client.get_client_setting(
+        "API_REQUEST_DEADLINE", API_REQUEST_DEADLINE
+    )
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(api_url) as response:
-                response.raise_for_status()
-                data = await response.json()
+        data = await request_coalescing.fetch_once(api_url, request_data, deadline)
+        if isinstance(data, dict):
+            metrics.increment("forecast_refreshes")
+        else:
+            print(f"Warning: Refresh of '{api_url}' failed: {data}")
+            metrics.increment("forecast_refresh_failures")
+    finally:
+        forecast_cache.complete_refresh(api_url)
+
+
+async def request_data(api_url, conditional=True):
+    deadline = api_client.get_client_setting(
+        "API_REQUEST_DEADLINE", API_REQUEST_DEADLINE
+    )
+    try:
+        session = await api_client.get_session()
+        async with session.get(
+            api_url,
+            headers=forecast_cache.get_cached_validators(api_url) if conditional else None,
+            timeout=aiohttp.ClientTimeout(total=deadline),
+        ) as response:
+            if response.status == 304:
+                data = forecast_cache.revalidate_data(api_url)
+                if data is None:
+                    return await request_data(api_url, conditional=False)
+                metrics.increment("http_not_modified")
                 return data
+
+            response.raise_for_status()
+            data = utils.convert_json_to_columns(utils.decode_json(await response.read()))
+            if isinstance(data, dict):
+                forecast_cache.cache_data(
+                    api_url, data, forecast_cache.get_request_validators(response.headers)
+                )
+            return data
     except aiohttp.ClientError as e:
         return f"Error: {e}"
+    except asyncio.TimeoutError:
+        return f"Error: Request to {api_url} exceeded {deadline} seconds deadline"
     except Exception as e:
         return f"Unexpected Error: {e}"
 
 
-def get_dawlish_wave_overtopping(api_url):
+def get_forecast_range(overtopping_df):
+    """Get forecast range of overtopping data
+
+    Args:
+        overtopping_df (TimeSeries): Forecast overtopping events time series
+
+    Returns:
+        Dates: Forecast start date and end date. Default forecast dates when time series is empty.
+    """
+
+    if overtopping_df.empty:
+        return get_default_forecast_dates()
+
+    start_date = utils.format_range_date(overtopping_df["time"].min())
+    end_date = utils.format_range_date(overtopping_df["time"].max())
+    return start_date, end_date
+
+
+async def get_dawlish_wave_overtopping(api_url):
     """Get overtopping counts of Dawlish
 
     Args:
         api_url (string): Query url to send a request to backend API
 
     Returns:
-        Tuple: Forecast overtopping data of seawall crest and railway line, forecast start date and end date
+        Tuple: Forecast overtopping data of seawall crest and railway line, forecast start date and end date. Time
+        data was fetched is kept in "fetched_at" attribute of seawall crest data.
     """
 
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    overtopping_data = loop.run_until_complete(fetch_data(api_url))
-    loop.close()
+    overtopping_data, fetched_at = await fetch_timestamped_data(api_url)
 
-    seawall_crest_overtopping_df = utils.convert_overtopping_data_to_df(
-        overtopping_data["seawall_crest_overtopping"]
+    seawall_crest_overtopping_df = utils.convert_overtopping_data_to_series(
+        utils.get_json_columns(overtopping_data, "seawall_crest_overtopping")
     )
-    railway_line_overtopping_df = utils.convert_overtopping_data_to_df(
-        overtopping_data["railway_line_overtopping"]
+    railway_line_overtopping_df = utils.convert_overtopping_data_to_series(
+        utils.get_json_columns(overtopping_data, "railway_line_overtopping")
     )
-    start_date = utils.format_range_date(seawall_crest_overtopping_df["time"].min())
-    end_date = utils.format_range_date(seawall_crest_overtopping_df["time"].max())
+    seawall_crest_overtopping_df.attrs["fetched_at"] = fetched_at
+    start_date, end_date = get_forecast_range(seawall_crest_overtopping_df)
     return (
         seawall_crest_overtopping_df,
         railway_line_overtopping_df,
@@ -114,28 +374,26 @@ def get_dawlish_wave_overtopping(api_url):
     )
 
 
-def get_penzance_wave_overtopping(api_url):
+async def get_penzance_wave_overtopping(api_url):
     """Get overtopping counts of Penzance
 
     Args:
         api_url (string): Query url to send a request to backend API
 
     Returns:
-        Tuple: Forecast overtopping data of seawall crest and seawall crest sheltered, forecast start date and end date
+        Tuple: Forecast overtopping data of seawall crest and seawall crest sheltered, forecast start date and end
+        date. Time data was fetched is kept in "fetched_at" attribute of seawall crest data.
     """
 
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    overtopping_data = loop.run_until_complete(fetch_data(api_url))
-    loop.close()
-    seawall_crest_overtopping_df = utils.convert_overtopping_data_to_df(
-        overtopping_data["seawall_crest_overtopping"]
+    overtopping_data, fetched_at = await fetch_timestamped_data(api_url)
+    seawall_crest_overtopping_df = utils.convert_overtopping_data_to_series(
+        utils.get_json_columns(overtopping_data, "seawall_crest_overtopping")
     )
-    seawall_crest_sheltered_overtopping_df = utils.convert_overtopping_data_to_df(
-        overtopping_data["seawall_crest_sheltered_overtopping"]
+    seawall_crest_sheltered_overtopping_df = utils.convert_overtopping_data_to_series(
+        utils.get_json_columns(overtopping_data, "seawall_crest_sheltered_overtopping")
     )
-    start_date = utils.format_range_date(seawall_crest_overtopping_df["time"].min())
-    end_date = utils.format_range_date(seawall_crest_overtopping_df["time"].max())
+    seawall_crest_overtopping_df.attrs["fetched_at"] = fetched_at
+    start_date, end_date = get_forecast_range(seawall_crest_overtopping_df)
 
     return (
         seawall_crest_overtopping_df,
@@ -145,10 +403,10 @@ def get_penzance_wave_overtopping(api_url):
     )
 
 
-def get_features_data(
+async def get_features_data(
     root_endpoint, resource_name, params, feature_list_name, feature_name
 ):
-    """Get features data and overtopping events times
+    """Get features data
 
     Args:
         root_endpoint (string): Root of query url of backend API
@@ -158,56 +416,17 @@ def get_features_data(
         feature_name (string): Feature name for each record in feature list
 
     Returns:
-        Dataframes: Feature dataframe and forecast overtopping events dataframe
+        TimeSeries: Feature time series. Time data was fetched is kept in "fetched_at" attribute.
     """
 
     resource_url = utils.add_resource(root_endpoint, resource_name)
     full_url = utils.add_query_params(resource_url, params)
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    feature_overtopping_data = loop.run_until_complete(fetch_data(full_url))
-    loop.close()
-    feature_df = utils.convert_feature_list_to_df(
-        feature_overtopping_data[feature_list_name], feature_name
-    )
-    overtopping_times_df = utils.convert_feature_list_to_df(
-        feature_overtopping_data["overtopping_times"], feature_name
-    )
-    return feature_df, overtopping_times_df
-
-
-def get_all_features_data(root_endpoint, params):
-    """Get all features data
-
-    Args:
-        root_endpoint (string): Base query endpoint to get features data
-        params (string): Wave or atmospheric parameters
-
-    Returns:
-        Tuple: Features and overtopping events times dataframes
-    """
-
-    significant_wave_height_df, swh_overtopping_times_df = get_features_data(
-        root_endpoint,
-        "significant-wave-height",
-        params,
-        "significant_wave_heights",
-        "significant_wave_height",
-    )
-    tidal_level_df, tl_overtopping_times_df = get_features_data(
-        root_endpoint, "tidal-level", params, "tidal_levels", "tidal_level"
-    )
-    wind_speed_df, ws_overtopping_times_df = get_features_data(
-        root_endpoint, "wind-speed", params, "wind_speeds", "wind_speed"
-    )
-    return (
-        significant_wave_height_df,
-        swh_overtopping_times_df,
-        tidal_level_df,
-        tl_overtopping_times_df,
-        wind_speed_df,
-        ws_overtopping_times_df,
+    feature_data, fetched_at = await fetch_timestamped_data(full_url)
+    feature_df = utils.convert_feature_data_to_series(
+        utils.get_json_columns(feature_data, feature_list_name), feature_name
     )
+    feature_df.attrs["fetched_at"] = fetched_at
+    return feature_df
 
 
 def get_default_forecast_dates():
@@ -244,6 +463,8 @@ def render_dashboard():
 
     atmospheric_variables_panels = ogc.get_atmospheric_variables_panels()
 
+    sweep_panel = ogc.get_sweep_panel()
+
     buttons_panel = ogc.get_buttons_panel()
 
     footer_panel = cc.get_footer_components()
@@ -266,6 +487,18 @@ def render_dashboard():
             dcc.Store(id="current-wind-speed"),
             dcc.Store(id="previous-wind-speed-ot"),
             dcc.Store(id="current-wind-speed-ot"),
+            dcc.Store(id="render-timings"),
+            dcc.Store(id="session-id", storage_type="session"),
+            dcc.Store(
+                id="slider-settings",
+                data={
+                    slider_id: {
+                        "default_value": dependency["default_value"],
+                        "reset_button": dependency["reset_button"],
+                    }
+                    for slider_id, dependency in SLIDER_DEPENDENCIES.items()
+                },
+            ),
             dbc.Row(
                 header_panel, style={"paddingLeft": "72px", "paddingRight": "62px"}
             ),
@@ -359,7 +592,12 @@ def render_dashboard():
                                 ],
                                 title="Wave and atmospheric variables",
                                 class_name="wave-atmospheric-variables-panel",
-                            )
+                            ),
+                            dbc.AccordionItem(
+                                sweep_panel,
+                                title="Sensitivity sweep",
+                                class_name="wave-atmospheric-variables-panel",
+                            ),
                         ],
                         start_collapsed=True,
                     ),
@@ -443,80 +681,21 @@ def render_dashboard():
 render_dashboard()
 
 
-def render_feature_line_plots(location_name, variables_ot_dfs, show_dynamic_y_axis):
-    """Render feature line plots
-
-    Args:
-        location_name (string): Location name e.g. Dawlish or Penzance
-        variables_ot_dfs (dataframes): Forecast and adjusted forecast wave and atmospheric variables dataframes
-        show_dynamic_y_axis (boolean): Flag to display y-axis dynamically when generating adjusted forecast overtopping data
+@app.server.route(app.config.url_base_pathname + "metrics")
+def get_metrics():
+    """Get dashboard metrics e.g. connection pool statistics
 
     Returns:
-        Figures: Significant wave height, tidal level and wind speed figures
+        Response: JSON response with metrics
     """
 
-    (
-        prev_swh_df,
-        cur_swh_df,
-        prev_swh_ot_df,
-        cur_swh_overtopping_times_df,
-        prev_tl_df,
-        cur_tidal_level_df,
-        prev_tl_ot_df,
-        cur_tl_overtopping_times_df,
-        prev_ws_df,
-        cur_wind_speed_df,
-        prev_ws_ot_df,
-        cur_ws_overtopping_times_df,
-    ) = variables_ot_dfs
-    features_description = tuple(
-        ["Significant wave height (Hm)", "Adjusted significant wave height (Hm)"]
-    )
-    overtopping_evts_desc = tuple(["Overtopping event", "Adjusted overtopping event"])
-    swh_fig = fc.render_feature_plot(
-        location_name + " - Significant wave height",
-        prev_swh_df,
-        cur_swh_df,
-        "significant_wave_height",
-        features_description,
-        overtopping_evts_desc,
-        0,
-        5,
-        prev_swh_ot_df,
-        cur_swh_overtopping_times_df,
-        show_dynamic_y_axis,
-    )
-    features_description = tuple(
-        ["Tidal level (m, CD)", "Adjusted tidal level (m, CD)"]
-    )
-    tidal_level_fig = fc.render_feature_plot(
-        location_name + " - Tidal Level ",
-        prev_tl_df,
-        cur_tidal_level_df,
-        "tidal_level",
-        features_description,
-        overtopping_evts_desc,
-        0,
-        6,
-        prev_tl_ot_df,
-        cur_tl_overtopping_times_df,
-        show_dynamic_y_axis,
-    )
-    features_description = tuple(["Wind speed (m/s)", "Adjusted wind speed (m/s)"])
-    wind_speed_fig = fc.render_feature_plot(
-        location_name + " - Wind Speed ",
-        prev_ws_df,
-        cur_wind_speed_df,
-        "wind_speed",
-        features_description,
-        overtopping_evts_desc,
-        0,
-        25,
-        prev_ws_ot_df,
-        cur_ws_overtopping_times_df,
-        show_dynamic_y_axis,
+    return flask.jsonify(
+        {
+            **metrics.get_metrics(),
+            **api_client.get_pool_stats(),
+            **prefetcher.get_prefetch_stats(),
+        }
     )
-    return swh_fig, tidal_level_fig, wind_speed_fig
 
 
 def get_overtopping_data_stage(trigger_id):
@@ -526,13 +705,13 @@ def get_overtopping_data_stage(trigger_id):
         trigger_id (string): Element's id which has triggered an event
 
     Returns:
-        string: Value that defines if it's either forecast or adjusted forecast data
+        integer: Stage code that defines if it's either forecast or adjusted forecast data
     """
 
     return (
-        "forecast"
+        time_series.FORECAST_STAGE
         if trigger_id is None or trigger_id == "dd_site_location"
-        else "adjusted_forecast"
+        else time_series.ADJUSTED_FORECAST_STAGE
     )
 
 
@@ -544,21 +723,21 @@ def get_final_overtopping_dfs(
     trigger_id,
     submit_n_clicks,
 ):
-    """Get final overtopping dataframes
+    """Get final overtopping time series
 
     Args:
-        first_location_data (Dataframe): First location dataframe e.g. Dawlish seawall crest data
-        current_df_1 (Dataframe): Adjusted first location dataframe
-        second_location_data (Dataframe): Second location dataframe e.g. Dawlish railway line data
-        current_df_2 (Dataframe): Adjusted second location dataframe
+        first_location_data (TimeSeries): First location time series e.g. Dawlish seawall crest data
+        current_df_1 (TimeSeries): Adjusted first location time series
+        second_location_data (TimeSeries): Second location time series e.g. Dawlish railway line data
+        current_df_2 (TimeSeries): Adjusted second location time series
         trigger_id (integer): Element's id which has triggered an event
         submit_n_clicks (integer): Number of clicks of submit button
 
     Returns:
-        Dataframes: Joined dataframes, forecast and adjusted forecast overtopping events dataframes
+        TimeSeries: Forecast and adjusted forecast overtopping events time series
     """
-    first_location_data["stage"] = get_overtopping_data_stage(trigger_id)
-    second_location_data["stage"] = get_overtopping_data_stage(trigger_id)
+    first_location_data.stage = get_overtopping_data_stage(trigger_id)
+    second_location_data.stage = get_overtopping_data_stage(trigger_id)
 
     dfs_to_store = [
         first_location_data,
@@ -569,11 +748,7 @@ def get_final_overtopping_dfs(
     tmp_previous_df_1, tmp_current_df_1, tmp_previous_df_2, tmp_current_df_2 = (
         utils.get_dataframes_to_save(submit_n_clicks, trigger_id, dfs_to_store)
     )
-    joined_dsc = pd.concat([tmp_previous_df_1, tmp_current_df_1], ignore_index=True)
-    joined_drl = pd.concat([tmp_previous_df_2, tmp_current_df_2], ignore_index=True)
     return (
-        joined_dsc,
-        joined_drl,
         tmp_previous_df_1,
         tmp_current_df_1,
         tmp_previous_df_2,
@@ -581,108 +756,293 @@ def get_final_overtopping_dfs(
     )
 
 
-def get_final_variables_dfs(
-    swh_df,
-    current_swh_df,
-    swh_overtopping_times_df,
-    current_swh_ot_df,
-    tidal_level_df,
-    curren_tl_df,
-    tl_overtopping_times_df,
-    current_tl_ot_df,
-    wind_speed_df,
-    current_ws_df,
-    ws_overtopping_times_df,
-    current_ws_ot_df,
-    trigger_id,
-    submit_n_clicks,
-):
-    """Get final wave and atmospheric variables dataframes
+def is_adjusted_forecast(trigger_id, submit_n_clicks):
+    """Check if adjusted forecast data was requested
 
     Args:
-        swh_df (Dataframe): Significant wave height dataframe
-        current_swh_df (Dataframe): Adjusted significant wave height dataframe
-        swh_overtopping_times_df (Dataframe): Forecast overtopping event times dataframe for significant wave height data
-        current_swh_ot_df (Dataframe): Adjusted forecast overtopping event times dataframe for significant wave height data
-        tidal_level_df (Dataframe): Tidal level dataframe
-        curren_tl_df (Dataframe): Adjusted tidal level dataframe
-        tl_overtopping_times_df (Dataframe): Forecast overtopping event times dataframe for tidal level data
-        current_tl_ot_df (Dataframe): Adjusted forecast overtopping event times dataframe for tidal level data
-        wind_speed_df (Dataframe): Wind speed dataframe
-        current_ws_df (Dataframe): Adjusted wind speed dataframe
-        ws_overtopping_times_df (Dataframe): Forecast overtopping event times dataframe for wind speed data
-        current_ws_ot_df (Dataframe): Adjusted forecast overtopping event times dataframe for wind speed data
-        trigger_id (Dataframe): Element's id which has triggered an event
-        submit_n_clicks (Dataframe): Number of clicks of submit button
+        trigger_id (string): Element's id which has triggered an event
+        submit_n_clicks (integer): Number of clicks of submit button
 
     Returns:
-        Tuple: Dataframes to store, and final forecast and adjust forecast significant-wave-height, tidal-level and wind-speed dataframes
+        bool: True when submit button was clicked, False when location was picked
     """
 
-    swh_df["stage"] = get_overtopping_data_stage(trigger_id)
-    tidal_level_df["stage"] = get_overtopping_data_stage(trigger_id)
-    wind_speed_df["stage"] = get_overtopping_data_stage(trigger_id)
+    return not (
+        submit_n_clicks is None
+        or submit_n_clicks == 0
+        or trigger_id is not None
+        and trigger_id != "submit-button"
+    )
+
 
-    dfs_to_store = [
-        swh_df,
-        current_swh_df,
-        swh_overtopping_times_df,
-        current_swh_ot_df,
-        tidal_level_df,
-        curren_tl_df,
-        tl_overtopping_times_df,
-        current_tl_ot_df,
-        wind_speed_df,
-        current_ws_df,
-        ws_overtopping_times_df,
-        current_ws_ot_df,
+def get_query_params(trigger_id, submit_n_clicks, site_location_val, slider_values):
+    """Get query parameters to send a request to backend API
+
+    Args:
+        trigger_id (string): Element's id which has triggered an event
+        submit_n_clicks (integer): Number of clicks of submit button
+        site_location_val (string): Site location value of dropdown box
+        slider_values (tuple): Significant wave height, freeboard, mean wave period, mean wave direction, wind speed and wind direction values
+
+    Returns:
+        dict: Query parameters
+    """
+
+    option, start_date = utils.get_dataset_params(site_location_val)
+    if not is_adjusted_forecast(trigger_id, submit_n_clicks):
+        params = {"start_date": start_date, "option": option}
+    else:
+        (
+            sig_wave_height_val,
+            freeboard_val,
+            mean_wave_period_val,
+            mean_wave_dir_val,
+            wind_speed_val,
+            wind_dir_val,
+        ) = slider_values
+        params = {
+            "sig_wave_height": sig_wave_height_val,
+            "freeboard": freeboard_val,
+            "mean_wave_period": mean_wave_period_val,
+            "mean_wave_dir": mean_wave_dir_val,
+            "wind_speed": wind_speed_val,
+            "wind_direction": wind_dir_val,
+        }
+        params["start_date"] = start_date
+        params["option"] = option
+    return params
+
+
+def load_location_series(site_location_val, *keys):
+    """Load session time series of a location. Time series saved for another location are not loaded, e.g. when a
+    stage was replaced by a submit before it saved time series of a newly picked location.
+
+    Args:
+        site_location_val (string): Site location value of dropdown box
+        keys (string): Session store keys. Location is kept in attrs of the first time series.
+
+    Returns:
+        Tuple: Time series of each key, all empty when they were saved for another location
+    """
+
+    loaded_series = session_store.load_series(*keys)
+    if loaded_series[0].attrs.get("site_location_val") != site_location_val:
+        return tuple(time_series.TimeSeries() for _ in keys)
+    return loaded_series
+
+
+def get_changed_sliders(params, previous_params):
+    """Get sliders whose values changed since previous request
+
+    Args:
+        params (dict): Query parameters of current request
+        previous_params (dict): Query parameters of previous request. Missing sliders have default values.
+
+    Returns:
+        list: Ids of changed sliders
+    """
+
+    if (
+        params["option"] != previous_params.get("option")
+        or params["start_date"] != previous_params.get("start_date")
+    ):
+        return list(SLIDER_DEPENDENCIES)
+
+    return [
+        slider_id
+        for slider_id, dependency in SLIDER_DEPENDENCIES.items()
+        if params.get(dependency["query_param"], dependency["default_value"])
+        != previous_params.get(dependency["query_param"], dependency["default_value"])
     ]
-    (
-        final_prev_swh_df,
-        final_cur_swh_df,
-        final_prev_swh_ot_df,
-        final_cur_swh_ot_df,
-        final_prev_tl_df,
-        final_cur_tl_df,
-        final_prev_tl_ot_df,
-        final_cur_tl_ot_df,
-        final_prev_ws_df,
-        final_cur_ws_df,
-        final_prev_ws_ot_df,
-        final_cur_ws_ot_df,
-    ) = utils.get_dataframes_to_save(submit_n_clicks, trigger_id, dfs_to_store)
-
-    dfs_to_store = tuple(
-        [
-            final_prev_swh_df,
-            final_cur_swh_df,
-            final_prev_swh_ot_df,
-            final_cur_swh_ot_df,
-            final_prev_tl_df,
-            final_cur_tl_df,
-            final_prev_tl_ot_df,
-            final_cur_tl_ot_df,
-            final_prev_ws_df,
-            final_cur_ws_df,
-            final_prev_ws_ot_df,
-            final_cur_ws_ot_df,
-        ]
+
+
+def is_feature_affected(feature_name, params, previous_params):
+    """Check if wave or atmospheric variable data can change since previous request
+
+    Args:
+        feature_name (string): Feature's name e.g. significant_wave_height
+        params (dict): Query parameters of current request
+        previous_params (dict): Query parameters of previous request
+
+    Returns:
+        bool: True when any slider affecting the feature changed
+    """
+
+    return any(
+        feature_name in SLIDER_DEPENDENCIES[slider_id]["features"]
+        for slider_id in get_changed_sliders(params, previous_params)
+    )
+
+
+def get_location_name(site_location_val):
+    """Get location name of selected option
+
+    Args:
+        site_location_val (string): Site location value of dropdown box
+
+    Returns:
+        string: Dawlish or Penzance
+    """
+
+    return (
+        "Dawlish"
+        if utils.find_words_with_suffix(site_location_val, "Dawlish")
+        else "Penzance"
+    )
+
+
+def get_root_endpoint(site_location_val):
+    """Get root endpoint of backend API for selected option
+
+    Args:
+        site_location_val (string): Site location value of dropdown box
+
+    Returns:
+        string: Root endpoint of Dawlish or Penzance backend API
+    """
+
+    return (
+        DAWLISH_API_ROOT_ENDPOINT
+        if get_location_name(site_location_val) == "Dawlish"
+        else PENZANCE_API_ROOT_ENDPOINT
+    )
+
+
+def render_overtopping_graphs(
+    site_location_val,
+    tmp_previous_df_1,
+    tmp_current_df_1,
+    tmp_previous_df_2,
+    tmp_current_df_2,
+    incremental_rendering,
+):
+    """Render overtopping graphs of selected location
+
+    Args:
+        site_location_val (string): Site location value of dropdown box
+        tmp_previous_df_1 (TimeSeries): Forecast overtopping data of first location
+        tmp_current_df_1 (TimeSeries): Adjusted forecast overtopping data of first location
+        tmp_previous_df_2 (TimeSeries): Forecast overtopping data of second location
+        tmp_current_df_2 (TimeSeries): Adjusted forecast overtopping data of second location
+        incremental_rendering (bool): Flag to patch figures already in the browser instead of rebuilding them
+
+    Returns:
+        dict: Overtopping events scatter plots JSON data, see utils.encode_figure, or patches of first and second
+        location
+    """
+
+    if incremental_rendering:
+        return (
+            ogc.patch_overtopping_plot(tmp_previous_df_1, tmp_current_df_1),
+            ogc.patch_overtopping_plot(tmp_previous_df_2, tmp_current_df_2),
+        )
+
+    if get_location_name(site_location_val) == "Dawlish":
+        return (
+            utils.encode_figure(
+                ogc.render_dawlish_seawall_crest_graph(
+                    tmp_previous_df_1, tmp_current_df_1
+                )
+            ),
+            utils.encode_figure(
+                ogc.render_dawlish_railway_line_graph(
+                    tmp_previous_df_2, tmp_current_df_2
+                )
+            ),
+        )
+
+    return (
+        utils.encode_figure(
+            ogc.render_penzance_seawall_crest_graph(tmp_previous_df_1, tmp_current_df_1)
+        ),
+        utils.encode_figure(
+            ogc.render_penzance_seawall_crest_sheltered_graph(
+                tmp_previous_df_2, tmp_current_df_2
+            )
+        ),
     )
+
+
+def get_wave_overtopping(site_location_val, params):
+    """Get coroutine requesting wave overtopping data of selected location
+
+    Args:
+        site_location_val (string): Site location value of dropdown box
+        params (dict): Query parameters
+
+    Returns:
+        coroutine: get_dawlish_wave_overtopping or get_penzance_wave_overtopping coroutine
+    """
+
+    api_url = utils.add_resource(get_root_endpoint(site_location_val), "wave-overtopping")
+    api_url = utils.add_query_params(api_url, params)
     return (
-        dfs_to_store,
-        final_prev_swh_df,
-        final_cur_swh_df,
-        final_prev_swh_ot_df,
-        final_cur_swh_ot_df,
-        final_prev_tl_df,
-        final_cur_tl_df,
-        final_prev_tl_ot_df,
-        final_cur_tl_ot_df,
-        final_prev_ws_df,
-        final_cur_ws_df,
-        final_prev_ws_ot_df,
-        final_cur_ws_ot_df,
+        get_dawlish_wave_overtopping(api_url)
+        if get_location_name(site_location_val) == "Dawlish"
+        else get_penzance_wave_overtopping(api_url)
+    )
+
+
+def get_overtopping_data(site_location_val, params):
+    """Get wave overtopping data of selected location from backend API
+
+    Args:
+        site_location_val (string): Site location value of dropdown box
+        params (dict): Query parameters
+
+    Returns:
+        TimeSeries, dates: First and second location overtopping data, forecast start date and end date
+    """
+
+    return api_client.run(get_wave_overtopping(site_location_val, params))
+
+
+def get_default_overtopping_view(site_location_val):
+    """Get overtopping graphs and data displayed when picking a location. Views are cached as long as the data they
+    are rendered from.
+
+    Args:
+        site_location_val (string): Site location value of dropdown box
+
+    Returns:
+        dict: Overtopping events scatter plots, overtopping events time series, forecast start date and end date and
+        time data was fetched
+    """
+
+    view = historical_datasets.get_historical_view(site_location_val, "overtopping")
+    if view is not None:
+        return view
+
+    params = get_query_params(None, None, site_location_val, None)
+    api_url = utils.add_query_params(
+        utils.add_resource(get_root_endpoint(site_location_val), "wave-overtopping"),
+        params,
+    )
+    view = forecast_cache.get_rendered_view("overtopping", api_url)
+    if view is not None:
+        return view
+
+    (
+        first_location_data,
+        second_location_data,
+        forecast_start_date,
+        forecast_end_date,
+    ) = get_overtopping_data(site_location_val, params)
+    first_location_data.attrs["params"] = params
+    first_location_data.attrs["site_location_val"] = site_location_val
+    dataframes = get_final_overtopping_dfs(
+        first_location_data, None, second_location_data, None, None, None
     )
+    fig1, fig2 = render_overtopping_graphs(site_location_val, *dataframes, False)
+    view = {
+        "figures": (fig1, fig2),
+        "dataframes": dataframes,
+        "forecast_range": (forecast_start_date, forecast_end_date),
+        "fetched_at": first_location_data.attrs["fetched_at"],
+    }
+    if not first_location_data.empty:
+        forecast_cache.cache_rendered_view("overtopping", api_url, view)
+    return view
 
 
 @app.callback(
@@ -695,41 +1055,24 @@ def get_final_variables_dfs(
         Output("current-dataframe-2", "data"),
         Output("forecast-range", "start_date"),
         Output("forecast-range", "end_date"),
+        Output("data-age", "children"),
         Output("overtopping-graph-legend", "children"),
-        Output("line-plot-swh", "figure"),
-        Output("line-plot-tidal-level", "figure"),
-        Output("line-plot-wind-speed", "figure"),
-        Output("previous-swh", "data"),
-        Output("current-swh", "data"),
-        Output("previous-swh-ot", "data"),
-        Output("current-swh-ot", "data"),
-        Output("previous-tidal-level", "data"),
-        Output("current-tidal-level", "data"),
-        Output("previous-tidal-level-ot", "data"),
-        Output("current-tidal-level-ot", "data"),
-        Output("previous-wind-speed", "data"),
-        Output("current-wind-speed", "data"),
-        Output("previous-wind-speed-ot", "data"),
-        Output("current-wind-speed-ot", "data"),
         Output("output", "children"),
     ],
     Input("submit-button", "n_clicks"),
     Input("dd_site_location", "value"),
-    State("sig-wave-height", "value"),
-    State("freeboard", "value"),
-    State("mean-wave-period", "value"),
-    State("mean-wave-direction", "value"),
-    State("wind-speed", "value"),
-    State("wind-direction", "value"),
+    State(ogc.get_slider_id("sig-wave-height"), "value"),
+    State(ogc.get_slider_id("freeboard"), "value"),
+    State(ogc.get_slider_id("mean-wave-period"), "value"),
+    State(ogc.get_slider_id("mean-wave-direction"), "value"),
+    State(ogc.get_slider_id("wind-speed"), "value"),
+    State(ogc.get_slider_id("wind-direction"), "value"),
+    State("previous-dataframe-1", "data"),
+    State("previous-dataframe-2", "data"),
     State("current-dataframe-1", "data"),
     State("current-dataframe-2", "data"),
-    State("current-swh", "data"),
-    State("current-swh-ot", "data"),
-    State("current-tidal-level", "data"),
-    State("current-tidal-level-ot", "data"),
-    State("current-wind-speed", "data"),
-    State("current-wind-speed-ot", "data"),
     background=True,
+    interval=BACKGROUND_CALLBACK_INTERVAL,
     running=[
         (Output("submit-button", "disabled"), True, False),
         (Output("output", "children"), "Loading...", None),
@@ -744,16 +1087,13 @@ def submit_slider_values(
     mean_wave_dir_val,
     wind_speed_val,
     wind_dir_val,
+    previous_df_1,
+    previous_df_2,
     current_df_1,
     current_df_2,
-    current_swh_df,
-    current_swh_ot_df,
-    curren_tl_df,
-    current_tl_ot_df,
-    current_ws_df,
-    current_ws_ot_df,
 ):
-    """Callback to render overtopping graphs when picking a location or submitting any variable
+    """Callback to render overtopping graphs when picking a location or submitting any variable. Wave and
+    atmospheric variables graphs are rendered independently by feature callbacks.
 
     Args:
         submit_n_clicks (integer): Number of clicks of submit button
@@ -764,595 +1104,955 @@ def submit_slider_values(
         mean_wave_dir_val (integer): Mean wave direction value
         wind_speed_val (integer): Wind speed value
         wind_dir_val (integer): Wind direction value
-        current_df_1 (Dataframe): Adjusted forecast overtopping data of first location
-        current_df_2 (Dataframe): Adjusted forecast overtopping data of second location
-        current_swh_df (Dataframe): Significant wave height dataframe
-        current_swh_ot_df (Dataframe): Forecast overtopping events times dataframe of significant wave height data
-        curren_tl_df (Dataframe): Tidal level dataframe
-        current_tl_ot_df (Dataframe): Forecast overtopping events times dataframe of tidal level data
-        current_ws_df (Dataframe): Wind speed dataframe
-        current_ws_ot_df (Dataframe): Forecast overtopping events times dataframe of wind speed data
+        previous_df_1 (string): Session store key of forecast overtopping data of first location
+        previous_df_2 (string): Session store key of forecast overtopping data of second location
+        current_df_1 (string): Session store key of adjusted forecast overtopping data of first location
+        current_df_2 (string): Session store key of adjusted forecast overtopping data of second location
 
     Returns:
-        Figures, data, div's children, Figure, data, div's children : Overtopping events scatter plots, overtopping events data to store,
-        legend's components; significant wave height, tidal level and wind speed line plot figures; significant wave height, tidal level and wind speed data to store
+        Figures, data, dates, div's children: Overtopping events scatter plots, session store keys of overtopping events data,
+        forecast start date and end date, age of forecast data, legend's components
     """
 
+    started_at = time.perf_counter()
     trigger_id = ctx.triggered_id
-    dfs_to_store = []
-    if (
-        submit_n_clicks is None
-        or submit_n_clicks == 0
-        or trigger_id is not None
-        and trigger_id != "submit-button"
-    ):
-        option, start_date = utils.get_dataset_params(site_location_val)
-        params = {"start_date": start_date, "option": option}
-    else:
-        option, start_date = utils.get_dataset_params(site_location_val)
-        params = {
-            "sig_wave_height": sig_wave_height_val,
-            "freeboard": freeboard_val,
-            "mean_wave_period": mean_wave_period_val,
-            "mean_wave_dir": mean_wave_dir_val,
-            "wind_speed": wind_speed_val,
-            "wind_direction": wind_dir_val,
-        }
-        params["start_date"] = start_date
-        params["option"] = option
-
+    replaced_keys = (previous_df_1, previous_df_2, current_df_1, current_df_2)
     show_full_legend = (
         False if trigger_id is None or trigger_id == "dd_site_location" else True
     )
     full_legend = ogc.get_full_legend(show_full_legend)
-    show_dynamic_y_axis = trigger_id == "submit-button"
 
-    if utils.find_words_with_suffix(site_location_val, "Dawlish"):
-        api_url = utils.add_resource(DAWLISH_API_ROOT_ENDPOINT, "wave-overtopping")
-        api_url = utils.add_query_params(api_url, params)
+    if is_adjusted_forecast(trigger_id, submit_n_clicks):
+        params = get_query_params(
+            trigger_id,
+            submit_n_clicks,
+            site_location_val,
+            (
+                sig_wave_height_val,
+                freeboard_val,
+                mean_wave_period_val,
+                mean_wave_dir_val,
+                wind_speed_val,
+                wind_dir_val,
+            ),
+        )
+        current_df_1, current_df_2 = load_location_series(
+            site_location_val, current_df_1, current_df_2
+        )
         (
-            dawlish_seawall_crest_data,
-            dawlish_railway_line_data,
+            first_location_data,
+            second_location_data,
             forecast_start_date,
             forecast_end_date,
-        ) = get_dawlish_wave_overtopping(api_url)
-        (
-            swh_df,
-            swh_overtopping_times_df,
-            tidal_level_df,
-            tl_overtopping_times_df,
-            wind_speed_df,
-            ws_overtopping_times_df,
-        ) = get_all_features_data(DAWLISH_API_ROOT_ENDPOINT, params)
-
+        ) = get_overtopping_data(site_location_val, params)
+        first_location_data.attrs["params"] = params
+        first_location_data.attrs["site_location_val"] = site_location_val
+        first_location_data.attrs["changed_sliders"] = get_changed_sliders(
+            params, current_df_1.attrs.get("params", {})
+        )
         (
-            joined_dsc,
-            joined_drl,
             tmp_previous_df_1,
             tmp_current_df_1,
             tmp_previous_df_2,
             tmp_current_df_2,
         ) = get_final_overtopping_dfs(
-            dawlish_seawall_crest_data,
+            first_location_data,
             current_df_1,
-            dawlish_railway_line_data,
+            second_location_data,
             current_df_2,
             trigger_id,
             submit_n_clicks,
         )
-        fig_dawlish_seawall_crest = ogc.render_dawlish_seawall_crest_graph(joined_dsc)
-        fig_dawlish_railway_line = ogc.render_dawlish_railway_line_graph(joined_drl)
-
-        (
-            dfs_to_store,
-            final_prev_swh_df,
-            final_cur_swh_df,
-            final_prev_swh_ot_df,
-            final_cur_swh_ot_df,
-            final_prev_tl_df,
-            final_cur_tl_df,
-            final_prev_tl_ot_df,
-            final_cur_tl_ot_df,
-            final_prev_ws_df,
-            final_cur_ws_df,
-            final_prev_ws_ot_df,
-            final_cur_ws_ot_df,
-        ) = get_final_variables_dfs(
-            swh_df,
-            current_swh_df,
-            swh_overtopping_times_df,
-            current_swh_ot_df,
-            tidal_level_df,
-            curren_tl_df,
-            tl_overtopping_times_df,
-            current_tl_ot_df,
-            wind_speed_df,
-            current_ws_df,
-            ws_overtopping_times_df,
-            current_ws_ot_df,
-            trigger_id,
-            submit_n_clicks,
-        )
-        swh_fig, tidal_level_fig, wind_speed_fig = render_feature_line_plots(
-            "Dawlish", dfs_to_store, show_dynamic_y_axis
+        # Figures are fully rendered again when stored time series have expired or were evicted, as their points
+        # cannot become forecast points of the patched figures
+        fig1, fig2 = render_overtopping_graphs(
+            site_location_val,
+            tmp_previous_df_1,
+            tmp_current_df_1,
+            tmp_previous_df_2,
+            tmp_current_df_2,
+            INCREMENTAL_RENDERING
+            and trigger_id == "submit-button"
+            and not (current_df_1.empty or current_df_2.empty),
         )
-
+        fetched_at = first_location_data.attrs["fetched_at"]
     else:
-        api_url = utils.add_resource(PENZANCE_API_ROOT_ENDPOINT, "wave-overtopping")
-        api_url = utils.add_query_params(api_url, params)
-        (
-            data_penzance_seawall_crest,
-            data_penzance_seawall_crest_sheltered,
-            forecast_start_date,
-            forecast_end_date,
-        ) = get_penzance_wave_overtopping(api_url)
-
+        view = get_default_overtopping_view(site_location_val)
+        fig1, fig2 = view["figures"]
         (
-            swh_df,
-            swh_overtopping_times_df,
-            tidal_level_df,
-            tl_overtopping_times_df,
-            wind_speed_df,
-            ws_overtopping_times_df,
-        ) = get_all_features_data(PENZANCE_API_ROOT_ENDPOINT, params)
-
-        (
-            joined_psc,
-            joined_pscs,
             tmp_previous_df_1,
             tmp_current_df_1,
             tmp_previous_df_2,
             tmp_current_df_2,
-        ) = get_final_overtopping_dfs(
-            data_penzance_seawall_crest,
-            current_df_1,
-            data_penzance_seawall_crest_sheltered,
-            current_df_2,
-            trigger_id,
-            submit_n_clicks,
-        )
-        fig_penzance_seawall_crest = ogc.render_penzance_seawall_crest_graph(joined_psc)
-        fig_penzance_seawall_crest_sheltered = (
-            ogc.render_penzance_seawall_crest_sheltered_graph(joined_pscs)
-        )
+        ) = view["dataframes"]
+        forecast_start_date, forecast_end_date = view["forecast_range"]
+        fetched_at = view.get("fetched_at")
 
-        (
-            dfs_to_store,
-            final_prev_swh_df,
-            final_cur_swh_df,
-            final_prev_swh_ot_df,
-            final_cur_swh_ot_df,
-            final_prev_tl_df,
-            final_cur_tl_df,
-            final_prev_tl_ot_df,
-            final_cur_tl_ot_df,
-            final_prev_ws_df,
-            final_cur_ws_df,
-            final_prev_ws_ot_df,
-            final_cur_ws_ot_df,
-        ) = get_final_variables_dfs(
-            swh_df,
-            current_swh_df,
-            swh_overtopping_times_df,
-            current_swh_ot_df,
-            tidal_level_df,
-            curren_tl_df,
-            tl_overtopping_times_df,
-            current_tl_ot_df,
-            wind_speed_df,
-            current_ws_df,
-            ws_overtopping_times_df,
-            current_ws_ot_df,
-            trigger_id,
-            submit_n_clicks,
-        )
-        swh_fig, tidal_level_fig, wind_speed_fig = render_feature_line_plots(
-            "Penzance", dfs_to_store, show_dynamic_y_axis
-        )
-
-    fig1 = (
-        fig_dawlish_seawall_crest
-        if utils.find_words_with_suffix(site_location_val, "Dawlish")
-        else fig_penzance_seawall_crest
-    )
-    fig2 = (
-        fig_penzance_seawall_crest_sheltered
-        if utils.find_words_with_suffix(site_location_val, "Penzance")
-        else fig_dawlish_railway_line
+    (
+        previous_df_1_key,
+        previous_df_2_key,
+        current_df_1_key,
+        current_df_2_key,
+    ) = session_store.save_series(
+        tmp_previous_df_1,
+        tmp_previous_df_2,
+        tmp_current_df_1,
+        tmp_current_df_2,
+        replaced_keys=replaced_keys,
     )
+    metrics.record_timing("overtopping_stage", time.perf_counter() - started_at)
+    metrics.increment("background_jobs_completed")
 
     return (
         fig1,
         fig2,
-        tmp_previous_df_1.to_dict("records"),
-        tmp_previous_df_2.to_dict("records"),
-        tmp_current_df_1.to_dict("records"),
-        tmp_current_df_2.to_dict("records"),
+        previous_df_1_key,
+        previous_df_2_key,
+        current_df_1_key,
+        current_df_2_key,
         forecast_start_date,
         forecast_end_date,
+        ogc.get_data_age(
+            None
+            if site_location_val in historical_datasets.HISTORICAL_OPTIONS
+            else fetched_at
+        ),
         full_legend,
-        swh_fig,
-        tidal_level_fig,
-        wind_speed_fig,
-        final_prev_swh_df.to_dict("records"),
-        final_cur_swh_df.to_dict("records"),
-        final_prev_swh_ot_df.to_dict("records"),
-        final_cur_swh_ot_df.to_dict("records"),
-        final_prev_tl_df.to_dict("records"),
-        final_cur_tl_df.to_dict("records"),
-        final_prev_tl_ot_df.to_dict("records"),
-        final_cur_tl_ot_df.to_dict("records"),
-        final_prev_ws_df.to_dict("records"),
-        final_cur_ws_df.to_dict("records"),
-        final_prev_ws_ot_df.to_dict("records"),
-        final_cur_ws_ot_df.to_dict("records"),
         "",
     )
 
 
-@app.callback(
-    Output("sig-wave-height", "value"),
-    Input("sig-wave-height", "value"),
-    Input("swh-increase-btn", "n_clicks"),
-    Input("swh-decrease-btn", "n_clicks"),
-    Input("reset-button", "n_clicks"),
-    Input("wad-reset-button", "n_clicks"),
-    Input("dd_site_location", "value"),
-    State("sig-wave-height", "step"),
-)
-def update_slider(
-    slider_value,
-    n_clicks_inc,
-    n_clicks_dec,
-    n_clicks_reset,
-    n_clicks_reset_wad,
-    site_location_value,
-    current_step,
-):
-    """Callback for significant wave height slider
+async def get_feature_and_overtopping_data(feature_plot, site_location_val, params):
+    """Get wave or atmospheric variable data and wave overtopping data of selected location concurrently. Wave
+    overtopping request is shared with overtopping stage through forecast cache and request coalescing.
 
     Args:
-        slider_value (integer): Significant wave height slider's value
-        n_clicks_inc (integer): Number of clicks of increase button
-        n_clicks_dec (integer): Number of clicks of decrease button
-        n_clicks_reset (integer): Number of clicks of reset button
-        n_clicks_reset_wad (integer): Number of clicks of reset button for wave variables sliders
-        site_location_value (string): Dropdown box's value
-        current_step (integer): Current slider's value
+        feature_plot (dict): Feature plot settings from FEATURE_PLOTS
+        site_location_val (string): Site location value of dropdown box
+        params (dict): Query parameters
 
     Returns:
-        integer: Adjusted slider's value
+        TimeSeries: Feature data, first location and second location overtopping data
     """
 
-    if (
-        n_clicks_inc == 0
-        or n_clicks_dec == 0
-        or n_clicks_reset == 0
-        or n_clicks_reset_wad == 0
-    ):
-        return PERCENTAGE_DEFAULT_VALUE
+    feature_df, (first_location_data, second_location_data, _, _) = await asyncio.gather(
+        get_features_data(
+            get_root_endpoint(site_location_val),
+            feature_plot["resource_name"],
+            params,
+            feature_plot["feature_list_name"],
+            feature_plot["feature_name"],
+        ),
+        get_wave_overtopping(site_location_val, params),
+    )
+    return feature_df, first_location_data, second_location_data
 
-    trigger_id = ctx.triggered_id
 
-    if trigger_id == "swh-increase-btn":
-        new_value = slider_value + current_step
-        return new_value
-    elif trigger_id == "swh-decrease-btn":
-        new_value = slider_value - current_step
-        return new_value
-    elif (
-        trigger_id == "reset-button"
-        or trigger_id == "wad-reset-button"
-        or trigger_id == "dd_site_location"
-    ):
-        return PERCENTAGE_DEFAULT_VALUE
-    else:
-        return slider_value
+def get_feature_data(feature_plot, site_location_val, params):
+    """Get wave or atmospheric variable data of selected location from backend API. Overtopping events times are
+    derived from wave overtopping data.
 
+    Args:
+        feature_plot (dict): Feature plot settings from FEATURE_PLOTS
+        site_location_val (string): Site location value of dropdown box
+        params (dict): Query parameters
 
-@app.callback(
-    Output("freeboard", "value"),
-    Input("freeboard", "value"),
-    Input("fb-increase-btn", "n_clicks"),
-    Input("fb-decrease-btn", "n_clicks"),
-    Input("reset-button", "n_clicks"),
-    Input("wad-reset-button", "n_clicks"),
-    Input("dd_site_location", "value"),
-    State("freeboard", "step"),
-)
-def update_slider(
-    slider_value,
-    n_clicks_inc,
-    n_clicks_dec,
-    n_clicks_reset,
-    n_clicks_reset_wad,
-    site_location_value,
-    current_step,
+    Returns:
+        TimeSeries: Feature data and overtopping events times
+    """
+
+    feature_df, first_location_data, second_location_data = api_client.run(
+        get_feature_and_overtopping_data(feature_plot, site_location_val, params)
+    )
+    overtopping_times_df = utils.get_overtopping_events_times(
+        feature_df,
+        [first_location_data, second_location_data],
+        feature_plot["feature_name"],
+    )
+    return feature_df, overtopping_times_df
+
+
+def get_unchanged_feature_data(
+    feature_plot, site_location_val, params, current_feature_df
 ):
-    """Callback for freeboard slider
+    """Reuse wave or atmospheric variable data that no changed slider affects. Only overtopping events times are
+    computed again, from overtopping events of current request.
 
     Args:
-        slider_value (integer): Freeboard slider's value
-        n_clicks_inc (integer): Number of clicks of increase button
-        n_clicks_dec (integer): Number of clicks of decrease button
-        n_clicks_reset (integer): Number of clicks of reset button
-        n_clicks_reset_wad (integer): Number of clicks of reset button for wave variables sliders
-        site_location_value (string): Dropdown box's value
-        current_step (integer): Current slider's value
+        feature_plot (dict): Feature plot settings from FEATURE_PLOTS
+        site_location_val (string): Site location value of dropdown box
+        params (dict): Query parameters
+        current_feature_df (TimeSeries): Feature data of previous request
 
     Returns:
-        integer: Adjusted slider's value
+        TimeSeries: Feature data and overtopping events times
     """
 
-    if (
-        n_clicks_inc == 0
-        or n_clicks_dec == 0
-        or n_clicks_reset == 0
-        or n_clicks_reset_wad == 0
-    ):
-        return PERCENTAGE_DEFAULT_VALUE
+    metrics.increment("feature_requests_skipped")
+    first_location_data, second_location_data, _, _ = get_overtopping_data(
+        site_location_val, params
+    )
+    feature_df = current_feature_df.take(slice(None), [feature_plot["feature_name"]])
+    overtopping_times_df = utils.get_overtopping_events_times(
+        feature_df,
+        [first_location_data, second_location_data],
+        feature_plot["feature_name"],
+    )
+    return feature_df, overtopping_times_df
 
-    trigger_id = ctx.triggered_id
 
-    if trigger_id == "fb-increase-btn":
-        new_value = slider_value + current_step
-        return new_value
-    elif trigger_id == "fb-decrease-btn":
-        new_value = slider_value - current_step
-        return new_value
-    elif (
-        trigger_id == "reset-button"
-        or trigger_id == "wad-reset-button"
-        or trigger_id == "dd_site_location"
-    ):
-        return PERCENTAGE_DEFAULT_VALUE
-    else:
-        return slider_value
+def get_default_feature_view(feature_plot, site_location_val):
+    """Get wave or atmospheric variable graph and data displayed when picking a location. Views are cached as long as
+    the data they are rendered from.
+
+    Args:
+        feature_plot (dict): Feature plot settings from FEATURE_PLOTS
+        site_location_val (string): Site location value of dropdown box
 
+    Returns:
+        dict: Feature line plot, feature and overtopping events times series and time data was fetched
+    """
 
-@app.callback(
-    Output("mean-wave-period", "value"),
-    Input("mean-wave-period", "value"),
-    Input("mwp-increase-btn", "n_clicks"),
-    Input("mwp-decrease-btn", "n_clicks"),
-    Input("reset-button", "n_clicks"),
-    Input("wad-reset-button", "n_clicks"),
-    Input("dd_site_location", "value"),
-    State("mean-wave-period", "step"),
-)
-def update_slider(
-    slider_value,
-    n_clicks_inc,
-    n_clicks_dec,
-    n_clicks_reset,
-    n_clicks_reset_wad,
-    site_location_value,
-    current_step,
+    view = historical_datasets.get_historical_view(
+        site_location_val, feature_plot["feature_name"]
+    )
+    if view is not None:
+        return view
+
+    params = get_query_params(None, None, site_location_val, None)
+    api_url = utils.add_query_params(
+        utils.add_resource(
+            get_root_endpoint(site_location_val), feature_plot["resource_name"]
+        ),
+        params,
+    )
+    view = forecast_cache.get_rendered_view(feature_plot["feature_name"], api_url)
+    if view is not None:
+        return view
+
+    feature_df, overtopping_times_df = get_feature_data(
+        feature_plot, site_location_val, params
+    )
+    feature_df.stage = get_overtopping_data_stage(None)
+    feature_df.attrs["params"] = params
+    feature_df.attrs["site_location_val"] = site_location_val
+    dataframes = utils.get_dataframes_to_save(
+        None, None, [feature_df, None, overtopping_times_df, None]
+    )
+    final_prev_df, final_cur_df, final_prev_ot_df, final_cur_ot_df = dataframes
+    feature_fig = fc.render_feature_plot(
+        get_location_name(site_location_val) + feature_plot["title"],
+        final_prev_df,
+        final_cur_df,
+        feature_plot["feature_name"],
+        feature_plot["features_description"],
+        OVERTOPPING_EVENTS_DESCRIPTION,
+        feature_plot["y_min_value"],
+        feature_plot["y_max_value"],
+        final_prev_ot_df,
+        final_cur_ot_df,
+        False,
+    )
+    view = {
+        "figure": utils.encode_figure(feature_fig),
+        "dataframes": dataframes,
+        "fetched_at": feature_df.attrs["fetched_at"],
+    }
+    if not feature_df.empty:
+        forecast_cache.cache_rendered_view(feature_plot["feature_name"], api_url, view)
+    return view
+
+
+def submit_feature_values(
+    feature_plot,
+    trigger_id,
+    submit_n_clicks,
+    site_location_val,
+    slider_values,
+    current_feature_df,
+    current_feature_ot_df,
+    replaced_keys=(),
 ):
-    """Callback for mean wave period slider
+    """Render wave or atmospheric variable graph when picking a location or submitting any variable
 
     Args:
-        slider_value (integer): Mean wave period slider's value
-        n_clicks_inc (integer):  Number of clicks of increase button
-        n_clicks_dec (integer): Number of clicks of decrease button
-        n_clicks_reset (integer): Number of clicks of reset button
-        n_clicks_reset_wad (integer): Number of clicks of reset button for wave variables sliders
-        site_location_value (string): Dropdown box's value
-        current_step (integer):  Current slider's value
+        feature_plot (dict): Feature plot settings from FEATURE_PLOTS
+        trigger_id (string): Element's id which has triggered an event
+        submit_n_clicks (integer): Number of clicks of submit button
+        site_location_val (string): Site location value of dropdown box
+        slider_values (tuple): Significant wave height, freeboard, mean wave period, mean wave direction, wind speed and wind direction values
+        current_feature_df (string): Session store key of feature time series
+        current_feature_ot_df (string): Session store key of forecast overtopping events times of feature data
+        replaced_keys (tuple): Session store keys of feature and overtopping events times data kept by browser, which
+            are deleted when new data is saved
 
     Returns:
-        integer: Adjusted slider's value
+        Tuple: Feature line plot figure and session store keys of feature and overtopping events times data
     """
 
-    if (
-        n_clicks_inc == 0
-        or n_clicks_dec == 0
-        or n_clicks_reset == 0
-        or n_clicks_reset_wad == 0
+    started_at = time.perf_counter()
+    if not is_adjusted_forecast(trigger_id, submit_n_clicks):
+        view = get_default_feature_view(feature_plot, site_location_val)
+        keys = session_store.save_series(
+            *view["dataframes"], replaced_keys=replaced_keys
+        )
+        record_feature_stage_timing(feature_plot, started_at)
+        return (view["figure"], *keys)
+
+    params = get_query_params(
+        trigger_id, submit_n_clicks, site_location_val, slider_values
+    )
+    current_feature_df, current_feature_ot_df = load_location_series(
+        site_location_val, current_feature_df, current_feature_ot_df
+    )
+    if is_feature_affected(
+        feature_plot["feature_name"],
+        params,
+        current_feature_df.attrs.get("params", {}),
     ):
-        return PERCENTAGE_DEFAULT_VALUE
+        feature_df, overtopping_times_df = get_feature_data(
+            feature_plot, site_location_val, params
+        )
+    else:
+        feature_df, overtopping_times_df = get_unchanged_feature_data(
+            feature_plot, site_location_val, params, current_feature_df
+        )
+    feature_df.stage = get_overtopping_data_stage(trigger_id)
+    feature_df.attrs["params"] = params
+    feature_df.attrs["site_location_val"] = site_location_val
 
-    trigger_id = ctx.triggered_id
+    (
+        final_prev_df,
+        final_cur_df,
+        final_prev_ot_df,
+        final_cur_ot_df,
+    ) = utils.get_dataframes_to_save(
+        submit_n_clicks,
+        trigger_id,
+        [feature_df, current_feature_df, overtopping_times_df, current_feature_ot_df],
+    )
 
-    if trigger_id == "mwp-increase-btn":
-        new_value = slider_value + current_step
-        return new_value
-    elif trigger_id == "mwp-decrease-btn":
-        new_value = slider_value - current_step
-        return new_value
-    elif (
-        trigger_id == "reset-button"
-        or trigger_id == "wad-reset-button"
-        or trigger_id == "dd_site_location"
+    # Figure is fully rendered again when stored time series has expired or was evicted
+    if (
+        INCREMENTAL_RENDERING
+        and trigger_id == "submit-button"
+        and not current_feature_df.empty
     ):
-        return PERCENTAGE_DEFAULT_VALUE
+        feature_fig = fc.patch_feature_plot(
+            final_cur_df,
+            feature_plot["feature_name"],
+            feature_plot["features_description"],
+            OVERTOPPING_EVENTS_DESCRIPTION,
+            final_cur_ot_df,
+        )
     else:
-        return slider_value
+        feature_fig = utils.encode_figure(
+            fc.render_feature_plot(
+                get_location_name(site_location_val) + feature_plot["title"],
+                final_prev_df,
+                final_cur_df,
+                feature_plot["feature_name"],
+                feature_plot["features_description"],
+                OVERTOPPING_EVENTS_DESCRIPTION,
+                feature_plot["y_min_value"],
+                feature_plot["y_max_value"],
+                final_prev_ot_df,
+                final_cur_ot_df,
+                trigger_id == "submit-button",
+            )
+        )
 
+    keys = session_store.save_series(
+        final_prev_df,
+        final_cur_df,
+        final_prev_ot_df,
+        final_cur_ot_df,
+        replaced_keys=replaced_keys,
+    )
+    record_feature_stage_timing(feature_plot, started_at)
 
-@app.callback(
-    Output("mean-wave-direction", "value"),
-    Input("mean-wave-direction", "value"),
-    Input("mwd-increase-btn", "n_clicks"),
-    Input("mwd-decrease-btn", "n_clicks"),
-    Input("reset-button", "n_clicks"),
-    Input("mwd-reset-button", "n_clicks"),
+    return (feature_fig, *keys)
+
+
+def record_feature_stage_timing(feature_plot, started_at):
+    """Record duration of a completed wave or atmospheric variable stage
+
+    Args:
+        feature_plot (dict): Feature plot settings from FEATURE_PLOTS
+        started_at (float): Stage's start time returned by time.perf_counter
+    """
+
+    metrics.record_timing(
+        feature_plot["feature_name"] + "_stage", time.perf_counter() - started_at
+    )
+    metrics.increment("background_jobs_completed")
+
+
+def register_feature_callback(feature_plot):
+    """Register background callback that renders a wave or atmospheric variable graph
+
+    Args:
+        feature_plot (dict): Feature plot settings from FEATURE_PLOTS
+    """
+
+    store_id = feature_plot["store_id"]
+
+    @app.callback(
+        Output(feature_plot["graph_id"], "figure"),
+        Output("previous-" + store_id, "data"),
+        Output("current-" + store_id, "data"),
+        Output("previous-" + store_id + "-ot", "data"),
+        Output("current-" + store_id + "-ot", "data"),
+        Input("submit-button", "n_clicks"),
+        Input("dd_site_location", "value"),
+        State(ogc.get_slider_id("sig-wave-height"), "value"),
+        State(ogc.get_slider_id("freeboard"), "value"),
+        State(ogc.get_slider_id("mean-wave-period"), "value"),
+        State(ogc.get_slider_id("mean-wave-direction"), "value"),
+        State(ogc.get_slider_id("wind-speed"), "value"),
+        State(ogc.get_slider_id("wind-direction"), "value"),
+        State("previous-" + store_id, "data"),
+        State("current-" + store_id, "data"),
+        State("previous-" + store_id + "-ot", "data"),
+        State("current-" + store_id + "-ot", "data"),
+        background=True,
+        interval=BACKGROUND_CALLBACK_INTERVAL,
+    )
+    def submit_feature_slider_values(
+        submit_n_clicks,
+        site_location_val,
+        sig_wave_height_val,
+        freeboard_val,
+        mean_wave_period_val,
+        mean_wave_dir_val,
+        wind_speed_val,
+        wind_dir_val,
+        previous_feature_df,
+        current_feature_df,
+        previous_feature_ot_df,
+        current_feature_ot_df,
+    ):
+        return submit_feature_values(
+            feature_plot,
+            ctx.triggered_id,
+            submit_n_clicks,
+            site_location_val,
+            (
+                sig_wave_height_val,
+                freeboard_val,
+                mean_wave_period_val,
+                mean_wave_dir_val,
+                wind_speed_val,
+                wind_dir_val,
+            ),
+            current_feature_df,
+            current_feature_ot_df,
+            (
+                previous_feature_df,
+                current_feature_df,
+                previous_feature_ot_df,
+                current_feature_ot_df,
+            ),
+        )
+
+
+for feature_plot in FEATURE_PLOTS:
+    register_feature_callback(feature_plot)
+
+
+app.clientside_callback(
+    ClientsideFunction(namespace="splash", function_name="measure_render_timings"),
+    Output("render-timings", "data"),
+    Input("submit-button", "n_clicks"),
     Input("dd_site_location", "value"),
-    State("mean-wave-direction", "step"),
+    Input("scatter-plot-rig1", "figure"),
+    Input("scatter-plot-rig2", "figure"),
+    Input("line-plot-swh", "figure"),
+    Input("line-plot-tidal-level", "figure"),
+    Input("line-plot-wind-speed", "figure"),
+)
+
+
+app.clientside_callback(
+    ClientsideFunction(namespace="splash", function_name="get_session_id"),
+    Output("session-id", "data"),
+    Input("session-id", "modified_timestamp"),
+    State("session-id", "data"),
 )
-def update_slider(
-    slider_value,
-    n_clicks_inc,
-    n_clicks_dec,
-    n_clicks_reset,
-    n_clicks_reset_mwd,
-    site_location_value,
-    current_step,
-):
-    """Callback for mean wave direction slider
+
+
+@app.callback(Input("render-timings", "data"), prevent_initial_call=True)
+def record_render_timings(render_timings):
+    """Callback to record time to first chart and time to render all charts measured in the browser
 
     Args:
-        slider_value (integer): Mean wave direction slider's value
-        n_clicks_inc (integer):  Number of clicks of increase button
-        n_clicks_dec (integer): Number of clicks of decrease button
-        n_clicks_reset (integer): Number of clicks of reset button
-        n_clicks_reset_mwd (integer): Number of clicks of reset button for wind direction variable slider
-        site_location_value (string): Dropdown box's value
-        current_step (integer): Current slider's value
+        render_timings (dict): Seconds from picking a location or submitting variables until first chart and all charts were rendered
+    """
+
+    metrics.record_timing("time_to_first_chart", render_timings["time_to_first_chart"])
+    metrics.record_timing("time_to_complete", render_timings["time_to_complete"])
+
+
+def get_neighbour_scenarios_urls(site_location_val, params, changed_sliders):
+    """Get query urls of scenarios one slider step away from submitted scenario
+
+    Args:
+        site_location_val (string): Site location value of dropdown box
+        params (dict): Query parameters of submitted scenario
+        changed_sliders (list): Ids of sliders moved before submit
 
     Returns:
-        integer: Adjusted slider's value
+        list: Query urls of wave overtopping and affected wave and atmospheric variables of each neighbour scenario
     """
 
-    if (
-        n_clicks_inc == 0
-        or n_clicks_dec == 0
-        or n_clicks_reset == 0
-        or n_clicks_reset_mwd == 0
-    ):
-        return DEGREE_DEFAULT_VALUE
+    root_endpoint = get_root_endpoint(site_location_val)
+    resource_names = {
+        feature_plot["feature_name"]: feature_plot["resource_name"]
+        for feature_plot in FEATURE_PLOTS
+    }
+    api_urls = []
+    for slider_id in changed_sliders:
+        dependency = SLIDER_DEPENDENCIES[slider_id]
+        for direction in [1, -1]:
+            value = params[dependency["query_param"]] + direction * dependency["step"]
+            if not dependency["min_value"] <= value <= dependency["max_value"]:
+                continue
+
+            neighbour_params = {**params, dependency["query_param"]: value}
+            for resource_name in ["wave-overtopping"] + [
+                resource_names[feature_name] for feature_name in dependency["features"]
+            ]:
+                api_urls.append(
+                    utils.add_query_params(
+                        utils.add_resource(root_endpoint, resource_name),
+                        neighbour_params,
+                    )
+                )
+    return api_urls
 
-    trigger_id = ctx.triggered_id
 
-    if trigger_id == "mwd-increase-btn":
-        new_value = slider_value + current_step
-        return new_value
-    elif trigger_id == "mwd-decrease-btn":
-        new_value = slider_value - current_step
-        return new_value
-    elif (
-        trigger_id == "reset-button"
-        or trigger_id == "mwd-reset-button"
-        or trigger_id == "dd_site_location"
-    ):
-        return DEGREE_DEFAULT_VALUE
-    else:
-        return slider_value
+@app.callback(
+    Input("current-dataframe-1", "data"),
+    State("session-id", "data"),
+    State("dd_site_location", "value"),
+    prevent_initial_call=True,
+)
+def prefetch_neighbour_scenarios(current_df_1, session_id, site_location_val):
+    """Callback to prefetch scenarios one step away from last moved slider after a submit completes
+
+    Args:
+        current_df_1 (string): Session store key of adjusted forecast overtopping data of first location
+        session_id (string): Browser session's id
+        site_location_val (string): Site location value of dropdown box
+    """
+
+    if not SPECULATIVE_PREFETCH or session_id is None:
+        return
+
+    (current_df_1,) = session_store.load_series(current_df_1)
+    changed_sliders = current_df_1.attrs.get("changed_sliders", [])
+    if not changed_sliders:
+        return
+
+    prefetcher.prefetch(
+        session_id,
+        get_neighbour_scenarios_urls(
+            site_location_val, current_df_1.attrs["params"], changed_sliders
+        ),
+        request_data,
+        api_client.get_client_setting("API_REQUEST_DEADLINE", API_REQUEST_DEADLINE),
+    )
 
 
 @app.callback(
-    Output("wind-speed", "value"),
-    Input("wind-speed", "value"),
-    Input("ws-increase-btn", "n_clicks"),
-    Input("ws-decrease-btn", "n_clicks"),
-    Input("reset-button", "n_clicks"),
-    Input("aad-reset-button", "n_clicks"),
     Input("dd_site_location", "value"),
-    State("wind-speed", "step"),
+    State("session-id", "data"),
+    prevent_initial_call=True,
 )
-def update_slider(
-    slider_value,
-    n_clicks_inc,
-    n_clicks_dec,
-    n_clicks_reset,
-    n_clicks_reset_aad,
-    site_location_value,
-    current_step,
-):
-    """Callback for wind speed slider
+def cancel_prefetch(site_location_val, session_id):
+    """Callback to cancel prefetch requests of previous location
 
     Args:
-        slider_value (integer): Wind speed slider's value
-        n_clicks_inc (integer):  Number of clicks of increase button
-        n_clicks_dec (integer): Number of clicks of decrease button
-        n_clicks_reset (integer): Number of clicks of reset button
-        n_clicks_reset_aad (integer): Number of clicks of reset button for atmospheric variables sliders
-        site_location_value (string): Dropdown box's value
-        current_step (integer): Current slider's value
+        site_location_val (string): Site location value of dropdown box
+        session_id (string): Browser session's id
+    """
+
+    if SPECULATIVE_PREFETCH and session_id is not None:
+        prefetcher.cancel(session_id)
+
+
+def get_overtopping_locations_names(site_location_val):
+    """Get names of first and second overtopping location of selected option
+
+    Args:
+        site_location_val (string): Site location value of dropdown box
 
     Returns:
-        integer: Adjusted slider's value
+        tuple: Names of first and second location
     """
 
-    if (
-        n_clicks_inc == 0
-        or n_clicks_dec == 0
-        or n_clicks_reset == 0
-        or n_clicks_reset_aad == 0
-    ):
-        return PERCENTAGE_DEFAULT_VALUE
+    if get_location_name(site_location_val) == "Dawlish":
+        return ("Dawlish Seawall Crest", "Dawlish Railway Line")
+    return ("Penzance Seawall Crest", "Penzance Seawall Crest (sheltered)")
 
-    trigger_id = ctx.triggered_id
 
-    if trigger_id == "ws-increase-btn":
-        new_value = slider_value + current_step
-        return new_value
-    elif trigger_id == "ws-decrease-btn":
-        new_value = slider_value - current_step
-        return new_value
-    elif (
-        trigger_id == "reset-button"
-        or trigger_id == "aad-reset-button"
-        or trigger_id == "dd_site_location"
-    ):
-        return PERCENTAGE_DEFAULT_VALUE
-    else:
-        return slider_value
+def get_sweep_values(value_range, step):
+    """Get values of a swept variable
+
+    Args:
+        value_range (list): Lowest and highest values
+        step (integer): Difference between consecutive values
+
+    Returns:
+        list: Swept values
+    """
+
+    start_value, end_value = value_range
+    return list(range(start_value, end_value + 1, max(int(step or 1), 1)))
+
+
+def get_total_overtopping_count(overtopping_df):
+    """Get total overtopping occurrences of a forecast
+
+    Args:
+        overtopping_df (TimeSeries): Overtopping events time series
+
+    Returns:
+        float: Sum of overtopping counts, NaN when there is no data
+    """
+
+    if overtopping_df.empty:
+        return np.nan
+    return float(overtopping_df["overtopping_count"].sum(dtype=np.float64))
+
+
+async def run_sweep_scenarios(site_location_val, scenarios_params, on_scenario_done):
+    """Request wave overtopping of every sweep scenario concurrently, bounded by SWEEP_CONCURRENCY
+
+    Args:
+        site_location_val (string): Site location value of dropdown box
+        scenarios_params (list): Query parameters of each scenario
+        on_scenario_done (function): Called on HTTP client's event loop with scenario's index and total overtopping
+            occurrences of each location when a scenario completes, so it must not block
+    """
+
+    semaphore = asyncio.Semaphore(
+        api_client.get_client_setting("SWEEP_CONCURRENCY", SWEEP_CONCURRENCY)
+    )
+    resource_url = utils.add_resource(
+        get_root_endpoint(site_location_val), "wave-overtopping"
+    )
+    get_wave_overtopping = (
+        get_dawlish_wave_overtopping
+        if get_location_name(site_location_val) == "Dawlish"
+        else get_penzance_wave_overtopping
+    )
+
+    async def run_scenario(index, params):
+        async with semaphore:
+            first_location_data, second_location_data, _, _ = (
+                await get_wave_overtopping(utils.add_query_params(resource_url, params))
+            )
+        on_scenario_done(
+            index,
+            [
+                get_total_overtopping_count(first_location_data),
+                get_total_overtopping_count(second_location_data),
+            ],
+        )
+
+    await asyncio.gather(
+        *[run_scenario(index, params) for index, params in enumerate(scenarios_params)]
+    )
 
 
 @app.callback(
-    Output("wind-direction", "value"),
-    Input("wind-direction", "value"),
-    Input("wd-increase-btn", "n_clicks"),
-    Input("wd-decrease-btn", "n_clicks"),
-    Input("reset-button", "n_clicks"),
-    Input("wd-reset-button", "n_clicks"),
-    Input("dd_site_location", "value"),
-    State("wind-direction", "step"),
+    Output("sweep-plot", "figure"),
+    Input("sweep-button", "n_clicks"),
+    State("dd_site_location", "value"),
+    State(ogc.get_slider_id("sig-wave-height"), "value"),
+    State(ogc.get_slider_id("freeboard"), "value"),
+    State(ogc.get_slider_id("mean-wave-period"), "value"),
+    State(ogc.get_slider_id("mean-wave-direction"), "value"),
+    State(ogc.get_slider_id("wind-speed"), "value"),
+    State(ogc.get_slider_id("wind-direction"), "value"),
+    State("sweep-variable-1", "value"),
+    State("sweep-range-1", "value"),
+    State("sweep-step-1", "value"),
+    State("sweep-variable-2", "value"),
+    State("sweep-range-2", "value"),
+    State("sweep-step-2", "value"),
+    background=True,
+    interval=BACKGROUND_CALLBACK_INTERVAL,
+    progress=Output("sweep-plot", "figure"),
+    running=[(Output("sweep-button", "disabled"), True, False)],
+    cancel=[Input("dd_site_location", "value")],
+    prevent_initial_call=True,
 )
-def update_slider(
-    slider_value,
-    n_clicks_inc,
-    n_clicks_dec,
-    n_clicks_reset,
-    n_clicks_reset_wd,
-    site_location_value,
-    current_step,
+def run_sensitivity_sweep(
+    set_progress,
+    sweep_n_clicks,
+    site_location_val,
+    sig_wave_height_val,
+    freeboard_val,
+    mean_wave_period_val,
+    mean_wave_dir_val,
+    wind_speed_val,
+    wind_dir_val,
+    sweep_variable_1,
+    sweep_range_1,
+    sweep_step_1,
+    sweep_variable_2,
+    sweep_range_2,
+    sweep_step_2,
 ):
-    """Callback for wind direction slider
+    """Callback to run a sensitivity sweep over one or two variables. Plot is updated as scenarios complete.
 
     Args:
-        slider_value (integer): Wind direction slider's value
-        n_clicks_inc (integer):  Number of clicks of increase button
-        n_clicks_dec (integer): Number of clicks of decrease button
-        n_clicks_reset (integer): Number of clicks of reset button
-        n_clicks_reset_wd (integer):  Number of clicks of reset button for wind direction variable slider
-        site_location_value (string): Dropdown box's value
-        current_step (integer): Current slider's value
+        set_progress (function): Function to send partial plot to the browser
+        sweep_n_clicks (integer): Number of clicks of run sweep button
+        site_location_val (string): Site location value of dropdown box
+        sig_wave_height_val (integer): Significant wave height value
+        freeboard_val (integer): Freeboard value
+        mean_wave_period_val (integer): Mean wave period value
+        mean_wave_dir_val (integer): Mean wave direction value
+        wind_speed_val (integer): Wind speed value
+        wind_dir_val (integer): Wind direction value
+        sweep_variable_1 (string): Slider id of first swept variable
+        sweep_range_1 (list): Lowest and highest values of first swept variable
+        sweep_step_1 (integer): Step of first swept variable
+        sweep_variable_2 (string): Slider id of second swept variable, None to sweep one variable
+        sweep_range_2 (list): Lowest and highest values of second swept variable
+        sweep_step_2 (integer): Step of second swept variable
 
     Returns:
-        integer: Adjusted slider's value
+        Figure: Response curve of one variable or heatmap of two variables
     """
 
-    if (
-        n_clicks_inc == 0
-        or n_clicks_dec == 0
-        or n_clicks_reset == 0
-        or n_clicks_reset_wd == 0
-    ):
-        return DEGREE_DEFAULT_VALUE
+    base_params = get_query_params(
+        "submit-button",
+        sweep_n_clicks,
+        site_location_val,
+        (
+            sig_wave_height_val,
+            freeboard_val,
+            mean_wave_period_val,
+            mean_wave_dir_val,
+            wind_speed_val,
+            wind_dir_val,
+        ),
+    )
+    variable_titles = {
+        option["value"]: option["label"] for option in ogc.SWEEP_VARIABLE_OPTIONS
+    }
+    x_values = get_sweep_values(sweep_range_1, sweep_step_1)
+    query_param_1 = SLIDER_DEPENDENCIES[sweep_variable_1]["query_param"]
+    is_heatmap = sweep_variable_2 is not None and sweep_variable_2 != sweep_variable_1
+    y_values = get_sweep_values(sweep_range_2, sweep_step_2) if is_heatmap else [None]
+    if len(x_values) * len(y_values) > SWEEP_MAX_SCENARIOS:
+        return go.Figure(
+            layout=dict(
+                title=f"Sweep is limited to {SWEEP_MAX_SCENARIOS} scenarios, increase step or reduce range"
+            )
+        )
 
-    trigger_id = ctx.triggered_id
+    scenarios_params = []
+    for y_value in y_values:
+        for x_value in x_values:
+            params = {**base_params, query_param_1: x_value}
+            if is_heatmap:
+                params[SLIDER_DEPENDENCIES[sweep_variable_2]["query_param"]] = y_value
+            scenarios_params.append(params)
+
+    # Rows are locations, columns are scenarios ordered by second then first variable
+    total_counts = np.full((2, len(scenarios_params)), np.nan)
+
+    def render_sweep_plot():
+        if is_heatmap:
+            return ogc.render_sweep_heatmap(
+                variable_titles[sweep_variable_1],
+                variable_titles[sweep_variable_2],
+                x_values,
+                y_values,
+                total_counts.sum(axis=0).reshape(len(y_values), len(x_values)),
+            )
+        return ogc.render_sweep_curve(
+            variable_titles[sweep_variable_1],
+            x_values,
+            get_overtopping_locations_names(site_location_val),
+            total_counts,
+        )
 
-    if trigger_id == "wd-increase-btn":
-        new_value = slider_value + current_step
-        return new_value
-    elif trigger_id == "wd-decrease-btn":
-        new_value = slider_value - current_step
-        return new_value
-    elif (
-        trigger_id == "reset-button"
-        or trigger_id == "wd-reset-button"
-        or trigger_id == "dd_site_location"
-    ):
-        return DEGREE_DEFAULT_VALUE
-    else:
-        return slider_value
+    # Scenarios complete on HTTP client's event loop, which is shared by every request of the process, so they are only
+    # queued there. Plots are rendered and sent to the browser from this thread.
+    completed_scenarios = queue.SimpleQueue()
 
+    def on_scenario_done(index, location_counts):
+        completed_scenarios.put((index, location_counts))
+
+    future = api_client.submit(
+        run_sweep_scenarios(site_location_val, scenarios_params, on_scenario_done)
+    )
+    while True:
+        done, _ = concurrent.futures.wait([future], timeout=SWEEP_PROGRESS_INTERVAL)
+        has_completed_scenarios = not completed_scenarios.empty()
+        while not completed_scenarios.empty():
+            index, location_counts = completed_scenarios.get()
+            total_counts[:, index] = location_counts
+        if done:
+            break
+        if has_completed_scenarios:
+            set_progress(render_sweep_plot())
+    future.result()
+    metrics.increment("sweep_scenarios", len(scenarios_params))
+
+    return render_sweep_plot()
+
+
+for sweep_index in [1, 2]:
+    app.clientside_callback(
+        ClientsideFunction(namespace="splash", function_name="update_sweep_range"),
+        Output(f"sweep-range-{sweep_index}", "min"),
+        Output(f"sweep-range-{sweep_index}", "max"),
+        Output(f"sweep-range-{sweep_index}", "value"),
+        Input(f"sweep-variable-{sweep_index}", "value"),
+        State(f"sweep-range-{sweep_index}", "value"),
+    )
+
+
+def warm_up_default_views():
+    """Fetch, convert and render default view of every dropdown option so first visitors get cached figures and data"""
+
+    started_at = time.perf_counter()
+    for site_location_val in ogc.SITE_LOCATION_OPTIONS:
+        try:
+            get_default_overtopping_view(site_location_val)
+            for feature_plot in FEATURE_PLOTS:
+                get_default_feature_view(feature_plot, site_location_val)
+        except Exception as e:
+            print(f"Warning: Cache warmer failed for '{site_location_val}': {e}")
+    metrics.record_timing("cache_warmer", time.perf_counter() - started_at)
+
+
+def acquire_leader_lock(task_name, expire):
+    """Check if current process runs a background task shared by every process, e.g. every Gunicorn worker. The first
+    process to ask takes the lock and renews it each time it asks again, so another process takes over once the lock
+    expires when its owner stops.
+
+    Args:
+        task_name (string): Task's name e.g. cache warmer
+        expire (float): Seconds the lock is held without being renewed
+
+    Returns:
+        bool: True when current process runs the task
+    """
+
+    lock_key = "leader " + task_name
+    with cache.transact():
+        if cache.add(lock_key, os.getpid(), expire=expire):
+            return True
+        if cache.get(lock_key) == os.getpid():
+            cache.touch(lock_key, expire=expire)
+            return True
+    return False
+
+
+def run_cache_warmer():
+    """Warm up default views now and then periodically, so views are rendered again soon after the daily model run.
+    Views are shared through forecast cache, so only the process holding the cache warmer lock renders them."""
+
+    interval = api_client.get_client_setting(
+        "CACHE_WARMER_INTERVAL", CACHE_WARMER_INTERVAL
+    )
+    while True:
+        if acquire_leader_lock("cache warmer", 2 * interval):
+            warm_up_default_views()
+        time.sleep(interval)
+
+
+def start_cache_warmer():
+    """Start cache warmer on a daemon thread of current process"""
+
+    threading.Thread(
+        target=run_cache_warmer, name="splash-cache-warmer", daemon=True
+    ).start()
+
+
+def run_forecast_refresher():
+    """Fetch again stale backend API responses queued by callbacks of any process, so they are replaced in
+    forecast cache while visitors are served stale data. Only the process holding the forecast refresher lock fetches
+    them, other processes check every FORECAST_REFRESHER_LOCK_TTL / 2 seconds whether they should take over."""
+
+    interval = api_client.get_client_setting(
+        "FORECAST_REFRESH_INTERVAL", FORECAST_REFRESH_INTERVAL
+    )
+    while True:
+        if not acquire_leader_lock("forecast refresher", FORECAST_REFRESHER_LOCK_TTL):
+            time.sleep(FORECAST_REFRESHER_LOCK_TTL / 2)
+            continue
+
+        api_url = forecast_cache.pull_refresh_request()
+        if api_url is None:
+            time.sleep(interval)
+        else:
+            api_client.submit(refresh_data(api_url))
+
+
+def start_forecast_refresher():
+    """Start forecast refresher on a daemon thread of current process"""
+
+    threading.Thread(
+        target=run_forecast_refresher, name="splash-forecast-refresher", daemon=True
+    ).start()
+
+
+app.clientside_callback(
+    ClientsideFunction(namespace="splash", function_name="update_slider"),
+    Output(ogc.get_slider_id(MATCH), "value"),
+    Input(ogc.get_slider_id(MATCH), "value"),
+    Input(ogc.get_slider_button_id("slider-increase-btn", MATCH), "n_clicks"),
+    Input(ogc.get_slider_button_id("slider-decrease-btn", MATCH), "n_clicks"),
+    Input("reset-button", "n_clicks"),
+    Input("wad-reset-button", "n_clicks"),
+    Input("mwd-reset-button", "n_clicks"),
+    Input("aad-reset-button", "n_clicks"),
+    Input("wd-reset-button", "n_clicks"),
+    Input("dd_site_location", "value"),
+    State(ogc.get_slider_id(MATCH), "step"),
+    State(ogc.get_slider_id(MATCH), "id"),
+    State("slider-settings", "data"),
+)
+
+
+def build_feature_layouts():
+    """Build base layouts of wave and atmospheric variable graphs of every location once when dashboard starts, so
+    callbacks only build their traces"""
+
+    location_names = {
+        get_location_name(site_location_val)
+        for site_location_val in ogc.SITE_LOCATION_OPTIONS
+    }
+    for location_name in sorted(location_names):
+        for feature_plot in FEATURE_PLOTS:
+            for show_dynamic_y_axis in [False, True]:
+                fc.get_feature_layout(
+                    location_name + feature_plot["title"],
+                    feature_plot["y_min_value"],
+                    feature_plot["y_max_value"],
+                    show_dynamic_y_axis,
+                )
+
+
+build_feature_layouts()
 
 if __name__ == "__main__":
     environment = os.getenv("SPLASH_ENV")
 
+    # Debug mode reloader runs this script in a parent and a child process, warm up cache only in the child
+    if not DEBUG or os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_cache_warmer()
+        start_forecast_refresher()
+
     if DEBUG == True:
         print("DAWLISH_API_ROOT_ENDPOINT=", DAWLISH_API_ROOT_ENDPOINT)
         print("PENZANCE_API_ROOT_ENDPOINT=", PENZANCE_API_ROOT_ENDPOINT)
@@ -2,64 +2,159 @@
 
 # SPDX-License-Identifier: MIT
 
+from dash import Patch
 import plotly.graph_objects as go
+import utils
 
+# Base layouts of feature plots by plot's title and y-axis settings, built once per process
+feature_layouts = {}
 
-def render_feature_scatter_plot(
-    feature_fig, feature_data, feature_name, trace_name, trace_color, is_forecast_data
+
+def get_feature_trace(
+    feature_data, feature_name, trace_name, trace_color, is_forecast_data, show_legend=True
 ):
-    """Render feature scatter plot
+    """Get feature line trace
 
     Args:
-        feature_fig (Figure): Feature's figure
-        feature_data (Dataframe): Feature's data
+        feature_data (TimeSeries): Feature's data
         feature_name (string): Feature column's name
         trace_name (string): Feature's name to display it on legend
         trace_color (string): Trace's colour
         is_forecast_data (bool): Flag to identify if data is forecast or adjusted forecast
+        show_legend (bool): Flag to display trace on legend
+
+    Returns:
+        dict: Feature's line trace
     """
 
     if is_forecast_data:
-        line_size = {"width": 2}
+        line_width = 2
     else:
-        line_size = {"width": 1}
-
-    feature_fig.add_trace(
-        go.Scatter(
-            x=feature_data["time"],
-            y=feature_data[feature_name],
-            mode="lines",
-            name=trace_name,
-            line_color=trace_color,
-            line=line_size,
-        )
+        line_width = 1
+
+    return dict(
+        x=get_column(feature_data, "time"),
+        y=get_column(feature_data, feature_name),
+        mode="lines",
+        name=trace_name,
+        line=dict(color=trace_color, width=line_width),
+        showlegend=show_legend,
+        type="scatter",
     )
 
 
-def render_overtopping_events_plot(
-    feature_fig, cur_overtopping_times_df, feature_name, trace_name, trace_color
+def get_overtopping_events_trace(
+    overtopping_times_df, feature_name, trace_name, trace_color, show_legend=True
 ):
-    """Render overtopping events plot
+    """Get overtopping events trace
 
     Args:
-        feature_fig (Figure): Feature's figure
-        cur_overtopping_times_df (Dataframe): Adjusted forecast overtopping events times dataframe
+        overtopping_times_df (TimeSeries): Overtopping events times
         feature_name (string): Feature column's name
         trace_name (string): Feature's name to display it on legend
         trace_color (string): Trace's colour
+        show_legend (bool): Flag to display trace on legend
+
+    Returns:
+        dict: Overtopping events trace
     """
 
-    feature_fig.add_trace(
-        go.Scatter(
-            x=cur_overtopping_times_df["time"],
-            y=cur_overtopping_times_df[feature_name],
-            mode="markers",
-            marker=dict(size=12),
-            name=trace_name,
-            line=dict(color=trace_color, width=4),
+    return dict(
+        x=get_column(overtopping_times_df, "time"),
+        y=get_column(overtopping_times_df, feature_name),
+        mode="markers",
+        marker=dict(size=12),
+        name=trace_name,
+        line=dict(color=trace_color, width=4),
+        showlegend=show_legend,
+        type="scatter",
+    )
+
+
+def get_column(data, column_name):
+    """Get time series' column. Previous data is an empty time series without columns when no adjusted forecast was submitted.
+
+    Args:
+        data (TimeSeries): Time series
+        column_name (string): Column's name
+
+    Returns:
+        Array: Column's values, or an empty list if time series doesn't have the column
+    """
+
+    return data[column_name] if column_name in data else []
+
+
+def build_feature_layout(plot_title, y_min_value, y_max_value, show_dynamic_y_axis):
+    """Build base layout of feature line plot, with its title, axes and grid
+
+    Args:
+        plot_title (string): Plot's title
+        y_min_value (integer): Minimum value of y-axis
+        y_max_value (integer): Maximum value of y-axis
+        show_dynamic_y_axis (bool): Flag to display y-axis dynamically
+
+    Returns:
+        dict: Plot's layout, without template which is added when figure is built
+    """
+
+    if show_dynamic_y_axis:
+        y_axis_dict = dict(
+            showgrid=True,
+            gridcolor="#8A8D90",
+            linecolor="#8A8D90",
+            title=dict(text=""),
+        )
+    else:
+        y_axis_dict = dict(
+            range=[y_min_value, y_max_value],
+            showgrid=True,
+            gridcolor="#8A8D90",
+            linecolor="#8A8D90",
+            title=dict(text=""),
+        )
+
+    feature_fig = go.Figure(
+        layout=dict(
+            title=dict(
+                text=plot_title,
+                font=dict(family="Helvetica Neue", size=22, color="#3279B7", weight=500),
+            ),
+            plot_bgcolor="white",
+            xaxis=dict(
+                showgrid=True,
+                gridcolor="#8A8D90",
+                linecolor="#8A8D90",
+                title=dict(text=""),
+            ),
+            yaxis=y_axis_dict,
+            showlegend=True,
         )
     )
 
+    layout = feature_fig.layout.to_plotly_json()
+    del layout["template"]
+    return layout
+
+
+def get_feature_layout(plot_title, y_min_value, y_max_value, show_dynamic_y_axis):
+    """Get base layout of feature line plot. It is built on first use and reused by every figure of the same plot.
+
+    Args:
+        plot_title (string): Plot's title
+        y_min_value (integer): Minimum value of y-axis
+        y_max_value (integer): Maximum value of y-axis
+        show_dynamic_y_axis (bool): Flag to display y-axis dynamically
+
+    Returns:
+        dict: Plot's layout, it must not be modified
+    """
+
+    layout_key = (plot_title, y_min_value, y_max_value, show_dynamic_y_axis)
+    if layout_key not in feature_layouts:
+        feature_layouts[layout_key] = build_feature_layout(*layout_key)
+    return feature_layouts[layout_key]
+
 
 def render_feature_plot(
     plot_title,
@@ -74,102 +169,139 @@ def render_feature_plot(
     cur_overtopping_times_df,
     show_dynamic_y_axis,
 ):
-    """Render feature line plot
+    """Render feature line plot. Only traces are built, the layout is reused and figure is validated when
+    utils.is_figure_validation_enabled is True.
 
     Args:
         plot_title (string): Plot's title
-        prev_feature_data (Dataframe): Feature data
-        cur_feature_data (Dataframe): Adjusted feature data
+        prev_feature_data (TimeSeries): Feature data
+        cur_feature_data (TimeSeries): Adjusted feature data
         feature_name (string): Feature's name
         features_description (tuple): Original feature and adjusted feature data descriptions
         overtopping_evts_desc (string): Forecast overtopping events and adjusted forecast overtopping events data descriptions
         y_min_value (integer): Minimum value of y-axis
         y_max_value (integer): Maximum value of y-axis
-        prev_overtopping_times_df (Dataframe): Forecast overtopping events dataframe
-        cur_overtopping_times_df (Dataframe): Adjusted forecast overtopping events dataframe
+        prev_overtopping_times_df (TimeSeries): Forecast overtopping events times
+        cur_overtopping_times_df (TimeSeries): Adjusted forecast overtopping events times
         show_dynamic_y_axis (bool): Flag to display y-axis dynamically
 
     Returns:
         Figure: Feature's line plot and scatter plot
     """
 
-    feature_fig = go.Figure()
-
     forecast_feature_desc, adjusted_feature_desc = features_description
     forecast_overtopping_evt_desc, adjusted_overtopping_evt_desc = overtopping_evts_desc
 
     if not prev_feature_data.empty:
         is_forecast_data = False
         forecast_marker_color = "#808080"
-        render_feature_scatter_plot(
-            feature_fig,
-            prev_feature_data,
-            feature_name,
-            forecast_feature_desc,
-            "#000",
-            True,
-        )
     else:
         is_forecast_data = True
         forecast_marker_color = "#000"
         adjusted_feature_desc = forecast_feature_desc
         adjusted_overtopping_evt_desc = forecast_overtopping_evt_desc
 
-    if not prev_overtopping_times_df.empty:
-        render_overtopping_events_plot(
-            feature_fig,
-            prev_overtopping_times_df,
-            feature_name,
-            forecast_overtopping_evt_desc,
-            "#000",
-        )
-
-    render_feature_scatter_plot(
-        feature_fig,
-        cur_feature_data,
-        feature_name,
-        adjusted_feature_desc,
-        forecast_marker_color,
-        is_forecast_data,
-    )
-    render_overtopping_events_plot(
-        feature_fig,
-        cur_overtopping_times_df,
-        feature_name,
-        adjusted_overtopping_evt_desc,
-        forecast_marker_color,
+    # Forecast traces are always rendered, even without data, so figure has the same traces
+    # order that patch_feature_plot expects: forecast line, forecast events, adjusted line and adjusted events
+    return go.Figure(
+        dict(
+            data=[
+                get_feature_trace(
+                    prev_feature_data,
+                    feature_name,
+                    forecast_feature_desc,
+                    "#000",
+                    True,
+                    not prev_feature_data.empty,
+                ),
+                get_overtopping_events_trace(
+                    prev_overtopping_times_df,
+                    feature_name,
+                    forecast_overtopping_evt_desc,
+                    "#000",
+                    not prev_overtopping_times_df.empty,
+                ),
+                get_feature_trace(
+                    cur_feature_data,
+                    feature_name,
+                    adjusted_feature_desc,
+                    forecast_marker_color,
+                    is_forecast_data,
+                ),
+                get_overtopping_events_trace(
+                    cur_overtopping_times_df,
+                    feature_name,
+                    adjusted_overtopping_evt_desc,
+                    forecast_marker_color,
+                ),
+            ],
+            layout=get_feature_layout(
+                plot_title, y_min_value, y_max_value, show_dynamic_y_axis
+            ),
+        ),
+        _validate=utils.is_figure_validation_enabled(),
     )
 
-    if show_dynamic_y_axis:
-        y_axis_dict = dict(
-            showgrid=True,
-            gridcolor="#8A8D90",
-            linecolor="#8A8D90",
-            title=dict(text=""),
-        )
-    else:
-        y_axis_dict = dict(
-            range=[y_min_value, y_max_value],
-            showgrid=True,
-            gridcolor="#8A8D90",
-            linecolor="#8A8D90",
-            title=dict(text=""),
-        )
 
-    feature_fig.update_layout(
-        title=dict(
-            text=plot_title,
-            font=dict(family="Helvetica Neue", size=22, color="#3279B7", weight=500),
-        ),
-        plot_bgcolor="white",
-        xaxis=dict(
-            showgrid=True,
-            gridcolor="#8A8D90",
-            linecolor="#8A8D90",
-            title=dict(text=""),
-        ),
-        yaxis=y_axis_dict,
+def patch_feature_plot(
+    cur_feature_data,
+    feature_name,
+    features_description,
+    overtopping_evts_desc,
+    cur_overtopping_times_df,
+):
+    """Patch feature line plot with a new adjusted forecast. Current adjusted traces, which are already in the
+    browser, become forecast traces and only new adjusted traces are sent.
+
+    Args:
+        cur_feature_data (TimeSeries): Adjusted feature data
+        feature_name (string): Feature's name
+        features_description (tuple): Original feature and adjusted feature data descriptions
+        overtopping_evts_desc (string): Forecast overtopping events and adjusted forecast overtopping events data descriptions
+        cur_overtopping_times_df (TimeSeries): Adjusted forecast overtopping events times
+
+    Returns:
+        Patch: Partial update of feature's line plot and scatter plot
+    """
+
+    forecast_feature_desc, adjusted_feature_desc = features_description
+    forecast_overtopping_evt_desc, adjusted_overtopping_evt_desc = overtopping_evts_desc
+
+    patched_fig = Patch()
+    del patched_fig["data"][0]
+    del patched_fig["data"][0]
+    patched_fig["data"][0].update(
+        name=forecast_feature_desc,
+        line={"color": "#000", "width": 2},
         showlegend=True,
     )
+    patched_fig["data"][1].update(
+        name=forecast_overtopping_evt_desc,
+        line={"color": "#000", "width": 4},
+        showlegend=True,
+    )
+    patched_fig["data"].extend(
+        [
+            utils.encode_trace(
+                get_feature_trace(
+                    cur_feature_data,
+                    feature_name,
+                    adjusted_feature_desc,
+                    "#808080",
+                    False,
+                )
+            ),
+            utils.encode_trace(
+                get_overtopping_events_trace(
+                    cur_overtopping_times_df,
+                    feature_name,
+                    adjusted_overtopping_evt_desc,
+                    "#808080",
+                )
+            ),
+        ]
+    )
+    patched_fig["layout"]["yaxis"]["autorange"] = True
+    del patched_fig["layout"]["yaxis"]["range"]
 
-    return feature_fig
+    return patched_fig
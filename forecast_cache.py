@@ -0,0 +1,330 @@
+# SPDX-FileCopyrightText: © 2025 National Oceanography Centre and University of Plymouth
+
+# SPDX-License-Identifier: MIT
+
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+import diskcache
+import metrics
+
+FORECAST_CACHE_DIRECTORY = "./cache_forecast"
+FORECAST_CACHE_SIZE_LIMIT = 256 * 1024 * 1024
+MODEL_RUN_HOUR_UTC = 6
+FORECAST_CACHE_STALE_TTL = 6 * 60 * 60
+FORECAST_CACHE_REVALIDATION_TTL = 2 * 24 * 60 * 60
+FORECAST_REFRESH_QUEUE = "refresh"
+
+cache_state = {"cache": None}
+
+
+def get_forecast_cache():
+    """Get forecast response cache. Least recently used responses are evicted when cache exceeds its size limit.
+
+    Returns:
+        Cache: Forecast response cache
+    """
+
+    if cache_state["cache"] is None:
+        cache_state["cache"] = diskcache.Cache(
+            FORECAST_CACHE_DIRECTORY,
+            size_limit=int(
+                os.environ.get("FORECAST_CACHE_SIZE_LIMIT", FORECAST_CACHE_SIZE_LIMIT)
+            ),
+            eviction_policy="least-recently-used",
+        )
+    return cache_state["cache"]
+
+
+def canonicalise_url(api_url):
+    """Canonicalise query url so the same scenario always gets the same cache key
+
+    Args:
+        api_url (string): Query url built by utils.add_resource and utils.add_query_params
+
+    Returns:
+        string: Query url with sorted query parameters
+    """
+
+    url_parts = urlsplit(api_url)
+    sorted_query = urlencode(sorted(parse_qsl(url_parts.query, keep_blank_values=True)))
+    return urlunsplit(url_parts._replace(query=sorted_query))
+
+
+def get_seconds_to_next_model_run(current_time=None):
+    """Get number of seconds until the next daily model run
+
+    Args:
+        current_time (datetime): Current UTC time. Defaults to now.
+
+    Returns:
+        float: Seconds until the next model run
+    """
+
+    if current_time is None:
+        current_time = datetime.now(timezone.utc)
+
+    model_run_hour = int(os.environ.get("MODEL_RUN_HOUR_UTC", MODEL_RUN_HOUR_UTC))
+    next_model_run = current_time.replace(
+        hour=model_run_hour, minute=0, second=0, microsecond=0
+    )
+    if next_model_run <= current_time:
+        next_model_run += timedelta(days=1)
+
+    return (next_model_run - current_time).total_seconds()
+
+
+def get_fresh_until(fetched_at):
+    """Get time when data becomes stale, i.e. the first daily model run after it was fetched (soft TTL)
+
+    Args:
+        fetched_at (float): Time data was fetched from backend API, in seconds since epoch
+
+    Returns:
+        float: Time data becomes stale, in seconds since epoch
+    """
+
+    return fetched_at + get_seconds_to_next_model_run(
+        datetime.fromtimestamp(fetched_at, timezone.utc)
+    )
+
+
+def is_stale(fetched_at):
+    """Check if data fetched at a given time is older than the last daily model run
+
+    Args:
+        fetched_at (float): Time data was fetched from backend API, in seconds since epoch
+
+    Returns:
+        bool: True when data is stale
+    """
+
+    return time.time() >= get_fresh_until(fetched_at)
+
+
+def get_expire(fetched_at):
+    """Get number of seconds data can be served. Stale data is still served for FORECAST_CACHE_STALE_TTL seconds
+    while it is refreshed (hard TTL).
+
+    Args:
+        fetched_at (float): Time data was fetched from backend API, in seconds since epoch
+
+    Returns:
+        float: Seconds until data expires
+    """
+
+    stale_ttl = int(os.environ.get("FORECAST_CACHE_STALE_TTL", FORECAST_CACHE_STALE_TTL))
+    return get_fresh_until(fetched_at) + stale_ttl - time.time()
+
+
+def is_expired(fetched_at):
+    """Check if data fetched at a given time is too old to be served, even while it is refreshed
+
+    Args:
+        fetched_at (float): Time data was fetched from backend API, in seconds since epoch
+
+    Returns:
+        bool: True when data is expired
+    """
+
+    return get_expire(fetched_at) <= 0
+
+
+def get_cached_data(api_url):
+    """Get cached response of backend API. Stale responses are returned as well, refresh them with request_refresh.
+
+    Args:
+        api_url (string): Query url to send a request to backend API
+
+    Returns:
+        dict, float: Cached JSON data and time it was fetched, or None, None if there is no cached response
+    """
+
+    entry = get_forecast_cache().get(canonicalise_url(api_url))
+    if entry is None or is_expired(entry["fetched_at"]):
+        metrics.increment("forecast_cache_misses")
+        return None, None
+
+    metrics.increment("forecast_cache_hits")
+    if is_stale(entry["fetched_at"]):
+        metrics.increment("forecast_cache_stale_hits")
+    if get_forecast_cache().delete("prefetched " + canonicalise_url(api_url)):
+        metrics.increment("prefetch_hits")
+    return entry["data"], entry["fetched_at"]
+
+
+def is_cached(api_url):
+    """Check if a fresh response of backend API is cached
+
+    Args:
+        api_url (string): Query url to send a request to backend API
+
+    Returns:
+        bool: True when response is cached and is not stale
+    """
+
+    entry = get_forecast_cache().get(canonicalise_url(api_url))
+    return entry is not None and not is_stale(entry["fetched_at"])
+
+
+def cache_data(api_url, data, validators=None):
+    """Cache response of backend API. It is fresh until the next daily model run. Expired responses are kept for
+    FORECAST_CACHE_REVALIDATION_TTL more seconds, so they can be reused when backend API reports they are not modified.
+
+    Args:
+        api_url (string): Query url to send a request to backend API
+        data (dict): JSON data returned by backend API
+        validators (dict): Conditional request headers built by get_request_validators
+
+    Returns:
+        float: Time data was fetched, in seconds since epoch
+    """
+
+    fetched_at = time.time()
+    revalidation_ttl = int(
+        os.environ.get("FORECAST_CACHE_REVALIDATION_TTL", FORECAST_CACHE_REVALIDATION_TTL)
+    )
+    get_forecast_cache().set(
+        canonicalise_url(api_url),
+        {"data": data, "fetched_at": fetched_at, "validators": validators or {}},
+        expire=get_expire(fetched_at) + revalidation_ttl,
+    )
+    return fetched_at
+
+
+def get_request_validators(response_headers):
+    """Get conditional request headers matching ETag and Last-Modified headers of a backend API response
+
+    Args:
+        response_headers (CIMultiDictProxy): Response headers
+
+    Returns:
+        dict: If-None-Match and If-Modified-Since headers. Empty when backend API sends no validator.
+    """
+
+    validators = {}
+    if "ETag" in response_headers:
+        validators["If-None-Match"] = response_headers["ETag"]
+    if "Last-Modified" in response_headers:
+        validators["If-Modified-Since"] = response_headers["Last-Modified"]
+    return validators
+
+
+def get_cached_validators(api_url):
+    """Get conditional request headers of a cached response, including stale and expired responses
+
+    Args:
+        api_url (string): Query url to send a request to backend API
+
+    Returns:
+        dict: If-None-Match and If-Modified-Since headers. Empty when response is not cached.
+    """
+
+    entry = get_forecast_cache().get(canonicalise_url(api_url))
+    return {} if entry is None else entry["validators"]
+
+
+def revalidate_data(api_url):
+    """Reuse a cached response that backend API reported as not modified. It is fresh again until the next daily
+    model run.
+
+    Args:
+        api_url (string): Query url to send a request to backend API
+
+    Returns:
+        dict: Cached JSON data, or None if response has been evicted
+    """
+
+    entry = get_forecast_cache().get(canonicalise_url(api_url))
+    if entry is None:
+        return None
+
+    cache_data(api_url, entry["data"], entry["validators"])
+    return entry["data"]
+
+
+def request_refresh(api_url):
+    """Queue a stale response to be fetched again by the forecast refresher. A response is only queued once.
+
+    Args:
+        api_url (string): Query url to send a request to backend API
+    """
+
+    forecast_cache = get_forecast_cache()
+    stale_ttl = int(os.environ.get("FORECAST_CACHE_STALE_TTL", FORECAST_CACHE_STALE_TTL))
+    if forecast_cache.add(
+        "refresh pending " + canonicalise_url(api_url), True, expire=stale_ttl
+    ):
+        forecast_cache.push(api_url, prefix=FORECAST_REFRESH_QUEUE, expire=stale_ttl)
+
+
+def pull_refresh_request():
+    """Get next query url queued by request_refresh
+
+    Returns:
+        string: Query url, or None if the queue is empty
+    """
+
+    _, api_url = get_forecast_cache().pull(prefix=FORECAST_REFRESH_QUEUE)
+    return api_url
+
+
+def complete_refresh(api_url):
+    """Allow a refreshed response to be queued again once it becomes stale
+
+    Args:
+        api_url (string): Query url to send a request to backend API
+    """
+
+    get_forecast_cache().delete("refresh pending " + canonicalise_url(api_url))
+
+
+def mark_prefetched(api_url):
+    """Mark a cached response as speculatively prefetched, so its first use is counted as a prefetch hit
+
+    Args:
+        api_url (string): Query url to send a request to backend API
+    """
+
+    get_forecast_cache().set(
+        "prefetched " + canonicalise_url(api_url),
+        True,
+        expire=get_seconds_to_next_model_run(),
+    )
+
+
+def get_rendered_view(view_name, api_url):
+    """Get cached default view of a dropdown option rendered from a backend API response
+
+    Args:
+        view_name (string): View's name e.g. overtopping
+        api_url (string): Query url of backend API response used to render the view
+
+    Returns:
+        dict: Cached figures and dataframes, or None if there is no cached view or it was rendered from stale data
+    """
+
+    view = get_forecast_cache().get(view_name + " " + canonicalise_url(api_url))
+    if view is not None and is_stale(view["fetched_at"]):
+        view = None
+    metrics.increment(
+        "rendered_view_cache_misses" if view is None else "rendered_view_cache_hits"
+    )
+    return view
+
+
+def cache_rendered_view(view_name, api_url, view):
+    """Cache default view of a dropdown option as long as the data it was rendered from
+
+    Args:
+        view_name (string): View's name e.g. overtopping
+        api_url (string): Query url of backend API response used to render the view
+        view (dict): Figures, dataframes and time data was fetched of the view
+    """
+
+    get_forecast_cache().set(
+        view_name + " " + canonicalise_url(api_url),
+        view,
+        expire=get_expire(view["fetched_at"]),
+    )
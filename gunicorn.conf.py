@@ -0,0 +1,55 @@
+# SPDX-FileCopyrightText: © 2025 National Oceanography Centre and University of Plymouth
+
+# SPDX-License-Identifier: MIT
+
+# Gunicorn settings to serve dashboard in production: gunicorn dashboard:server
+
+import os
+import multiprocessing
+
+default_bind = (
+    "0.0.0.0:8050" if os.getenv("SPLASH_ENV") == "docker" else "127.0.0.1:8050"
+)
+
+bind = os.environ.get("SPLASH_BIND", default_bind)
+workers = int(os.environ.get("SPLASH_WORKERS", multiprocessing.cpu_count()))
+threads = int(os.environ.get("SPLASH_THREADS", 4))
+worker_class = "gthread"
+timeout = int(os.environ.get("SPLASH_WORKER_TIMEOUT", 120))
+graceful_timeout = int(os.environ.get("SPLASH_GRACEFUL_TIMEOUT", 30))
+keepalive = 5
+accesslog = "-"
+errorlog = "-"
+
+# Import dashboard and build its layout once in master process before forking workers
+preload_app = True
+
+
+def post_fork(server, worker):
+    """Close SQLite connections of disk caches opened by master process so each worker opens its own"""
+
+    import dashboard
+    import metrics
+    import forecast_cache
+    import session_store
+
+    dashboard.cache.close()
+    metrics.metrics_cache.close()
+    for disk_cache in [
+        forecast_cache.cache_state["cache"],
+        session_store.store_state["cache"],
+    ]:
+        if disk_cache is not None:
+            disk_cache.close()
+
+
+def post_worker_init(worker):
+    """Start cache warmer and forecast refresher in every worker. Only the worker holding the lock of each task runs
+    it: it warms up default views of every dropdown option or refreshes stale forecast data, which are shared by all
+    workers through forecast cache. Master process never runs them, so workers aren't forked while they hold locks or
+    HTTP connections."""
+
+    import dashboard
+
+    dashboard.start_cache_warmer()
+    dashboard.start_forecast_refresher()
@@ -0,0 +1,173 @@
+# SPDX-FileCopyrightText: © 2025 National Oceanography Centre and University of Plymouth
+
+# SPDX-License-Identifier: MIT
+
+import os
+import json
+import plotly.io.json
+import metrics
+from time_series import TimeSeries
+
+HISTORICAL_DATASETS_VERSION = 3
+HISTORICAL_DATASETS_DIRECTORY = "./datasets"
+HISTORICAL_OPTIONS = [
+    "Dawlish Storm Bert - overtopping",
+    "Penzance Storm Bert - overtopping",
+    "Dawlish - no overtopping",
+    "Penzance - no overtopping",
+]
+
+datasets_state = {"views": None}
+
+
+def get_historical_datasets_path():
+    """Get path of bundled historical datasets of current version
+
+    Returns:
+        string: Path of historical datasets file
+    """
+
+    return os.path.join(
+        HISTORICAL_DATASETS_DIRECTORY,
+        f"historical_datasets_v{HISTORICAL_DATASETS_VERSION}.json",
+    )
+
+
+def load_historical_views():
+    """Load bundled historical datasets once per process
+
+    Returns:
+        dict: Rendered views by option and view name. Empty when datasets were not built for current version.
+    """
+
+    if datasets_state["views"] is None:
+        datasets_path = get_historical_datasets_path()
+        try:
+            with open(datasets_path, encoding="utf-8") as datasets_file:
+                datasets = json.load(datasets_file)
+            datasets_state["views"] = {
+                site_location_val: {
+                    view_name: convert_json_to_view(view)
+                    for view_name, view in option_views.items()
+                }
+                for site_location_val, option_views in datasets["views"].items()
+            }
+        except FileNotFoundError:
+            print(
+                f"Warning: Historical datasets '{datasets_path}' not found. Historical options are requested to backend API."
+            )
+            datasets_state["views"] = {}
+        except (ValueError, KeyError, TypeError) as e:
+            print(
+                f"Warning: Historical datasets '{datasets_path}' are invalid ({e}). Historical options are requested to backend API."
+            )
+            datasets_state["views"] = {}
+    return datasets_state["views"]
+
+
+def convert_view_to_json(view):
+    """Convert rendered view to JSON-serialisable dict. Figures are converted like Dash sends them to the browser and
+    time series are converted to lists. Time data was fetched is dropped, as historical data has no age.
+
+    Args:
+        view (dict): Figures, time series and time data was fetched of the view
+
+    Returns:
+        dict: View with plain figures and time series
+    """
+
+    json_view = dict(view, fetched_at=None)
+    for figures_key in ("figures", "figure"):
+        if figures_key in view:
+            json_view[figures_key] = json.loads(
+                plotly.io.json.to_json_plotly(view[figures_key])
+            )
+    json_view["dataframes"] = [
+        None if series is None else convert_series_to_json(series)
+        for series in view["dataframes"]
+    ]
+    return json_view
+
+
+def convert_series_to_json(series):
+    """Convert time series of a view to JSON-serialisable dict, without time data was fetched
+
+    Args:
+        series (TimeSeries): Time series of the view
+
+    Returns:
+        dict: Time series as plain lists
+    """
+
+    series_dict = series.to_dict()
+    series_dict["attrs"] = {
+        attr_name: attr_value
+        for attr_name, attr_value in series_dict["attrs"].items()
+        if attr_name != "fetched_at"
+    }
+    return series_dict
+
+
+def convert_json_to_view(json_view):
+    """Convert view loaded from JSON back to a rendered view
+
+    Args:
+        json_view (dict): View returned by convert_view_to_json
+
+    Returns:
+        dict: Figures and time series of the view. Time data was fetched is None.
+    """
+
+    view = dict(json_view, fetched_at=None)
+    view["dataframes"] = [
+        None if series_dict is None else TimeSeries.from_dict(series_dict)
+        for series_dict in json_view["dataframes"]
+    ]
+    return view
+
+
+def get_historical_view(site_location_val, view_name):
+    """Get bundled view of a historical option e.g. Storm Bert
+
+    Args:
+        site_location_val (string): Site location value of dropdown box
+        view_name (string): View's name e.g. overtopping
+
+    Returns:
+        dict: Figures and time series of the view, or None if option is not bundled
+    """
+
+    if site_location_val not in HISTORICAL_OPTIONS:
+        return None
+
+    view = load_historical_views().get(site_location_val, {}).get(view_name)
+    if view is not None:
+        metrics.increment("historical_dataset_hits")
+    return view
+
+
+def save_historical_views(views, created_at):
+    """Save bundled historical datasets of current version
+
+    Args:
+        views (dict): Rendered views by option and view name
+        created_at (string): Date and time when datasets were built
+    """
+
+    os.makedirs(HISTORICAL_DATASETS_DIRECTORY, exist_ok=True)
+    datasets = {
+        "version": HISTORICAL_DATASETS_VERSION,
+        "created_at": created_at,
+        "views": {
+            site_location_val: {
+                view_name: convert_view_to_json(view)
+                for view_name, view in option_views.items()
+            }
+            for site_location_val, option_views in views.items()
+        },
+    }
+    # Replace committed datasets only once new datasets are completely written
+    datasets_path = get_historical_datasets_path()
+    with open(datasets_path + ".tmp", "w", encoding="utf-8") as datasets_file:
+        json.dump(datasets, datasets_file, separators=(",", ":"))
+    os.replace(datasets_path + ".tmp", datasets_path)
@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: © 2025 National Oceanography Centre and University of Plymouth
+
+# SPDX-License-Identifier: MIT
+
+import diskcache
+
+METRICS_CACHE_DIRECTORY = "./cache_metrics"
+
+metrics_cache = diskcache.Cache(METRICS_CACHE_DIRECTORY)
+
+
+def increment(metric_name, delta=1):
+    """Increment a counter shared by the web server and background callback processes
+
+    Args:
+        metric_name (string): Counter's name e.g. http_connections_reused
+        delta (integer): Amount to add to the counter
+
+    Returns:
+        integer: Counter's new value
+    """
+
+    return metrics_cache.incr(metric_name, delta, default=0, retry=True)
+
+
+def get_metrics():
+    """Get all counters
+
+    Returns:
+        dict: Counters' values by name
+    """
+
+    return {metric_name: metrics_cache.get(metric_name) for metric_name in sorted(metrics_cache)}
+
+
+def record_timing(metric_name, seconds):
+    """Record a duration as count, total and maximum milliseconds counters
+
+    Args:
+        metric_name (string): Timing's name e.g. time_to_first_chart
+        seconds (float): Measured duration in seconds
+    """
+
+    milliseconds = int(round(seconds * 1000))
+    with metrics_cache.transact(retry=True):
+        increment(metric_name + "_count")
+        increment(metric_name + "_total_ms", milliseconds)
+        if milliseconds > metrics_cache.get(metric_name + "_max_ms", 0):
+            metrics_cache.set(metric_name + "_max_ms", milliseconds, retry=True)
@@ -2,10 +2,13 @@
 
 # SPDX-License-Identifier: MIT
 
-from dash import dcc, html
-import plotly.express as px
+from dash import dcc, html, Patch
+import plotly.graph_objects as go
 import dash_bootstrap_components as dbc
+import numpy as np
+import time
 import utils
+import time_series
 
 
 PERCENTAGE_MIN_VAL_SLIDER = -100
@@ -16,42 +19,199 @@ DEGREE_MAX_VAL_SLIDER = 180
 DEGREE_DEFAULT_VALUE = 0
 PERCENTAGE_CHAR = "%"
 DEGREE_CHAR = "°"
+SITE_LOCATION_OPTIONS = [
+    "Dawlish",
+    "Penzance",
+    "Dawlish Storm Bert - overtopping",
+    "Penzance Storm Bert - overtopping",
+    "Dawlish - no overtopping",
+    "Penzance - no overtopping",
+]
+SWEEP_VARIABLE_OPTIONS = [
+    {"label": "Significant wave height", "value": "sig-wave-height"},
+    {"label": "Tidal level", "value": "freeboard"},
+    {"label": "Mean wave period", "value": "mean-wave-period"},
+    {"label": "Mean wave direction", "value": "mean-wave-direction"},
+    {"label": "Wind speed", "value": "wind-speed"},
+    {"label": "Wind direction", "value": "wind-direction"},
+]
+SWEEP_DEFAULT_RANGE = [-50, 50]
+SWEEP_DEFAULT_STEP = 10
+
+NO_OVERTOPPING_CLASS = 0
+HIGH_CONFIDENCE_CLASS = 1
+MEDIUM_CONFIDENCE_CLASS = 2
+LOW_CONFIDENCE_CLASS = 3
+UNKNOWN_CONFIDENCE_CLASS = 4
+CONFIDENCE_CLASSES_COUNT = 5
+FORECAST_STAGE_CLASS = time_series.FORECAST_STAGE
+ADJUSTED_FORECAST_STAGE_CLASS = time_series.ADJUSTED_FORECAST_STAGE
+UNKNOWN_STAGE_CLASS = time_series.UNKNOWN_STAGE
+
+OVERTOPPING_HOVER_TEMPLATE = (
+    "Time=%{x}<br>No. of Overtopping Occurrences (Per 10 Mins)=%{y}<extra></extra>"
+)
+
+# Base layouts of overtopping plots by plot's title and logo, built once per process
+overtopping_layouts = {}
+
+# Marker styles by style class: forecast, adjusted forecast and unknown stage rows,
+# each row ordered by no overtopping, high, medium, low and unknown confidence
+MARKER_SYMBOLS = np.array(
+    ["x-thin", "circle-open", "circle", "square", "circle"] * 3
+)
+MARKER_COLORS = np.array(
+    ["#2A5485", "#000", "#2A5485", "#AAD3E3", "#AAD3E3"]
+    + ["#C5C5C5", "#808080", "#C5C5C5", "#C7C7C7", "#AAD3E3"]
+    + ["#AAD3E3"] * 5
+)
+MARKER_LINE_COLORS = np.array(
+    ["#2A5485", "#000", "#2A5485", "#AAD3E3", "#AAD3E3"]
+    + ["#C5C5C5", "#808080", "#000", "#C7C7C7", "#AAD3E3"]
+    + ["#AAD3E3"] * 5
+)
+
+
+def classify_overtopping_points(confidence, overtopping_count, stage):
+    """Classify overtopping points by stage and confidence level. Style class is used as index of
+    MARKER_SYMBOLS, MARKER_COLORS and MARKER_LINE_COLORS.
+
+    Args:
+        confidence (array): Confidence level of each point
+        overtopping_count (array): Number of overtopping occurrences of each point
+        stage (integer): Stage code of time series, see time_series.TimeSeries
+
+    Returns:
+        Array: Style class of each point
+    """
+
+    confidence = np.asarray(confidence)
+    overtopping_count = np.asarray(overtopping_count)
+    has_overtopping = overtopping_count > 0
+
+    confidence_class = np.select(
+        [
+            overtopping_count == 0,
+            (confidence > 0.80) & has_overtopping,
+            (confidence >= 0.50) & (confidence <= 0.80) & has_overtopping,
+            (confidence < 0.50) & has_overtopping,
+        ],
+        [
+            NO_OVERTOPPING_CLASS,
+            HIGH_CONFIDENCE_CLASS,
+            MEDIUM_CONFIDENCE_CLASS,
+            LOW_CONFIDENCE_CLASS,
+        ],
+        default=UNKNOWN_CONFIDENCE_CLASS,
+    )
+    stage_class = (
+        stage
+        if stage in (FORECAST_STAGE_CLASS, ADJUSTED_FORECAST_STAGE_CLASS)
+        else UNKNOWN_STAGE_CLASS
+    )
+
+    return stage_class * CONFIDENCE_CLASSES_COUNT + confidence_class
+
+
+def get_overtopping_marker(overtopping_data):
+    """Get markers of overtopping points
+
+    Args:
+        overtopping_data (TimeSeries): Overtopping events time series
+
+    Returns:
+        dict: Marker's symbols, colours and line colours
+    """
+
+    style_classes = classify_overtopping_points(
+        overtopping_data["confidence"],
+        overtopping_data["overtopping_count"],
+        overtopping_data.stage,
+    )
+    return dict(
+        line=dict(width=2, color=MARKER_LINE_COLORS[style_classes]),
+        size=12,
+        symbol=MARKER_SYMBOLS[style_classes],
+        color=MARKER_COLORS[style_classes],
+    )
 
 
-def render_overtopping_plot(plot_title, plot_logo, overtopping_data):
-    """Render overtopping plot
+def get_overtopping_trace(overtopping_data):
+    """Get overtopping points trace
+
+    Args:
+        overtopping_data (TimeSeries): Overtopping events time series
+
+    Returns:
+        dict: Overtopping points trace
+    """
+
+    return dict(
+        x=overtopping_data["time"],
+        y=overtopping_data["overtopping_count"],
+        mode="markers",
+        name="",
+        showlegend=False,
+        hovertemplate=OVERTOPPING_HOVER_TEMPLATE,
+        marker=get_overtopping_marker(overtopping_data),
+        type="scatter",
+    )
+
+
+def build_overtopping_layout(plot_title, plot_logo):
+    """Build base layout of overtopping plot, with its title, logo, grid and IQR lines
 
     Args:
         plot_title (string): Plot's title
         plot_logo (string): Relative path to plot's logo
-        overtopping_data (Dataframe): Forecast overtopping events dataframe
 
     Returns:
-        Figure: Forecast overtopping events figure
+        dict: Plot's layout, without template which is added when figure is built
     """
 
-    fig_rf1_rf2_tmp = px.scatter(
-        overtopping_data,
-        x="time",
-        y="overtopping_count",
-        color_continuous_scale=["aqua", "skyblue", "blue"],
-        height=513,
-        labels={
-            "time": "Time",
-            "overtopping_count": "No. of Overtopping Occurrences (Per 10 Mins)",
-            "confidence": "Confidence Level",
-        },
+    is_sheltered = utils.find_words_with_suffix(plot_title, "sheltered")
+    fig = go.Figure(
+        layout=dict(
+            title=dict(
+                text=plot_title,
+                font=dict(family="Helvetica Neue", size=22, color="#3279B7", weight=500),
+                xref="container",
+                yref="container",
+                x=0.35 if not is_sheltered else 0.25,
+                y=0.91,
+                xanchor="left",
+                yanchor="bottom",
+            ),
+            xaxis=dict(
+                anchor="y",
+                domain=[0.0, 1.0],
+                title=dict(text="Time"),
+                showgrid=True,
+                gridcolor="#8A8D90",
+                linecolor="#8A8D90",
+            ),
+            yaxis=dict(
+                anchor="x",
+                domain=[0.0, 1.0],
+                title=dict(text="No. of Overtopping Occurrences (Per 10 Mins)"),
+                showgrid=True,
+                gridcolor="#8A8D90",
+                linecolor="#8A8D90",
+            ),
+            legend=dict(tracegroupgap=0),
+            margin=dict(t=60),
+            height=513,
+            plot_bgcolor="white",
+            showlegend=False,
+        )
     )
 
-    logo_x_axis = (
-        0.24 if not utils.find_words_with_suffix(plot_title, "sheltered") else 0.10
-    )
-    fig_rf1_rf2_tmp.add_layout_image(
+    fig.add_layout_image(
         dict(
             source="./assets/imgs/" + plot_logo,
             xref="paper",
             yref="paper",
-            x=logo_x_axis,
+            x=0.24 if not is_sheltered else 0.10,
             y=1.03,
             sizex=0.06,
             sizey=0.06,
@@ -60,204 +220,137 @@ def render_overtopping_plot(plot_title, plot_logo, overtopping_data):
         )
     )
 
-    title_x_axis = (
-        0.35 if not utils.find_words_with_suffix(plot_title, "sheltered") else 0.25
+    fig.add_hline(
+        y=6, line_dash="dash", line_color="#8A8D90", annotation_text="25% IQR (6)"
     )
-    fig_rf1_rf2_tmp.update_layout(
-        title=dict(
-            text=plot_title,
-            font=dict(family="Helvetica Neue", size=22, color="#3279B7", weight=500),
-            xref="container",
-            yref="container",
-            x=title_x_axis,
-            y=0.91,
-            xanchor="left",
-            yanchor="bottom",
-        ),
-        plot_bgcolor="white",
-        xaxis=dict(
-            showgrid=True,
-            gridcolor="#8A8D90",
-            linecolor="#8A8D90",
-        ),
-        yaxis=dict(
-            showgrid=True,
-            gridcolor="#8A8D90",
-            linecolor="#8A8D90",
-        ),
-        showlegend=False,
+    fig.add_hline(
+        y=54, line_dash="dash", line_color="#8A8D90", annotation_text="75% IQR (54)"
     )
 
-    fig_rf1_rf2_tmp.update_traces(
-        selector=dict(type="scatter", mode="markers"),
-        marker=dict(
-            line=dict(width=2),
-            size=12,
-            symbol=[
-                (
-                    "x-thin"
-                    if o == 0
-                    else (
-                        "circle-open"
-                        if c > 0.80 and o > 0
-                        else (
-                            "circle"
-                            if c >= 0.50 and c <= 0.8 and o > 0
-                            else "square" if c < 0.50 and o > 0 else "circle"
-                        )
-                    )
-                )
-                for c, o in zip(
-                    overtopping_data["confidence"],
-                    overtopping_data["overtopping_count"],
-                )
-            ],
-            color=[
-                (
-                    "#2A5485"
-                    if o == 0 and s == "forecast"
-                    else (
-                        "#000"
-                        if c > 0.80 and o > 0 and s == "forecast"
-                        else (
-                            "#2A5485"
-                            if c >= 0.50 and c <= 0.8 and o > 0 and s == "forecast"
-                            else (
-                                "#AAD3E3"
-                                if c < 0.50 and o > 0 and s == "forecast"
-                                else (
-                                    "#C5C5C5"
-                                    if o == 0 and s == "adjusted_forecast"
-                                    else (
-                                        "#808080"
-                                        if c > 0.80
-                                        and o > 0
-                                        and s == "adjusted_forecast"
-                                        else (
-                                            "#C5C5C5"
-                                            if c >= 0.50
-                                            and c <= 0.8
-                                            and o > 0
-                                            and s == "adjusted_forecast"
-                                            else (
-                                                "#C7C7C7"
-                                                if c < 0.50
-                                                and o > 0
-                                                and s == "adjusted_forecast"
-                                                else "#AAD3E3"
-                                            )
-                                        )
-                                    )
-                                )
-                            )
-                        )
-                    )
-                )
-                for c, o, s in zip(
-                    overtopping_data["confidence"],
-                    overtopping_data["overtopping_count"],
-                    overtopping_data["stage"],
-                )
-            ],
-            line_color=[
-                (
-                    "#2A5485"
-                    if o == 0 and s == "forecast"
-                    else (
-                        "#000"
-                        if c > 0.80 and o > 0 and s == "forecast"
-                        else (
-                            "#2A5485"
-                            if c >= 0.50 and c <= 0.80 and o > 0 and s == "forecast"
-                            else (
-                                "#AAD3E3"
-                                if c < 0.50 and o > 0 and s == "forecast"
-                                else (
-                                    "#C5C5C5"
-                                    if o == 0 and s == "adjusted_forecast"
-                                    else (
-                                        "#808080"
-                                        if c > 0.80
-                                        and o > 0
-                                        and s == "adjusted_forecast"
-                                        else (
-                                            "#000"
-                                            if c >= 0.50
-                                            and c <= 0.80
-                                            and o > 0
-                                            and s == "adjusted_forecast"
-                                            else (
-                                                "#C7C7C7"
-                                                if c < 0.50
-                                                and o > 0
-                                                and s == "adjusted_forecast"
-                                                else "#AAD3E3"
-                                            )
-                                        )
-                                    )
-                                )
-                            )
-                        )
-                    )
-                )
-                for c, o, s in zip(
-                    overtopping_data["confidence"],
-                    overtopping_data["overtopping_count"],
-                    overtopping_data["stage"],
-                )
+    layout = fig.layout.to_plotly_json()
+    del layout["template"]
+    return layout
+
+
+def get_overtopping_layout(plot_title, plot_logo):
+    """Get base layout of overtopping plot. It is built on first use and reused by every figure of the same plot.
+
+    Args:
+        plot_title (string): Plot's title
+        plot_logo (string): Relative path to plot's logo
+
+    Returns:
+        dict: Plot's layout, it must not be modified
+    """
+
+    layout_key = (plot_title, plot_logo)
+    if layout_key not in overtopping_layouts:
+        overtopping_layouts[layout_key] = build_overtopping_layout(plot_title, plot_logo)
+    return overtopping_layouts[layout_key]
+
+
+def render_overtopping_plot(plot_title, plot_logo, previous_data, current_data):
+    """Render overtopping plot. Only points traces are built, the layout is reused and figure is validated when
+    utils.is_figure_validation_enabled is True.
+
+    Args:
+        plot_title (string): Plot's title
+        plot_logo (string): Relative path to plot's logo
+        previous_data (TimeSeries): Forecast overtopping events time series, empty when no adjusted forecast was submitted
+        current_data (TimeSeries): Latest forecast or adjusted forecast overtopping events time series
+
+    Returns:
+        Figure: Forecast overtopping events figure with previous points trace and current points trace
+    """
+
+    if previous_data.empty:
+        previous_data = current_data.take(slice(0, 0))
+
+    return go.Figure(
+        dict(
+            data=[
+                get_overtopping_trace(previous_data),
+                get_overtopping_trace(current_data),
             ],
+            layout=get_overtopping_layout(plot_title, plot_logo),
         ),
+        _validate=utils.is_figure_validation_enabled(),
     )
 
-    fig_rf1_rf2_tmp.add_hline(
-        y=6, line_dash="dash", line_color="#8A8D90", annotation_text="25% IQR (6)"
-    )
-    fig_rf1_rf2_tmp.add_hline(
-        y=54, line_dash="dash", line_color="#8A8D90", annotation_text="75% IQR (54)"
+
+def patch_overtopping_plot(previous_data, current_data):
+    """Patch overtopping plot with a new adjusted forecast. Current points, which are already in the browser,
+    become forecast points and only new adjusted points are sent.
+
+    Args:
+        previous_data (TimeSeries): Forecast overtopping events time series
+        current_data (TimeSeries): Adjusted forecast overtopping events time series
+
+    Returns:
+        Patch: Partial update of forecast overtopping events figure
+    """
+
+    previous_marker = get_overtopping_marker(previous_data)
+
+    patched_fig = Patch()
+    del patched_fig["data"][0]
+    patched_fig["data"][0]["marker"]["color"] = previous_marker["color"]
+    patched_fig["data"][0]["marker"]["line"]["color"] = previous_marker["line"]["color"]
+    patched_fig["data"].append(
+        utils.encode_trace(get_overtopping_trace(current_data))
     )
 
-    return fig_rf1_rf2_tmp
+    return patched_fig
 
 
-def render_dawlish_seawall_crest_graph(dawlish_seawall_crest_data):
+def render_dawlish_seawall_crest_graph(previous_data, current_data):
     """Render Dawlish seawall crest graph
 
     Args:
-        dawlish_seawall_crest_data (Dataframe): Forecast overtopping events dataframe
+        previous_data (TimeSeries): Forecast overtopping events time series
+        current_data (TimeSeries): Adjusted forecast overtopping events time series
 
     Returns:
         Figure: Forecast overtopping events graph
     """
 
     fig_dawlish_seawall_crest = render_overtopping_plot(
-        "Dawlish Seawall Crest", "dawlish_seawall_crest.png", dawlish_seawall_crest_data
+        "Dawlish Seawall Crest",
+        "dawlish_seawall_crest.png",
+        previous_data,
+        current_data,
     )
 
     return fig_dawlish_seawall_crest
 
 
-def render_dawlish_railway_line_graph(data_dawlish_railway_line):
+def render_dawlish_railway_line_graph(previous_data, current_data):
     """Render Dawlish railway line graph
 
     Args:
-        data_dawlish_railway_line (_type_): Forecast overtopping events dataframe
+        previous_data (TimeSeries): Forecast overtopping events time series
+        current_data (TimeSeries): Adjusted forecast overtopping events time series
 
     Returns:
        Figure: Forecast overtopping events graph
     """
 
     fig_dawlish_railway_line = render_overtopping_plot(
-        "Dawlish Railway Line", "dawlish_railway_line.png", data_dawlish_railway_line
+        "Dawlish Railway Line",
+        "dawlish_railway_line.png",
+        previous_data,
+        current_data,
     )
 
     return fig_dawlish_railway_line
 
 
-def render_penzance_seawall_crest_graph(penzance_seawall_crest_data):
+def render_penzance_seawall_crest_graph(previous_data, current_data):
     """Render Penzance seawall crest graph
 
     Args:
-        penzance_seawall_crest_data (Dataframe): Forecast overtopping events dataframe
+        previous_data (TimeSeries): Forecast overtopping events time series
+        current_data (TimeSeries): Adjusted forecast overtopping events time series
 
     Returns:
         Figure: Forecast overtopping events graph
@@ -266,19 +359,19 @@ def render_penzance_seawall_crest_graph(penzance_seawall_crest_data):
     fig_penzance_seawall_crest = render_overtopping_plot(
         "Penzance Seawall Crest",
         "dawlish_seawall_crest.png",
-        penzance_seawall_crest_data,
+        previous_data,
+        current_data,
     )
 
     return fig_penzance_seawall_crest
 
 
-def render_penzance_seawall_crest_sheltered_graph(
-    data_penzance_seawall_crest_sheltered,
-):
+def render_penzance_seawall_crest_sheltered_graph(previous_data, current_data):
     """Render Penzance seawall crest sheltered graph
 
     Args:
-        data_penzance_seawall_crest_sheltered (Dataframe): Forecast overtopping events dataframe
+        previous_data (TimeSeries): Forecast overtopping events time series
+        current_data (TimeSeries): Adjusted forecast overtopping events time series
 
     Returns:
         Figure: Forecast overtopping events graph
@@ -287,31 +380,55 @@ def render_penzance_seawall_crest_sheltered_graph(
     fig_penzance_seawall_crest_sheltered = render_overtopping_plot(
         "Penzance, Seawall Crest (sheltered) ",
         "dawlish_seawall_crest.png",
-        data_penzance_seawall_crest_sheltered,
+        previous_data,
+        current_data,
     )
 
     return fig_penzance_seawall_crest_sheltered
 
 
+def get_slider_id(slider_name):
+    """Get pattern-matching id of a variable slider
+
+    Args:
+        slider_name (string): Slider's name e.g. sig-wave-height
+
+    Returns:
+        dict: Slider's id
+    """
+
+    return {"type": "variable-slider", "index": slider_name}
+
+
+def get_slider_button_id(button_type, slider_name):
+    """Get pattern-matching id of a variable slider's increase or decrease button
+
+    Args:
+        button_type (string): slider-increase-btn or slider-decrease-btn
+        slider_name (string): Slider's name e.g. sig-wave-height
+
+    Returns:
+        dict: Button's id
+    """
+
+    return {"type": button_type, "index": slider_name}
+
+
 def get_variable_slider(
     identifier,
     min_value,
     max_value,
     default_value,
     template_symbol,
-    decrease_btn_id,
-    increase_btn_id,
 ):
     """Get variable slider
 
     Args:
-        identifier (string): Slider's id
+        identifier (string): Slider's name, used as index of slider's and buttons' pattern-matching ids
         min_value (integer): Slider's minimum value
         max_value (integer): Slider's maximum value
         default_value (integer): Slider's default value
         template_symbol (string): Slider's template symbol
-        decrease_btn_id (string): Decrease button's id
-        increase_btn_id (string): Increase button's id
 
     Returns:
         Div: Slider's panel component
@@ -321,7 +438,7 @@ def get_variable_slider(
         children=[
             html.Div(
                 html.Button(
-                    id=decrease_btn_id,
+                    id=get_slider_button_id("slider-decrease-btn", identifier),
                     children=[
                         html.Img(
                             src="./assets/imgs/minus-icon.svg",
@@ -334,7 +451,7 @@ def get_variable_slider(
             ),
             html.Div(
                 dcc.Slider(
-                    id=identifier,
+                    id=get_slider_id(identifier),
                     min=min_value,
                     max=max_value,
                     step=1,
@@ -358,7 +475,7 @@ def get_variable_slider(
             ),
             html.Div(
                 html.Button(
-                    id=increase_btn_id,
+                    id=get_slider_button_id("slider-increase-btn", identifier),
                     children=[
                         html.Img(
                             src="./assets/imgs/plus-icon.svg",
@@ -421,8 +538,6 @@ def get_wave_variables_panels():
                                     PERCENTAGE_MAX_VAL_SLIDER,
                                     PERCENTAGE_DEFAULT_VALUE,
                                     PERCENTAGE_CHAR,
-                                    "swh-decrease-btn",
-                                    "swh-increase-btn",
                                 ),
                                 html.Div(
                                     children=[
@@ -443,8 +558,6 @@ def get_wave_variables_panels():
                                     PERCENTAGE_MAX_VAL_SLIDER,
                                     PERCENTAGE_DEFAULT_VALUE,
                                     PERCENTAGE_CHAR,
-                                    "fb-decrease-btn",
-                                    "fb-increase-btn",
                                 ),
                                 html.Div(
                                     children=[
@@ -465,8 +578,6 @@ def get_wave_variables_panels():
                                     PERCENTAGE_MAX_VAL_SLIDER,
                                     PERCENTAGE_DEFAULT_VALUE,
                                     PERCENTAGE_CHAR,
-                                    "mwp-decrease-btn",
-                                    "mwp-increase-btn",
                                 ),
                             ]
                         ),
@@ -507,8 +618,6 @@ def get_wave_variables_panels():
                                     DEGREE_MAX_VAL_SLIDER,
                                     DEGREE_DEFAULT_VALUE,
                                     DEGREE_CHAR,
-                                    "mwd-decrease-btn",
-                                    "mwd-increase-btn",
                                 ),
                             ]
                         ),
@@ -570,8 +679,6 @@ def get_atmospheric_variables_panels():
                                     PERCENTAGE_MAX_VAL_SLIDER,
                                     PERCENTAGE_DEFAULT_VALUE,
                                     PERCENTAGE_CHAR,
-                                    "ws-decrease-btn",
-                                    "ws-increase-btn",
                                 ),
                             ]
                         ),
@@ -612,8 +719,6 @@ def get_atmospheric_variables_panels():
                                     DEGREE_MAX_VAL_SLIDER,
                                     DEGREE_DEFAULT_VALUE,
                                     DEGREE_CHAR,
-                                    "wd-decrease-btn",
-                                    "wd-increase-btn",
                                 ),
                             ]
                         ),
@@ -670,6 +775,177 @@ def get_buttons_panel():
     return buttons_panel
 
 
+def get_sweep_variable_panel(index, title, default_variable):
+    """Get panel to pick a sweep variable, its range and its step
+
+    Args:
+        index (integer): Sweep variable's number, 1 or 2
+        title (string): Panel's title
+        default_variable (string): Id of default variable's slider, None for no variable
+
+    Returns:
+        Col: Column of sweep variable panel
+    """
+
+    return dbc.Col(
+        [
+            html.Div(title, className="variable-full-title"),
+            dcc.Dropdown(
+                id=f"sweep-variable-{index}",
+                options=SWEEP_VARIABLE_OPTIONS,
+                value=default_variable,
+                clearable=default_variable is None,
+            ),
+            dcc.RangeSlider(
+                id=f"sweep-range-{index}",
+                min=PERCENTAGE_MIN_VAL_SLIDER,
+                max=PERCENTAGE_MAX_VAL_SLIDER,
+                step=1,
+                value=SWEEP_DEFAULT_RANGE,
+                marks=None,
+                tooltip={"always_visible": True, "placement": "bottom"},
+            ),
+            html.Div("Step", className="variable-short-title"),
+            dbc.Input(
+                id=f"sweep-step-{index}",
+                type="number",
+                min=1,
+                value=SWEEP_DEFAULT_STEP,
+            ),
+        ],
+        md=5,
+    )
+
+
+def get_sweep_panel():
+    """Get sensitivity sweep panel
+
+    Returns:
+        Container: Container of sweep variables, run button and sweep plot
+    """
+
+    sweep_panel = dbc.Container(
+        [
+            dbc.Row(
+                [
+                    get_sweep_variable_panel(1, "First variable", "sig-wave-height"),
+                    get_sweep_variable_panel(2, "Second variable (optional)", None),
+                    dbc.Col(
+                        dbc.Button(
+                            "Run sweep",
+                            id="sweep-button",
+                            style={
+                                "backgroundColor": "#2A5485",
+                                "borderColor": "#2A5485",
+                                "width": "180px",
+                                "height": "48px",
+                            },
+                        ),
+                        md=2,
+                        style={"paddingTop": "24px"},
+                    ),
+                ],
+                style={"padding": "30px 0px 0px 87px"},
+            ),
+            dbc.Row(
+                dbc.Col(dcc.Graph(id="sweep-plot"), md=12),
+                style={"padding": "24px 72px 0px 87px"},
+            ),
+        ],
+        fluid=True,
+    )
+
+    return sweep_panel
+
+
+def update_sweep_layout(fig, plot_title, x_title, y_title):
+    """Apply dashboard's style to a sweep plot
+
+    Args:
+        fig (Figure): Sweep plot
+        plot_title (string): Plot's title
+        x_title (string): X axis title
+        y_title (string): Y axis title
+    """
+
+    fig.update_layout(
+        title=dict(
+            text=plot_title,
+            font=dict(family="Helvetica Neue", size=22, color="#3279B7", weight=500),
+        ),
+        plot_bgcolor="white",
+        height=513,
+        xaxis=dict(
+            title=x_title, showgrid=True, gridcolor="#8A8D90", linecolor="#8A8D90"
+        ),
+        yaxis=dict(
+            title=y_title, showgrid=True, gridcolor="#8A8D90", linecolor="#8A8D90"
+        ),
+    )
+
+
+def render_sweep_curve(x_title, x_values, location_names, total_counts):
+    """Render response curve of overtopping occurrences to one variable. Pending scenarios are not drawn.
+
+    Args:
+        x_title (string): Swept variable's title
+        x_values (list): Swept variable's values
+        location_names (tuple): Names of first and second location
+        total_counts (ndarray): Total overtopping occurrences of each location (rows) and scenario (columns), NaN when pending
+
+    Returns:
+        Figure: Response curve with one trace per location
+    """
+
+    fig = go.Figure(
+        [
+            go.Scatter(
+                x=x_values,
+                y=location_counts,
+                name=location_name,
+                mode="lines+markers",
+            )
+            for location_name, location_counts in zip(location_names, total_counts)
+        ]
+    )
+    update_sweep_layout(
+        fig,
+        "Sensitivity of overtopping occurrences",
+        x_title,
+        "Total no. of Overtopping Occurrences",
+    )
+    return fig
+
+
+def render_sweep_heatmap(x_title, y_title, x_values, y_values, total_counts):
+    """Render heatmap of overtopping occurrences to two variables. Pending scenarios are blank.
+
+    Args:
+        x_title (string): First swept variable's title
+        y_title (string): Second swept variable's title
+        x_values (list): First swept variable's values
+        y_values (list): Second swept variable's values
+        total_counts (ndarray): Total overtopping occurrences of both locations by second (rows) and first (columns) variable, NaN when pending
+
+    Returns:
+        Figure: Heatmap of total overtopping occurrences
+    """
+
+    fig = go.Figure(
+        go.Heatmap(
+            x=x_values,
+            y=y_values,
+            z=total_counts,
+            colorscale=["aqua", "skyblue", "blue"],
+            colorbar=dict(title="Occurrences"),
+        )
+    )
+    update_sweep_layout(
+        fig, "Sensitivity of overtopping occurrences", x_title, y_title
+    )
+    return fig
+
+
 def get_forecast_legend():
     """Get forecast legend
 
@@ -908,14 +1184,7 @@ def get_dropdown_panel():
             "Site location",
             dcc.Dropdown(
                 id="dd_site_location",
-                options=[
-                    "Dawlish",
-                    "Penzance",
-                    "Dawlish Storm Bert - overtopping",
-                    "Penzance Storm Bert - overtopping",
-                    "Dawlish - no overtopping",
-                    "Penzance - no overtopping",
-                ],
+                options=SITE_LOCATION_OPTIONS,
                 value="Dawlish",
                 clearable=False,
                 className="site-dropdown",
@@ -949,6 +1218,7 @@ def get_date_picker_range(f_start_date, f_end_date):
                 end_date=f_end_date,
                 disabled=True,
             ),
+            html.Div(id="data-age", className="data-age"),
         ],
         className="forecast-range",
     )
@@ -956,6 +1226,27 @@ def get_date_picker_range(f_start_date, f_end_date):
     return date_picker_range_panel
 
 
+def get_data_age(fetched_at):
+    """Get age of forecast data displayed under forecast range
+
+    Args:
+        fetched_at (float): Time data was fetched from backend API, in seconds since epoch
+
+    Returns:
+        string: Data age e.g. "Updated 5 min ago". Empty when time data was fetched is unknown, e.g. historical data.
+    """
+
+    if fetched_at is None:
+        return ""
+
+    age_minutes = max(int((time.time() - fetched_at) // 60), 0)
+    if age_minutes == 0:
+        return "Updated just now"
+    if age_minutes < 60:
+        return f"Updated {age_minutes} min ago"
+    return f"Updated {age_minutes // 60} h {age_minutes % 60} min ago"
+
+
 def get_date_picker_range_button():
     """Get date picker range button
 
@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: © 2025 National Oceanography Centre and University of Plymouth
+
+# SPDX-License-Identifier: MIT
+
+import os
+import asyncio
+import api_client
+import forecast_cache
+import metrics
+import request_coalescing
+
+PREFETCH_CONCURRENCY = 2
+PREFETCH_GENERATION_TTL = 24 * 60 * 60
+
+prefetch_state = {"pid": None, "semaphore": None, "futures": {}}
+
+
+def get_semaphore():
+    """Get semaphore bounding concurrent prefetch requests of current process. It must be called on HTTP client's event loop.
+
+    Returns:
+        Semaphore: Prefetch concurrency budget
+    """
+
+    if prefetch_state["pid"] != os.getpid():
+        prefetch_state.update(
+            pid=os.getpid(),
+            semaphore=asyncio.Semaphore(
+                api_client.get_client_setting(
+                    "PREFETCH_CONCURRENCY", PREFETCH_CONCURRENCY
+                )
+            ),
+            futures={},
+        )
+    return prefetch_state["semaphore"]
+
+
+def get_generation_key(session_id):
+    return "prefetch generation " + session_id
+
+
+def cancel(session_id):
+    """Cancel pending prefetch requests of a browser session in every process
+
+    Args:
+        session_id (string): Browser session's id
+
+    Returns:
+        integer: New prefetch generation of the session
+    """
+
+    generation = forecast_cache.get_forecast_cache().incr(
+        get_generation_key(session_id), default=0, retry=True
+    )
+    forecast_cache.get_forecast_cache().touch(
+        get_generation_key(session_id), expire=PREFETCH_GENERATION_TTL
+    )
+    future = prefetch_state["futures"].pop(session_id, None)
+    if future is not None and not future.done():
+        future.cancel()
+        metrics.increment("prefetch_batches_cancelled")
+    return generation
+
+
+def is_cancelled(session_id, generation):
+    return (
+        forecast_cache.get_forecast_cache().get(get_generation_key(session_id), 0)
+        != generation
+    )
+
+
+async def prefetch_url(session_id, generation, api_url, request_data, deadline):
+    async with get_semaphore():
+        if is_cancelled(session_id, generation):
+            return
+        if forecast_cache.is_cached(api_url):
+            return
+
+        metrics.increment("prefetch_requests")
+        # A submit of the same scenario waits for this request instead of sending its own
+        data = await request_coalescing.fetch_once(api_url, request_data, deadline)
+        if isinstance(data, dict) and not is_cancelled(session_id, generation):
+            forecast_cache.mark_prefetched(api_url)
+
+
+async def run_prefetch(session_id, generation, api_urls, request_data, deadline):
+    await asyncio.gather(
+        *[
+            prefetch_url(session_id, generation, api_url, request_data, deadline)
+            for api_url in api_urls
+        ]
+    )
+
+
+def prefetch(session_id, api_urls, request_data, deadline):
+    """Request scenarios a user is likely to submit next and cache their responses. Requests are coalesced with
+    other requests of the same scenario, so a submit arriving while a scenario is prefetched joins its request.
+    Earlier prefetch requests of the same session are cancelled.
+
+    Args:
+        session_id (string): Browser session's id
+        api_urls (list): Query urls of likely scenarios
+        request_data (coroutine function): Function sending a request to backend API, storing successful responses in
+            forecast cache and returning JSON data
+        deadline (integer): Seconds a request can take, which also bounds how long a submit of the same scenario
+            waits for it
+    """
+
+    generation = cancel(session_id)
+    future = api_client.submit(
+        run_prefetch(session_id, generation, api_urls, request_data, deadline)
+    )
+    prefetch_state["futures"][session_id] = future
+    future.add_done_callback(lambda _: forget_future(session_id, future))
+
+
+def forget_future(session_id, future):
+    if prefetch_state["futures"].get(session_id) is future:
+        del prefetch_state["futures"][session_id]
+
+
+def get_prefetch_stats():
+    """Get speculative prefetch statistics of all processes
+
+    Returns:
+        dict: Number of prefetch requests, prefetched responses used by a submit and hit rate
+    """
+
+    all_metrics = metrics.get_metrics()
+    requests = all_metrics.get("prefetch_requests", 0)
+    hits = all_metrics.get("prefetch_hits", 0)
+    return {
+        "prefetch_requests": requests,
+        "prefetch_hits": hits,
+        "prefetch_hit_rate": hits / requests if requests else 0.0,
+    }
@@ -0,0 +1,105 @@
+# SPDX-FileCopyrightText: © 2025 National Oceanography Centre and University of Plymouth
+
+# SPDX-License-Identifier: MIT
+
+import os
+import asyncio
+import diskcache
+import forecast_cache
+import metrics
+
+LOCK_CACHE_DIRECTORY = "./cache"
+LOCK_POLL_INTERVAL = 0.05
+
+coalescing_state = {"pid": None, "futures": {}, "lock_cache": None}
+
+
+def get_in_flight_requests():
+    """Get in-flight requests of current process by canonical query url
+
+    Returns:
+        dict: Futures of in-flight requests
+    """
+
+    if coalescing_state["pid"] != os.getpid():
+        coalescing_state.update(pid=os.getpid(), futures={}, lock_cache=None)
+    return coalescing_state["futures"]
+
+
+def get_lock_cache():
+    """Get disk cache shared by web server and background callback processes to hold request locks
+
+    Returns:
+        Cache: Lock cache
+    """
+
+    if coalescing_state["lock_cache"] is None:
+        coalescing_state["lock_cache"] = diskcache.Cache(LOCK_CACHE_DIRECTORY)
+    return coalescing_state["lock_cache"]
+
+
+async def fetch_once(api_url, request_data, deadline):
+    """Fetch backend API response, sharing one in-flight request per canonical query url within a process and across
+    processes
+
+    Args:
+        api_url (string): Query url to send a request to backend API
+        request_data (coroutine function): Function sending a request to backend API, storing successful responses in
+            forecast cache and returning JSON data
+        deadline (integer): Seconds a request can take, which also bounds how long other processes wait for it
+
+    Returns:
+        dict: JSON data, or error message when request failed
+    """
+
+    cache_key = forecast_cache.canonicalise_url(api_url)
+    in_flight_requests = get_in_flight_requests()
+    if cache_key in in_flight_requests:
+        metrics.increment("coalesced_requests_in_process")
+        return await asyncio.shield(in_flight_requests[cache_key])
+
+    future = asyncio.get_running_loop().create_future()
+    in_flight_requests[cache_key] = future
+    try:
+        data = await fetch_across_processes(api_url, cache_key, request_data, deadline)
+        future.set_result(data)
+        return data
+    except BaseException as e:
+        future.set_exception(e)
+        # Retrieve exception so it is not reported when no other coroutine awaits this request
+        future.exception()
+        raise
+    finally:
+        del in_flight_requests[cache_key]
+
+
+async def fetch_across_processes(api_url, cache_key, request_data, deadline):
+    """Send request to backend API unless another process is already sending it, in which case wait for its response
+
+    Args:
+        api_url (string): Query url to send a request to backend API
+        cache_key (string): Canonical query url
+        request_data (coroutine function): Function sending a request to backend API, storing successful responses in
+            forecast cache and returning JSON data
+        deadline (integer): Seconds a request can take
+
+    Returns:
+        dict: JSON data, or error message when request failed
+    """
+
+    lock_key = "request lock " + cache_key
+    loop = asyncio.get_running_loop()
+    wait_until = loop.time() + deadline
+    while not get_lock_cache().add(lock_key, os.getpid(), expire=deadline):
+        await asyncio.sleep(LOCK_POLL_INTERVAL)
+        entry = forecast_cache.get_forecast_cache().get(cache_key)
+        if entry is not None and not forecast_cache.is_stale(entry["fetched_at"]):
+            metrics.increment("coalesced_requests_cross_process")
+            return entry["data"]
+        if loop.time() > wait_until:
+            return f"Error: Request to {api_url} exceeded {deadline} seconds deadline"
+
+    try:
+        return await request_data(api_url)
+    finally:
+        get_lock_cache().delete(lock_key)
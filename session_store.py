@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: © 2025 National Oceanography Centre and University of Plymouth
+
+# SPDX-License-Identifier: MIT
+
+import os
+import uuid
+import diskcache
+import time_series
+
+SESSION_STORE_DIRECTORY = "./cache_sessions"
+SESSION_STORE_SIZE_LIMIT = 512 * 1024 * 1024
+SESSION_STORE_TTL = 24 * 60 * 60
+
+store_state = {"cache": None}
+
+
+def get_session_store():
+    """Get server-side store of session time series. Least recently used time series are evicted when store exceeds its size limit.
+
+    Returns:
+        Cache: Session store
+    """
+
+    if store_state["cache"] is None:
+        store_state["cache"] = diskcache.Cache(
+            SESSION_STORE_DIRECTORY,
+            size_limit=int(
+                os.environ.get("SESSION_STORE_SIZE_LIMIT", SESSION_STORE_SIZE_LIMIT)
+            ),
+            eviction_policy="least-recently-used",
+        )
+    return store_state["cache"]
+
+
+def save_series(*series, replaced_keys=()):
+    """Save time series on server. Browser only keeps the returned keys in dcc.Store components.
+
+    Args:
+        series (TimeSeries): Time series to save
+        replaced_keys (tuple): Keys of time series replaced by the saved ones, which are deleted
+
+    Returns:
+        Tuple: Opaque key of each time series
+    """
+
+    session_store = get_session_store()
+    expire = int(os.environ.get("SESSION_STORE_TTL", SESSION_STORE_TTL))
+    keys = tuple(uuid.uuid4().hex for _ in series)
+    with session_store.transact():
+        for replaced_key in replaced_keys:
+            if replaced_key is not None:
+                session_store.delete(replaced_key)
+        for key, saved_series in zip(keys, series):
+            session_store.set(key, saved_series, expire=expire)
+
+    return keys
+
+
+def load_series(*keys):
+    """Load time series saved on server
+
+    Args:
+        keys (string): Keys returned by save_series
+
+    Returns:
+        Tuple: Time series of each key. Empty time series when key is missing, has expired or was saved in another
+        format by an earlier version.
+    """
+
+    session_store = get_session_store()
+    loaded_series = []
+    for key in keys:
+        saved_series = None if key is None else session_store.get(key)
+        if not isinstance(saved_series, time_series.TimeSeries):
+            saved_series = time_series.TimeSeries()
+        loaded_series.append(saved_series)
+    return tuple(loaded_series)
@@ -0,0 +1,33 @@
+# SPDX-FileCopyrightText: © 2025 National Oceanography Centre and University of Plymouth
+
+# SPDX-License-Identifier: MIT
+
+import os
+import sys
+import pytest
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+os.environ.setdefault("SPLASH_ENV", "local")
+os.chdir(ROOT_DIRECTORY)
+sys.path.insert(0, ROOT_DIRECTORY)
+
+
+@pytest.fixture
+def caches(tmp_path, monkeypatch):
+    """Point forecast, lock and metrics caches to a temporary directory"""
+
+    import diskcache
+    import forecast_cache
+    import metrics
+    import request_coalescing
+
+    forecast = diskcache.Cache(str(tmp_path / "cache_forecast"))
+    locks = diskcache.Cache(str(tmp_path / "cache"))
+    counters = diskcache.Cache(str(tmp_path / "cache_metrics"))
+    monkeypatch.setitem(forecast_cache.cache_state, "cache", forecast)
+    monkeypatch.setitem(request_coalescing.coalescing_state, "lock_cache", locks)
+    monkeypatch.setattr(metrics, "metrics_cache", counters)
+    yield forecast
+    for cache in (forecast, locks, counters):
+        cache.close()
@@ -0,0 +1,133 @@
+# SPDX-FileCopyrightText: © 2025 National Oceanography Centre and University of Plymouth
+
+# SPDX-License-Identifier: MIT
+
+import time
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import api_client
+import dashboard
+import forecast_cache
+import metrics
+
+ETAG = '"tidal-levels-v1"'
+LAST_MODIFIED = "Thu, 21 Nov 2024 06:00:00 GMT"
+TIDAL_LEVELS = {
+    "tidal_levels": [
+        {"time": "Thu, 21 Nov 2024 00:00:00 GMT", "tidal_level": 1.5},
+        {"time": "Thu, 21 Nov 2024 01:00:00 GMT", "tidal_level": 2.25},
+    ]
+}
+
+
+@pytest.fixture
+def backend():
+    """Run a backend API sending ETag and Last-Modified headers, and answering 304 when If-None-Match matches.
+    Conditional headers of every request are recorded.
+    """
+
+    received_headers = []
+
+    async def get_tidal_levels(request):
+        received_headers.append(
+            {
+                name: request.headers.get(name)
+                for name in ("If-None-Match", "If-Modified-Since")
+                if name in request.headers
+            }
+        )
+        if request.headers.get("If-None-Match") == ETAG:
+            return web.Response(status=304, headers={"ETag": ETAG})
+        return web.json_response(
+            TIDAL_LEVELS, headers={"ETag": ETAG, "Last-Modified": LAST_MODIFIED}
+        )
+
+    app = web.Application()
+    app.router.add_get("/splash/dawlish/tidal-level", get_tidal_levels)
+    server = TestServer(app)
+    api_client.run(server.start_server())
+    yield {
+        "url": str(server.make_url("/splash/dawlish/tidal-level?start_date=21-11-2024")),
+        "received_headers": received_headers,
+    }
+    api_client.run(server.close())
+
+
+def test_ok_response_is_cached_with_its_validators(caches, backend):
+    data = api_client.run(dashboard.request_data(backend["url"]))
+
+    assert data["tidal_levels"]["tidal_level"].tolist() == [1.5, 2.25]
+    assert backend["received_headers"] == [{}]
+    entry = caches.get(forecast_cache.canonicalise_url(backend["url"]))
+    assert entry["data"] is not None
+    assert entry["validators"] == {
+        "If-None-Match": ETAG,
+        "If-Modified-Since": LAST_MODIFIED,
+    }
+
+
+def test_not_modified_response_reuses_cached_data(caches, backend):
+    data = api_client.run(dashboard.request_data(backend["url"]))
+    cache_key = forecast_cache.canonicalise_url(backend["url"])
+    entry = caches.get(cache_key)
+    caches.set(cache_key, dict(entry, fetched_at=entry["fetched_at"] - 60))
+
+    revalidated_data = api_client.run(dashboard.request_data(backend["url"]))
+
+    assert backend["received_headers"][1] == {
+        "If-None-Match": ETAG,
+        "If-Modified-Since": LAST_MODIFIED,
+    }
+    assert revalidated_data["tidal_levels"]["tidal_level"].tolist() == [1.5, 2.25]
+    assert (
+        revalidated_data["tidal_levels"]["time"].tolist()
+        == data["tidal_levels"]["time"].tolist()
+    )
+    assert caches.get(cache_key)["fetched_at"] > entry["fetched_at"] - 60
+    assert metrics.get_metrics()["http_not_modified"] == 1
+
+
+def test_not_modified_response_of_evicted_data_is_fetched_again(
+    caches, backend, monkeypatch
+):
+    # Cached response is evicted after its validators were read and before backend API answers 304
+    monkeypatch.setattr(
+        forecast_cache,
+        "get_cached_validators",
+        lambda api_url: {"If-None-Match": ETAG},
+    )
+
+    data = api_client.run(dashboard.request_data(backend["url"]))
+
+    assert backend["received_headers"] == [{"If-None-Match": ETAG}, {}]
+    assert data["tidal_levels"]["tidal_level"].tolist() == [1.5, 2.25]
+    assert caches.get(forecast_cache.canonicalise_url(backend["url"])) is not None
+    assert "http_not_modified" not in metrics.get_metrics()
+
+
+def test_stale_response_is_revalidated_by_forecast_refresher(
+    caches, backend, monkeypatch
+):
+    monkeypatch.setenv("FORECAST_CACHE_STALE_TTL", str(2 * 24 * 60 * 60))
+    api_client.run(dashboard.request_data(backend["url"]))
+    cache_key = forecast_cache.canonicalise_url(backend["url"])
+    last_model_run = time.time() + forecast_cache.get_seconds_to_next_model_run() - 24 * 60 * 60
+    caches.set(cache_key, dict(caches.get(cache_key), fetched_at=last_model_run - 60))
+
+    data, fetched_at = api_client.run(dashboard.fetch_timestamped_data(backend["url"]))
+
+    assert data["tidal_levels"]["tidal_level"].tolist() == [1.5, 2.25]
+    assert forecast_cache.is_stale(fetched_at)
+    assert len(backend["received_headers"]) == 1
+
+    api_url = forecast_cache.pull_refresh_request()
+    assert api_url == backend["url"]
+    api_client.run(dashboard.refresh_data(api_url))
+
+    assert backend["received_headers"][1]["If-None-Match"] == ETAG
+    assert not forecast_cache.is_stale(caches.get(cache_key)["fetched_at"])
+    all_metrics = metrics.get_metrics()
+    assert all_metrics["forecast_cache_stale_hits"] == 1
+    assert all_metrics["http_not_modified"] == 1
+    assert all_metrics["forecast_refreshes"] == 1
@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: © 2025 National Oceanography Centre and University of Plymouth
+
+# SPDX-License-Identifier: MIT
+
+import asyncio
+import time
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import api_client
+import dashboard
+import metrics
+import prefetcher
+
+TIDAL_LEVELS = {
+    "tidal_levels": [
+        {"time": "Thu, 21 Nov 2024 00:00:00 GMT", "tidal_level": 1.5},
+        {"time": "Thu, 21 Nov 2024 01:00:00 GMT", "tidal_level": 2.25},
+    ]
+}
+
+
+@pytest.fixture
+def slow_backend():
+    """Run a backend API answering after half a second. Number of received requests is recorded."""
+
+    received_requests = []
+
+    async def get_tidal_levels(request):
+        received_requests.append(request.path_qs)
+        await asyncio.sleep(0.5)
+        return web.json_response(TIDAL_LEVELS)
+
+    app = web.Application()
+    app.router.add_get("/splash/dawlish/tidal-level", get_tidal_levels)
+    server = TestServer(app)
+    api_client.run(server.start_server())
+    yield {
+        "url": str(server.make_url("/splash/dawlish/tidal-level?start_date=21-11-2024")),
+        "received_requests": received_requests,
+    }
+    api_client.run(server.close())
+
+
+def test_submit_joins_in_flight_prefetch_request(caches, slow_backend):
+    prefetcher.prefetch(
+        "session", [slow_backend["url"]], dashboard.request_data, 5
+    )
+    time.sleep(0.2)
+
+    data, fetched_at = api_client.run(
+        dashboard.fetch_timestamped_data(slow_backend["url"])
+    )
+
+    assert data["tidal_levels"]["tidal_level"].tolist() == [1.5, 2.25]
+    assert fetched_at is not None
+    assert len(slow_backend["received_requests"]) == 1
+    all_metrics = metrics.get_metrics()
+    assert all_metrics["prefetch_requests"] == 1
+    assert all_metrics["coalesced_requests_in_process"] == 1
@@ -0,0 +1,130 @@
+# SPDX-FileCopyrightText: © 2025 National Oceanography Centre and University of Plymouth
+
+# SPDX-License-Identifier: MIT
+
+import numpy as np
+
+FORECAST_STAGE = 0
+ADJUSTED_FORECAST_STAGE = 1
+UNKNOWN_STAGE = 2
+
+
+class TimeSeries:
+    """Time series of one forecast stage, e.g. Dawlish seawall crest overtopping or adjusted tidal level. Times are
+    int64 seconds since epoch, the resolution of backend API times. Values are float64 arrays by column name and stage
+    is a small integer code, so callbacks and session store handle a few arrays instead of a dataframe with a
+    repeated stage column.
+
+    Columns are read like dataframe columns: series["time"] returns a datetime64 view of times and series["tidal_level"]
+    returns values. Metadata of the request, e.g. query parameters, is kept in attrs.
+    """
+
+    __slots__ = ("times", "values", "stage", "attrs")
+
+    def __init__(self, times=None, values=None, stage=FORECAST_STAGE, attrs=None):
+        """Create time series. Without times and values, time series is empty and has no value columns.
+
+        Args:
+            times (array): Datetime64 or int64 seconds since epoch times
+            values (dict): Values of each column by column name
+            stage (integer): FORECAST_STAGE, ADJUSTED_FORECAST_STAGE or UNKNOWN_STAGE
+            attrs (dict): Metadata of the request
+        """
+
+        if times is None:
+            times = np.empty(0, dtype=np.int64)
+        self.times = np.asarray(times, dtype="datetime64[s]").view(np.int64)
+        self.values = {
+            column_name: np.asarray(column_values, dtype=np.float64)
+            for column_name, column_values in (values or {}).items()
+        }
+        self.stage = stage
+        self.attrs = {} if attrs is None else attrs
+
+    def __len__(self):
+        return len(self.times)
+
+    def __contains__(self, column_name):
+        return column_name == "time" or column_name in self.values
+
+    def __getitem__(self, column_name):
+        if column_name == "time":
+            return self.times.view("datetime64[s]")
+        return self.values[column_name]
+
+    @property
+    def empty(self):
+        """bool: True when time series has no point"""
+
+        return len(self.times) == 0
+
+    def to_dict(self):
+        """Get time series as plain lists, which can be saved as JSON. Missing values are None instead of NaN.
+
+        Returns:
+            dict: Int seconds since epoch times, values by column name, stage and attrs
+        """
+
+        return {
+            "times": self.times.tolist(),
+            "values": {
+                column_name: np.where(
+                    np.isnan(column_values), None, column_values
+                ).tolist()
+                for column_name, column_values in self.values.items()
+            },
+            "stage": self.stage,
+            "attrs": self.attrs,
+        }
+
+    @classmethod
+    def from_dict(cls, series_dict):
+        """Create time series from plain lists returned by to_dict
+
+        Args:
+            series_dict (dict): Int seconds since epoch times, values by column name, stage and attrs
+
+        Returns:
+            TimeSeries: Time series
+        """
+
+        return cls(
+            np.asarray(series_dict["times"], dtype=np.int64),
+            series_dict["values"],
+            series_dict["stage"],
+            series_dict["attrs"],
+        )
+
+    def with_stage(self, stage):
+        """Get the same points with another stage. Arrays are shared, not copied.
+
+        Args:
+            stage (integer): FORECAST_STAGE, ADJUSTED_FORECAST_STAGE or UNKNOWN_STAGE
+
+        Returns:
+            TimeSeries: Time series of given stage
+        """
+
+        return TimeSeries(self.times, self.values, stage, dict(self.attrs))
+
+    def take(self, indexer, column_names=None):
+        """Get a subset of points and columns
+
+        Args:
+            indexer (array): Boolean mask, indices or slice of points to keep
+            column_names (list): Value columns to keep. Defaults to all columns.
+
+        Returns:
+            TimeSeries: Time series of selected points, with the same stage and without attrs
+        """
+
+        if column_names is None:
+            column_names = list(self.values)
+        return TimeSeries(
+            self.times[indexer],
+            {
+                column_name: self.values[column_name][indexer]
+                for column_name in column_names
+            },
+            self.stage,
+        )
@@ -4,10 +4,35 @@
 
 import os
 import re
+import json
+import base64
 from dotenv import load_dotenv
 from urllib.parse import urlencode
 from datetime import datetime
+import numpy as np
 import pandas as pd
+import time_series
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKEND_TIME_FORMAT = "%a, %d %b %Y %H:%M:%S GMT"
+# Lists of backend API responses which dashboard derives locally, they are not decoded
+DERIVED_JSON_KEYS = ("overtopping_times",)
+# Trace arrays sent as base64 typed arrays and their plotly.js dtypes by numpy dtype
+TYPED_ARRAY_KEYS = ("x", "y")
+TYPED_ARRAY_DTYPES = {
+    "int8": "i1",
+    "uint8": "u1",
+    "int16": "i2",
+    "uint16": "u2",
+    "int32": "i4",
+    "uint32": "u4",
+    "float32": "f4",
+    "float64": "f8",
+}
 
 
 def loadConfigFile():
@@ -108,15 +133,13 @@ def format_range_date(param_date):
     """Format range date to mm-dd-yyyy
 
     Args:
-        param_date (string): String representing date
+        param_date (Timestamp): Timestamp or string representing date
 
     Returns:
         string: Formatted string representing date
     """
 
-    cur_param_date = datetime.strptime(param_date, "%Y-%m-%d %H:%M:%S")
-
-    return cur_param_date.strftime("%m-%d-%Y")
+    return pd.Timestamp(param_date).strftime("%m-%d-%Y")
 
 
 def get_dataset_params(site_location_val):
@@ -144,41 +167,252 @@ def get_dataset_params(site_location_val):
     return option, start_date
 
 
-def convert_feature_list_to_df(data_list, feature_name):
-    """Convert feature list to dataframe
+def is_figure_validation_enabled():
+    """Check if figures are validated by plotly when they are built. Validation is disabled by default, as validating
+    per-point marker arrays makes building a figure slower than the previous plotly express path. Set
+    FIGURE_VALIDATION to True to check figures while developing.
+
+    Returns:
+        bool: True when figures are validated
+    """
+
+    return os.environ.get("FIGURE_VALIDATION", "False").capitalize() == "True"
+
+
+def is_binary_figure_encoding_enabled():
+    """Check if numeric arrays of figures are sent as base64 typed arrays. Set BINARY_FIGURE_ENCODING to True to
+    enable it.
+
+    Returns:
+        bool: True when figures are encoded
+    """
+
+    return os.environ.get("BINARY_FIGURE_ENCODING", "False").capitalize() == "True"
+
+
+def encode_typed_array(values):
+    """Encode numeric array as a base64 typed array, which plotly.js decodes natively. Datetime64 arrays are encoded
+    as float64 milliseconds since epoch, plotly.js numeric dates, and invalid times become NaN.
 
     Args:
-        data_list (list): Data list
-        feature_name (string): Feature's name
+        values (array): Trace's values e.g. time or tidal_level column
 
     Returns:
-        Dataframe: Feature's dataframe
+        dict: Typed array with dtype and bdata, or values as is when they are not a numeric numpy array
     """
 
-    if not isinstance(data_list, list):
-        return None
+    if not isinstance(values, np.ndarray):
+        return values
+
+    if values.dtype.kind == "M":
+        values = np.where(
+            np.isnat(values),
+            np.nan,
+            values.astype("datetime64[ms]").astype(np.int64),
+        )
+    elif values.dtype.kind in "iu" and values.dtype.name not in TYPED_ARRAY_DTYPES:
+        values = values.astype(np.float64)
+
+    if values.dtype.name not in TYPED_ARRAY_DTYPES:
+        return values
+
+    little_endian_values = np.ascontiguousarray(
+        values, dtype=values.dtype.newbyteorder("<")
+    )
+    return {
+        "dtype": TYPED_ARRAY_DTYPES[values.dtype.name],
+        "bdata": base64.b64encode(little_endian_values.tobytes()).decode("ascii"),
+    }
+
+
+def encode_trace(trace):
+    """Encode x and y arrays of a trace when is_binary_figure_encoding_enabled is True
+
+    Args:
+        trace (dict): Trace's JSON data
+
+    Returns:
+        dict: Trace with encoded arrays, or the same trace when encoding is disabled
+    """
+
+    if not is_binary_figure_encoding_enabled():
+        return trace
+
+    return {
+        **trace,
+        **{
+            array_key: encode_typed_array(trace[array_key])
+            for array_key in TYPED_ARRAY_KEYS
+            if array_key in trace
+        },
+    }
+
+
+def encode_figure(figure):
+    """Get figure's JSON data. Numeric arrays are encoded as typed arrays when is_binary_figure_encoding_enabled is
+    True, then times are sent as numbers and x-axis type is set to date.
 
-    if not data_list:
-        return pd.DataFrame(columns=["time", feature_name])
+    Args:
+        figure (Figure): Plotly figure
+
+    Returns:
+        dict: Figure's JSON data
+    """
+
+    figure_json = figure.to_plotly_json()
+    if not is_binary_figure_encoding_enabled():
+        return figure_json
+
+    layout = figure_json["layout"]
+    if any(
+        isinstance(trace.get("x"), np.ndarray) and trace["x"].dtype.kind == "M"
+        for trace in figure_json["data"]
+    ):
+        layout = {**layout, "xaxis": {**layout.get("xaxis", {}), "type": "date"}}
+
+    return {
+        **figure_json,
+        "data": [encode_trace(trace) for trace in figure_json["data"]],
+        "layout": layout,
+    }
+
+
+def parse_time_column(time_values):
+    """Parse times returned by backend API e.g. "Thu, 21 Nov 2024 00:00:00 GMT" in one vectorised pass
+
+    Args:
+        time_values (list): Time strings
+
+    Returns:
+        Series: Datetime64 series. Invalid times are NaT. Times already parsed by convert_records_to_columns are
+        returned as is.
+    """
+
+    if isinstance(time_values, np.ndarray) and time_values.dtype.kind == "M":
+        return pd.Series(time_values)
+
+    times = pd.Series(time_values, dtype=object)
+    parsed_times = pd.to_datetime(times, format=BACKEND_TIME_FORMAT, errors="coerce")
+    for invalid_time in times[parsed_times.isna()]:
+        print(f"Warning: Invalid time format: {invalid_time}")
+
+    return parsed_times
+
+
+def decode_json(body):
+    """Decode JSON body of backend API response, with orjson when it is installed
+
+    Args:
+        body (bytes): Response body
+
+    Returns:
+        object: Decoded JSON data
+    """
+
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+def convert_number_column(records, field_name):
+    """Write a numeric field of every record straight into a float64 array, without building a list of values first
+
+    Args:
+        records (list): Records e.g. [{"time": "Thu, 21 Nov 2024 00:00:00 GMT", "tidal_level": 1.2}]
+        field_name (string): Field's name e.g. tidal_level
+
+    Returns:
+        Array: Float64 array, or an array of the field's type when values are not all numbers e.g. null values
+    """
 
     try:
-        df_data = []
-        for item in data_list:
-            try:
-                time_obj = datetime.strptime(item["time"], "%a, %d %b %Y %H:%M:%S GMT")
-                time_str = time_obj.strftime("%Y-%m-%d %H:%M:%S")
-            except ValueError:
-                print(f"Warning: Invalid time format: {item['time']}")
-                time_str = None
+        return np.fromiter(
+            (record[field_name] for record in records),
+            dtype=np.float64,
+            count=len(records),
+        )
+    except (TypeError, ValueError):
+        return np.asarray([record[field_name] for record in records])
 
-            df_data.append({"time": time_str, feature_name: item[feature_name]})
 
-        df = pd.DataFrame(df_data)
-        df = df.reset_index(drop=True)
+def convert_records_to_columns(records):
+    """Convert a list of records returned by backend API into one array per field. Times are parsed once into a
+    datetime64 array and numbers are written straight into float64 arrays.
 
-        return df
+    Args:
+        records (list): Records e.g. [{"time": "Thu, 21 Nov 2024 00:00:00 GMT", "tidal_level": 1.2}]
+
+    Returns:
+        dict: Numpy array of each field, or None if records do not share the same fields
+    """
+
+    if not records:
+        return {}
+
+    try:
+        return {
+            field_name: (
+                parse_time_column(
+                    [record[field_name] for record in records]
+                ).to_numpy()
+                if field_name == "time"
+                else convert_number_column(records, field_name)
+            )
+            for field_name in records[0]
+        }
     except (KeyError, TypeError) as e:
-        print(f"Error converting list to DataFrame: {e}")
+        print(f"Error converting list to columns: {e}")
+        return None
+
+
+def convert_json_to_columns(json_data):
+    """Convert every list of records of JSON data returned by backend API into columns e.g. seawall_crest_overtopping,
+    tidal_levels or overtopping_times. Cached responses then hold arrays instead of one dict per record.
+
+    Args:
+        json_data (dict): The JSON data as a dictionary
+
+    Returns:
+        dict: JSON data whose lists of records are replaced by columns. Lists that cannot be converted are kept and
+        lists derived locally (DERIVED_JSON_KEYS) are dropped.
+    """
+
+    if not isinstance(json_data, dict):
+        return json_data
+
+    converted_data = {}
+    for key, value in json_data.items():
+        if key in DERIVED_JSON_KEYS:
+            continue
+        columns = convert_records_to_columns(value) if isinstance(value, list) else None
+        converted_data[key] = value if columns is None else columns
+    return converted_data
+
+
+def convert_feature_data_to_series(data_columns, feature_name):
+    """Convert feature columns to time series
+
+    Args:
+        data_columns (dict): Data columns returned by get_json_columns
+        feature_name (string): Feature's name
+
+    Returns:
+        TimeSeries: Feature's time series, or None if the input columns are invalid
+    """
+
+    if not isinstance(data_columns, dict):
+        return None
+
+    if not data_columns:
+        return time_series.TimeSeries(values={feature_name: []})
+
+    try:
+        return time_series.TimeSeries(
+            parse_time_column(data_columns["time"]).to_numpy(),
+            {feature_name: data_columns[feature_name]},
+        )
+    except (KeyError, TypeError, ValueError) as e:
+        print(f"Error converting list to time series: {e}")
         return None
 
 
@@ -206,62 +440,98 @@ def convert_list_to_dataframe(json_data, list_key):
         return None
 
 
-def convert_overtopping_data_to_df(data_list):
-    """Converts a list of dictionaries to a Pandas DataFrame with a numerical index.
+def get_json_columns(json_data, list_key):
+    """Get columns of a list from JSON data returned by backend API
+
+    Args:
+        json_data (dict): The JSON data as a dictionary, or an error message when the request failed.
+        list_key (str): The key of the list within the JSON data.
+
+    Returns:
+        dict: Numpy array of each field, or an empty dict if the request failed or the key is missing. None if the
+        list cannot be converted.
+    """
+
+    if not isinstance(json_data, dict):
+        print(f"Warning: No data for '{list_key}': {json_data}")
+        return {}
+
+    if list_key not in json_data:
+        print(f"Warning: Key '{list_key}' not found in JSON data.")
+        return {}
+
+    if isinstance(json_data[list_key], list):
+        return convert_records_to_columns(json_data[list_key])
+    return json_data[list_key]
+
+
+def convert_overtopping_data_to_series(data_columns):
+    """Converts overtopping columns to a time series with overtopping_count and confidence columns.
 
     Args:
-        data_list: A list of dictionaries.
+        data_columns: Data columns returned by get_json_columns.
 
     Returns:
-       Dataframe: A Pandas DataFrame with a numerical index starting from 0, or None if the
-       input list is invalid. Handles potential errors in time string parsing.
+       TimeSeries: Overtopping time series, or None if the input columns are invalid. Handles potential
+       errors in time string parsing.
     """
 
-    if not isinstance(data_list, list):
+    if not isinstance(data_columns, dict):
         return None
 
-    if not data_list:
-        return pd.DataFrame(columns=["time", "overtopping_count", "confidence"])
+    if not data_columns:
+        return time_series.TimeSeries(values={"overtopping_count": [], "confidence": []})
 
     try:
-        df_data = []
-        for item in data_list:
-            try:
-                time_obj = datetime.strptime(item["time"], "%a, %d %b %Y %H:%M:%S GMT")
-                time_str = time_obj.strftime("%Y-%m-%d %H:%M:%S")
-            except ValueError:
-                print(f"Warning: Invalid time format: {item['time']}")
-                time_str = None
-
-            df_data.append(
-                {
-                    "time": time_str,
-                    "overtopping_count": item["overtopping_count"],
-                    "confidence": item["confidence"],
-                }
-            )
+        return time_series.TimeSeries(
+            parse_time_column(data_columns["time"]).to_numpy(),
+            {
+                "overtopping_count": data_columns["overtopping_count"],
+                "confidence": data_columns["confidence"],
+            },
+        )
+    except (KeyError, TypeError, ValueError) as e:
+        print(f"Error converting list to time series: {e}")
+        return None
 
-        df = pd.DataFrame(df_data)
 
-        df = df.reset_index(drop=True)
+def get_overtopping_events_times(feature_series, overtopping_series, feature_name):
+    """Get feature values at times of overtopping events of any location. This replaces overtopping_times lists of
+    backend API responses, which hold the same points.
 
-        return df
-    except (KeyError, TypeError) as e:
-        print(f"Error converting list to DataFrame: {e}")
-        return None
+    Args:
+        feature_series (TimeSeries): Feature's time series
+        overtopping_series (list): Overtopping time series of each location. Missing data is None.
+        feature_name (string): Feature's name
+
+    Returns:
+        TimeSeries: Time and feature value of each overtopping event
+    """
+
+    event_times = np.concatenate(
+        [
+            location_series.times[location_series["overtopping_count"] > 0]
+            for location_series in overtopping_series
+            if location_series is not None and not location_series.empty
+        ]
+        + [np.empty(0, dtype=np.int64)]
+    )
+    return feature_series.take(
+        np.isin(feature_series.times, event_times), [feature_name]
+    )
 
 
 def get_dataframes_to_save(n_clicks, trigger_id, dfs_to_store):
     """
-    Function to retrieve and organize DataFrames.
+    Function to retrieve and organize time series.
 
     Args:
         n_clicks: Click count.
         trigger_id: Trigger ID.
-        dfs_to_store: List of DataFrames to process (should have an even length).
+        dfs_to_store: List of TimeSeries to process (should have an even length).
 
     Returns:
-        Tuple: Tuple of DataFrames (previous and current).
+        Tuple: Tuple of TimeSeries (previous and current).
     """
 
     if len(dfs_to_store) % 2 != 0:
@@ -277,16 +547,16 @@ def get_dataframes_to_save(n_clicks, trigger_id, dfs_to_store):
 
 
 def get_dataframe_to_save(n_clicks, trigger_id, generated_df, stored_current_df):
-    """Get dataframe to save
+    """Get time series to save
 
     Args:
         n_clicks (integer): Number of clicks of submit button
         trigger_id (string): Element's id which has triggered an event
-        generated_df (Dataframe): Adjusted forecast dataframe
-        stored_current_df (Dataframe): Forecast dataframe
+        generated_df (TimeSeries): Adjusted forecast time series
+        stored_current_df (TimeSeries): Forecast time series
 
     Returns:
-        Dataframes: Forecast and adjusted forecast dataframes
+        TimeSeries: Forecast and adjusted forecast time series
     """
 
     if (
@@ -295,12 +565,10 @@ def get_dataframe_to_save(n_clicks, trigger_id, generated_df, stored_current_df)
         or trigger_id is not None
         and trigger_id != "submit-button"
     ):
-        tmp_previous_df = pd.DataFrame()
+        tmp_previous_df = time_series.TimeSeries()
         tmp_current_df = generated_df
     else:
-        saved_current_df = pd.DataFrame(stored_current_df)
-        saved_current_df["stage"] = "forecast"
-        tmp_previous_df = saved_current_df
+        tmp_previous_df = stored_current_df.with_stage(time_series.FORECAST_STAGE)
         tmp_current_df = generated_df
 
     return tmp_previous_df, tmp_current_df